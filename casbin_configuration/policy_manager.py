@@ -1,19 +1,39 @@
 import logging
 import casbin
 import casbin_sqlalchemy_adapter
+from sqlalchemy import func, select
 from strenum import StrEnum
-from connection import get_db_uri
+from connection import create_db_engine
+
+MODEL_PATH = "./model.conf"
+engine = None
+enforcer = None
+policy_version = None
+loaded_users = set()
+
+
+def get_enforcer():
+    global engine, enforcer
+    if not enforcer:
+        engine = create_db_engine()
+        adapter = casbin_sqlalchemy_adapter.Adapter(engine, filtered=True)
+        enforcer = casbin.Enforcer(MODEL_PATH, adapter)
+    return enforcer
+
+
+def get_policy_version() -> tuple:
+    rule = casbin_sqlalchemy_adapter.CasbinRule
+    with engine.connect() as connection:
+        version = connection.execute(select(func.count(rule.id), func.max(rule.id)))
+        return tuple(version.first())
 
 
 class PolicyManager:
     def __init__(self) -> None:
         self.logger = logging.getLogger()
         self.logger.setLevel(logging.INFO)
-        self.db_uri = get_db_uri()
-        self.adapter = casbin_sqlalchemy_adapter.Adapter(self.db_uri)
-
-        casbin_sqlalchemy_adapter.CasbinRule
-        self.e = casbin.Enforcer("./model.conf", self.adapter)
+        self.e = get_enforcer()
+        self.is_version_checked = False
 
     class ObjectType(StrEnum):
         COMPANY = "Company"
@@ -25,12 +45,36 @@ class PolicyManager:
         WRITE = "write"
         DELETE = "delete"
 
+    def get_policy_version(self) -> tuple:
+        return get_policy_version()
+
+    def __check_policy_version(self) -> None:
+        global policy_version
+        version = get_policy_version()
+        if version != policy_version:
+            self.e.clear_policy()
+            loaded_users.clear()
+            policy_version = version
+        self.is_version_checked = True
+
+    def __load_user_policies(self, user_id: str) -> None:
+        if not self.is_version_checked:
+            self.__check_policy_version()
+        if user_id not in loaded_users:
+            policy_filter = casbin_sqlalchemy_adapter.adapter.Filter()
+            policy_filter.ptype = ["p"]
+            policy_filter.v0 = [user_id]
+            self.e.load_increment_filtered_policy(policy_filter)
+            loaded_users.add(user_id)
+
     def verify_access(
         self, user_id: str, object_id: str, action: ActionType, type: ObjectType
     ) -> bool:
+        self.__load_user_policies(user_id)
         return True if self.e.enforce(user_id, object_id, action, type) else False
 
     def get_permissions(self, user_id: str) -> list:
+        self.__load_user_policies(user_id)
         return self.e.get_permissions_for_user(user_id)
 
     def get_permissions_by_type(self, user_id: str, type: ObjectType) -> list:
@@ -45,15 +89,21 @@ class PolicyManager:
     def add_policy(
         self, user_id: str, object_id: str, action: ActionType, type: ObjectType
     ) -> bool:
+        self.__load_user_policies(user_id)
         return self.e.add_policy(user_id, object_id, action, type)
 
     def add_policies(self, rules: list) -> bool:
+        for rule in rules:
+            self.__load_user_policies(rule[0])
         return self.e.add_policies(rules)
 
     def remove_policy(
         self, user_id: str, object_id: str, action: ActionType, type: ObjectType
     ) -> bool:
+        self.__load_user_policies(user_id)
         return self.e.remove_policy(user_id, object_id, action, type)
 
     def remove_policies(self, rules: list) -> bool:
+        for rule in rules:
+            self.__load_user_policies(rule[0])
         return self.e.remove_policies(rules)
@@ -0,0 +1,32 @@
+"""add_updated_at_in_value_range_table
+
+Revision ID: 5b3e91c0d7a2
+Revises: ebd63e486d09
+Create Date: 2026-10-18 20:58:12.418309
+
+"""
+from utils.connection import create_db_engine, create_db_session
+
+# revision identifiers, used by Alembic.
+revision = "5b3e91c0d7a2"
+down_revision = "ebd63e486d09"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    engine = create_db_engine()
+    session = create_db_session(engine)
+
+    query = """
+            ALTER TABLE value_range
+            ADD COLUMN IF NOT EXISTS updated_at TIMESTAMP NOT NULL DEFAULT now();
+        """
+
+    session.execute(query)
+    session.commit()
+    pass
+
+
+def downgrade():
+    pass
@@ -0,0 +1,37 @@
+"""create_data_version_table
+
+Revision ID: 8c4f2d6a91e3
+Revises: 5b3e91c0d7a2
+Create Date: 2026-10-18 22:14:37.512904
+
+"""
+from utils.connection import create_db_engine, create_db_session
+
+
+# revision identifiers, used by Alembic.
+revision = "8c4f2d6a91e3"
+down_revision = "5b3e91c0d7a2"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    engine = create_db_engine()
+    session = create_db_session(engine)
+
+    query = """
+    CREATE TABLE IF NOT EXISTS data_version (
+        name TEXT PRIMARY KEY,
+        version BIGINT NOT NULL DEFAULT 0
+    );
+    INSERT INTO data_version (name, version)
+    VALUES ('metric_records', 0)
+    ON CONFLICT (name) DO NOTHING;
+    """
+
+    session.execute(query)
+    session.commit()
+
+
+def downgrade():
+    pass
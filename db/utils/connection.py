@@ -1,9 +1,30 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import create_engine, event
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.orm import sessionmaker, Session as BaseSession
+from sqlalchemy.pool import NullPool
+from functools import partial
+import json
+import logging
 import os
 
 
 session = None
+logger = logging.getLogger()
+
+
+class RecyclingSession(BaseSession):
+    """
+    Session shared by every repository of a handler. A failed statement leaves
+    the transaction aborted, so roll it back to give the connection back to
+    the pool (invalidated if it was dropped) and keep the next request working.
+    """
+
+    def execute(self, *args, **kwargs):
+        try:
+            return super().execute(*args, **kwargs)
+        except DBAPIError:
+            self.rollback()
+            raise
 
 
 def get_db_uri():
@@ -21,14 +42,69 @@ def get_db_uri():
     )
 
 
+def is_proxy_mode() -> bool:
+    return os.environ.get("DB_PROXY_MODE", "false").lower() == "true"
+
+
+def get_connect_args(proxy_mode: bool) -> dict:
+    connect_args = {
+        "connect_timeout": int(os.environ.get("DB_CONNECT_TIMEOUT", 5)),
+        "keepalives": 1,
+        "keepalives_idle": int(os.environ.get("DB_KEEPALIVES_IDLE", 30)),
+        "keepalives_interval": int(os.environ.get("DB_KEEPALIVES_INTERVAL", 10)),
+        "keepalives_count": int(os.environ.get("DB_KEEPALIVES_COUNT", 5)),
+    }
+    # RDS Proxy and PgBouncer reject or pin on startup options, there the
+    # statement timeout has to be set on the database role instead. Migrations
+    # share this engine, so the timeout is only set where the Lambdas ask for it
+    statement_timeout = os.environ.get("DB_STATEMENT_TIMEOUT")
+    if statement_timeout and not proxy_mode:
+        connect_args["options"] = f"-c statement_timeout={int(statement_timeout)}"
+    return connect_args
+
+
+def get_pool_args(proxy_mode: bool) -> dict:
+    if proxy_mode:
+        return {"poolclass": NullPool}
+    return {
+        "pool_size": int(os.environ.get("DB_POOL_SIZE", 1)),
+        "max_overflow": int(os.environ.get("DB_MAX_OVERFLOW", 2)),
+        "pool_timeout": int(os.environ.get("DB_POOL_TIMEOUT", 10)),
+        "pool_recycle": int(os.environ.get("DB_POOL_RECYCLE", 300)),
+        "pool_pre_ping": True,
+    }
+
+
 def create_db_engine():
     db_uri = get_db_uri()
-    return create_engine(db_uri)
+    proxy_mode = is_proxy_mode()
+    engine = create_engine(
+        db_uri,
+        connect_args=get_connect_args(proxy_mode),
+        **get_pool_args(proxy_mode),
+    )
+    event.listen(engine, "checkout", partial(log_pool_metrics, engine, "checkout"))
+    return engine
 
 
 def create_db_session(engine):
     global session
     if not session:
-        Session = sessionmaker(bind=engine)
+        Session = sessionmaker(bind=engine, class_=RecyclingSession)
         session = Session()
     return session
+
+
+def get_pool_metrics(engine) -> dict:
+    pool = engine.pool
+    metrics = {"pool": type(pool).__name__}
+    for metric in ["size", "checkedin", "checkedout", "overflow"]:
+        get_metric = getattr(pool, metric, None)
+        if get_metric:
+            metrics[metric] = get_metric()
+    return metrics
+
+
+def log_pool_metrics(engine, pool_event: str, *_) -> None:
+    metrics = get_pool_metrics(engine)
+    logger.info(json.dumps({"db_pool_event": pool_event, **metrics}))
@@ -0,0 +1,416 @@
+"""
+Spark-free parsing of the CSV upload format shared by the Glue job
+(kpinetwork_analizer.py) and the local engine (local_ingestion.py).
+
+Files have a scenario header row, a metric row, a year row and a period row,
+followed by one row per company. Company rows are read one at a time and turned
+into batches of table rows. New rows are written to Postgres with COPY, updates
+are staged with COPY and applied with INSERT ... ON CONFLICT DO UPDATE. Each
+batch bumps the metric_records version in data_version so the report Lambdas
+drop their cached records once the load commits.
+"""
+
+import io
+import csv
+import uuid
+import logging
+
+logger = logging.getLogger("logger")
+
+DEFAULT_BATCH_SIZE = 500
+NULL_VALUE = "\\N"
+METRIC_RECORDS_VERSION = "metric_records"
+
+periods = {
+    "Q1": {"start_at": "01-01", "end_at": "03-31"},
+    "Q2": {"start_at": "04-01", "end_at": "06-30"},
+    "Q3": {"start_at": "07-01", "end_at": "09-30"},
+    "Q4": {"start_at": "10-01", "end_at": "12-31"},
+    "Full-year": {"start_at": "01-01", "end_at": "12-31"},
+}
+
+tables_columns = {
+    "company": ["id", "name", "sector", "vertical", "inves_profile_name", "is_public"],
+    "time_period": ["id", "start_at", "end_at", "period_name"],
+    "financial_scenario": ["id", "name", "currency", "type", "period_id", "company_id"],
+    "metric": ["id", "name", "value", "type", "data_type", "period_id", "company_id"],
+    "currency_metric": ["id", "currency_iso_code", "metric_id"],
+    "scenario_metric": ["id", "metric_id", "scenario_id"],
+}
+
+
+def existing_metric_from_file(
+    existing_metrics, company_id, scenario_name, metric_name, period_name
+):
+    return existing_metrics.get((company_id, scenario_name, metric_name, period_name))
+
+
+def get_index_limits(row):
+    return [i for i in range(0, len(row)) if row[i] and row[i].startswith(":")]
+
+
+def get_row_value(row, columns, column):
+    if column in columns:
+        return row[columns[column]]
+    return None
+
+
+def get_row_value_with_default(row, columns, column):
+    if column in columns:
+        return row[columns[column]]
+    return ""
+
+
+def is_valid_value(value):
+    return value is not None and value.strip()
+
+
+def get_metric_value(value):
+    try:
+        return float(value)
+    except Exception as error:
+        logger.warning(error)
+        return None
+
+
+def get_name(row, index):
+    cell = row[index]
+    return cell.split(":")[1]
+
+
+def get_limits(limits, count):
+    index_limits = []
+    for index in range(len(limits)):
+        max_index = len(limits) - 1
+        next_index = count if max_index == index else limits[index + 1]
+        index_limits.append((limits[index], next_index))
+
+    return index_limits
+
+
+def get_company_description(row, columns, existing_company_ids):
+    id_from_file = get_row_value(row, columns, "Unique ID")
+    if id_from_file in existing_company_ids:
+        company_id = id_from_file
+    else:
+        company_id = str(uuid.uuid4())
+    name = get_row_value(row, columns, "Name")
+    sector = get_row_value_with_default(row, columns, "Sector")
+    vertical = get_row_value_with_default(row, columns, "Vertical")
+    inves_profile = get_row_value(row, columns, "Investor profile")
+
+    return [
+        company_id,
+        name,
+        sector,
+        vertical,
+        inves_profile,
+        True,
+    ]
+
+
+def get_time_period(start, end, period_name):
+    return [str(uuid.uuid4()), start, end, period_name]
+
+
+def get_scenario(name, scenario_type, period, company):
+    return [str(uuid.uuid4()), name, "USD", scenario_type, period, company]
+
+
+def get_metric(name, value, period, company):
+    return [str(uuid.uuid4()), name, value, "standard", "currency", period, company]
+
+
+def get_existing_metric(row, name, value, company):
+    return [
+        str(row.id),
+        name,
+        value,
+        "standard",
+        "currency",
+        str(row.period_id),
+        company,
+    ]
+
+
+def get_time_period_str(year, period_name):
+    period_range = periods.get(period_name)
+    start = "{}-{}".format(year, period_range.get("start_at"))
+    end = "{}-{}".format(year, period_range.get("end_at"))
+    return (start, end)
+
+
+def get_scenario_data(year, scenario_type, company, scenarios, periods, period_name):
+
+    scenario_name = "{}-{}".format(scenario_type, year)
+    start_time, end_time = get_time_period_str(year, period_name)
+
+    time_period = get_time_period(start_time, end_time, period_name)
+    periods.append(time_period)
+
+    scenario = get_scenario(scenario_name, scenario_type, time_period[0], company[0])
+    scenarios.append(scenario)
+
+    return (time_period, scenario)
+
+
+def get_metric_data(metric_name, period_id, scenario_id, company_id, value):
+    metric = get_metric(metric_name, value, period_id, company_id)
+
+    currency_metric = [str(uuid.uuid4()), "USD", metric[0]]
+
+    scenario_metric = [str(uuid.uuid4()), metric[0], scenario_id]
+
+    return (metric, currency_metric, scenario_metric)
+
+
+def get_financial_data(
+    row,
+    year_limits,
+    scenarios_index,
+    metrics_index,
+    header,
+    years_row,
+    periods_row,
+    metric_row,
+    company,
+    existing_metrics,
+):
+
+    periods, scenarios, scenario_metrics, currencies = [], [], [], []
+    new_metrics, existing = [], []
+    scenario_type = ""
+    for year_limit in year_limits:
+        start_year, end_year = year_limit
+        year = get_name(years_row, start_year)
+        if start_year in scenarios_index:
+            scenario_type = get_name(header, start_year)
+        if start_year in metrics_index:
+            metric_name = get_name(metric_row, start_year)
+
+        for index in range(start_year, end_year):
+            metric_value = row[index]
+            period_name = periods_row[index]
+            value = None
+            if is_valid_value(metric_value):
+                value = get_metric_value(metric_value)
+
+            if value is not None:
+                metric_and_year = scenario_type + "-" + year
+                metric_exists = existing_metric_from_file(
+                    existing_metrics,
+                    company[0],
+                    metric_and_year,
+                    metric_name,
+                    period_name,
+                )
+
+                if metric_exists is None:
+                    time_period, scenario = get_scenario_data(
+                        year, scenario_type, company, scenarios, periods, period_name
+                    )
+
+                    metric, currency, scenario_metric = get_metric_data(
+                        metric_name, time_period[0], scenario[0], company[0], value
+                    )
+                    new_metrics.append(metric)
+                    currencies.append(currency)
+                    scenario_metrics.append(scenario_metric)
+                else:
+                    existing.append(
+                        get_existing_metric(
+                            metric_exists, metric_name, value, company[0]
+                        )
+                    )
+
+    return (periods, scenarios, new_metrics, existing, scenario_metrics, currencies)
+
+
+def get_company_financial_data(row, layout, company, existing_metrics):
+    (
+        columns,
+        year_limits,
+        scenarios_index,
+        metrics_index,
+        headers,
+        years_row,
+        periods_row,
+        metric_row,
+    ) = layout
+
+    return get_financial_data(
+        row,
+        year_limits,
+        scenarios_index,
+        metrics_index,
+        headers,
+        years_row,
+        periods_row,
+        metric_row,
+        company,
+        existing_metrics,
+    )
+
+
+def get_file_layout(headers, rows):
+    metric_row = next(rows)
+    years_row = next(rows)
+    periods_row = next(rows)
+
+    columns = {column: index for index, column in enumerate(headers)}
+    year_limits = get_limits(get_index_limits(years_row), len(headers))
+    scenarios_index = set(get_index_limits(headers))
+    metrics_index = set(get_index_limits(metric_row))
+
+    return (
+        columns,
+        year_limits,
+        scenarios_index,
+        metrics_index,
+        headers,
+        years_row,
+        periods_row,
+        metric_row,
+    )
+
+
+def get_empty_batch():
+    batch = {table: [] for table in tables_columns}
+    batch.update({"company_updates": [], "metric_updates": []})
+    return batch
+
+
+def get_company_rows(rows, columns_count, existing_company_ids, batch_size):
+    company_rows = []
+    for row in rows:
+        if not row:
+            continue
+        row = list(row)
+        row.extend([""] * (columns_count - len(row)))
+        company_id = row[0]
+        is_new = not is_valid_value(company_id)
+        if is_new or company_id in existing_company_ids:
+            company_rows.append((row, is_new))
+        if len(company_rows) == batch_size:
+            yield company_rows
+            company_rows = []
+
+    if company_rows:
+        yield company_rows
+
+
+def get_batch(company_rows, layout, existing_company_ids, existing_metrics):
+    columns = layout[0]
+    batch = get_empty_batch()
+
+    for row, is_new in company_rows:
+        company = get_company_description(row, columns, existing_company_ids)
+        (
+            _periods,
+            _scenarios,
+            _metrics,
+            _existing_metrics,
+            _scenario_metrics,
+            _currencies,
+        ) = get_company_financial_data(
+            row, layout, company, dict() if is_new else existing_metrics
+        )
+
+        batch["company" if is_new else "company_updates"].append(company)
+        batch["time_period"].extend(_periods)
+        batch["financial_scenario"].extend(_scenarios)
+        batch["metric"].extend(_metrics)
+        batch["metric_updates"].extend(_existing_metrics)
+        batch["scenario_metric"].extend(_scenario_metrics)
+        batch["currency_metric"].extend(_currencies)
+
+    return batch
+
+
+def get_batches(
+    headers,
+    rows,
+    existing_company_ids,
+    get_existing_metrics,
+    batch_size=DEFAULT_BATCH_SIZE,
+):
+    layout = get_file_layout(headers, rows)
+
+    for company_rows in get_company_rows(
+        rows, len(headers), existing_company_ids, batch_size
+    ):
+        company_ids = [row[0] for row, is_new in company_rows if not is_new]
+        existing_metrics = get_existing_metrics(company_ids)
+        yield get_batch(company_rows, layout, existing_company_ids, existing_metrics)
+
+
+def get_copy_buffer(rows):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerows(
+        [[NULL_VALUE if value is None else value for value in row] for row in rows]
+    )
+    buffer.seek(0)
+    return buffer
+
+
+def copy_rows(cursor, table, columns, rows):
+    if not rows:
+        return
+
+    query = "COPY {} ({}) FROM STDIN WITH (FORMAT csv, NULL '{}')".format(
+        table, ", ".join(columns), NULL_VALUE
+    )
+    cursor.copy_expert(query, get_copy_buffer(rows))
+
+
+def stage_rows(cursor, table, columns, rows):
+    staging_table = "{}_staging".format(table)
+    cursor.execute(
+        "CREATE TEMP TABLE IF NOT EXISTS {} (LIKE {}) ON COMMIT DROP".format(
+            staging_table, table
+        )
+    )
+    cursor.execute("TRUNCATE {}".format(staging_table))
+    copy_rows(cursor, staging_table, columns, rows)
+    return staging_table
+
+
+def get_last_rows_by_id(rows):
+    return list({row[0]: row for row in rows}.values())
+
+
+def upsert_rows(cursor, table, columns, rows):
+    if not rows:
+        return
+
+    staging_table = stage_rows(cursor, table, columns, get_last_rows_by_id(rows))
+    updates = ", ".join(
+        "{column} = EXCLUDED.{column}".format(column=column)
+        for column in columns
+        if column != "id"
+    )
+    cursor.execute(
+        """
+        INSERT INTO {table} ({columns})
+        SELECT {columns} FROM {staging_table}
+        ON CONFLICT (id) DO UPDATE SET {updates}
+        """.format(
+            table=table,
+            columns=", ".join(columns),
+            staging_table=staging_table,
+            updates=updates,
+        )
+    )
+
+
+def save_batch(cursor, batch):
+    for table, columns in tables_columns.items():
+        copy_rows(cursor, table, columns, batch[table])
+
+    upsert_rows(cursor, "company", tables_columns["company"], batch["company_updates"])
+    upsert_rows(cursor, "metric", tables_columns["metric"], batch["metric_updates"])
+    cursor.execute(
+        "UPDATE data_version SET version = version + 1 WHERE name = %s",
+        (METRIC_RECORDS_VERSION,),
+    )
@@ -1,21 +1,14 @@
 import sys
-import uuid
 import json
 import logging
+import urllib.parse
 from awsglue.utils import getResolvedOptions
 from pyspark.context import SparkContext
 from awsglue.context import GlueContext
 from pyspark.sql import SparkSession
-from awsglue.dynamicframe import DynamicFrame
 import boto3
-from pyspark.sql.types import (
-    DateType,
-    StructType,
-    StructField,
-    StringType,
-    BooleanType,
-    DoubleType,
-)
+import psycopg2
+from ingestion import get_batches, save_batch
 
 logging.basicConfig()
 logger = logging.getLogger("logger")
@@ -23,73 +16,6 @@ logger.setLevel(logging.WARNING)
 glueContext = GlueContext(SparkContext.getOrCreate())
 spark = SparkSession.builder.getOrCreate()
 
-periods = {
-    "Q1": {"start_at": "01-01", "end_at": "03-31"},
-    "Q2": {"start_at": "04-01", "end_at": "06-30"},
-    "Q3": {"start_at": "07-01", "end_at": "09-30"},
-    "Q4": {"start_at": "10-01", "end_at": "12-31"},
-    "Full-year": {"start_at": "01-01", "end_at": "12-31"},
-}
-
-time_period_schema = StructType(
-    [
-        StructField("id", StringType(), False),
-        StructField("start_at", StringType(), False),
-        StructField("end_at", StringType(), False),
-        StructField("period_name", StringType(), False),
-    ]
-)
-
-scenario_schema = StructType(
-    [
-        StructField("id", StringType(), False),
-        StructField("name", StringType(), False),
-        StructField("currency", StringType(), False),
-        StructField("type", StringType(), False),
-        StructField("period_id", StringType(), False),
-        StructField("company_id", StringType(), False),
-    ]
-)
-
-metric_schema = StructType(
-    [
-        StructField("id", StringType(), False),
-        StructField("name", StringType(), False),
-        StructField("value", DoubleType(), False),
-        StructField("type", StringType(), False),
-        StructField("data_type", StringType(), False),
-        StructField("period_id", StringType(), False),
-        StructField("company_id", StringType(), False),
-    ]
-)
-
-currency_schema = StructType(
-    [
-        StructField("id", StringType(), False),
-        StructField("currency_iso_code", StringType(), False),
-        StructField("metric_id", StringType(), False),
-    ]
-)
-
-scenario_metric_schema = StructType(
-    [
-        StructField("id", StringType(), False),
-        StructField("metric_id", StringType(), False),
-        StructField("scenario_id", StringType(), False),
-    ]
-)
-
-company_schema = StructType(
-    [
-        StructField("id", StringType(), False),
-        StructField("name", StringType(), False),
-        StructField("sector", StringType(), False),
-        StructField("vertical", StringType(), True),
-        StructField("inves_profile_name", StringType(), True),
-        StructField("is_public", BooleanType(), False),
-    ]
-)
-
 
 def existing_ids_from_database(env, db_table):
     database = "kpinetworkdb"
@@ -136,587 +62,75 @@ def create_temp_table(dynamic_frame, table_name):
     return dynamic_frame.toDF().createOrReplaceTempView(table_name)
 
 
-def existing_metric_from_file(env, company_id, scenario_name, metric_name, period_name):
-    resultant_metric_id = None
+def get_existing_metrics_dataframe(env):
     database = "kpinetworkdb"
     if env == "demo":
         database = "demokpinetworkdb"
 
-    dynamic_scenario_frame = read_table_from_database(
-        env, database, "financial_scenario"
-    )
-    dynamic_scenario_frame = create_temp_table(
-        dynamic_scenario_frame, "financial_scenario_table"
-    )
-    dynamic_t_frame = read_table_from_database(env, database, "time_period")
-    dynamic_t_frame = create_temp_table(dynamic_t_frame, "time_period_table")
-    scenario_dataframe = spark.sql(
+    for db_table in ["financial_scenario", "time_period", "scenario_metric", "metric"]:
+        dynamic_frame = read_table_from_database(env, database, db_table)
+        create_temp_table(dynamic_frame, "{}_table".format(db_table))
+
+    metrics_dataframe = spark.sql(
         """
-        SELECT financial_scenario_table.id FROM financial_scenario_table
+        SELECT financial_scenario_table.company_id, financial_scenario_table.name AS scenario_name,
+        metric_table.name AS metric_name, time_period_table.period_name,
+        metric_table.id, metric_table.period_id
+        FROM financial_scenario_table
         JOIN time_period_table ON time_period_table.id = financial_scenario_table.period_id
-        WHERE financial_scenario_table.company_id = '{}' AND financial_scenario_table.name = '{}'
-        AND time_period_table.period_name = '{}'
-        """.format(
-            company_id, scenario_name, period_name
-        )
-    )
-    result_scenario_dataframe = scenario_dataframe.collect()
-    scenario_ids = [row.id for row in result_scenario_dataframe]
-
-    if not scenario_ids:
-        return resultant_metric_id
-
-    financial_scenario_id = scenario_ids[0]
-    dynamic_sm_frame = read_table_from_database(env, database, "scenario_metric")
-    dynamic_sm_frame = create_temp_table(dynamic_sm_frame, "scenario_metric_table")
-    sm_dataframe = spark.sql(
-        "SELECT metric_id FROM scenario_metric_table WHERE scenario_id = '{}'".format(
-            financial_scenario_id
-        )
+        JOIN scenario_metric_table
+        ON scenario_metric_table.scenario_id = financial_scenario_table.id
+        JOIN metric_table ON metric_table.id = scenario_metric_table.metric_id
+        JOIN time_period_table AS metric_period_table
+        ON metric_period_table.id = metric_table.period_id
+        AND metric_period_table.period_name = time_period_table.period_name
+        """
     )
-    result_sm_dataframe = sm_dataframe.collect()
-    sm_ids = [row.metric_id for row in result_sm_dataframe]
-
-    if not sm_ids:
-        return resultant_metric_id
-
-    sc_metric_ids = sm_ids
-    for sc_metric_id in sc_metric_ids:
-        metric_id = sc_metric_id
-        dynamic_m_frame = read_table_from_database(env, database, "metric")
-        dynamic_m_frame = create_temp_table(dynamic_m_frame, "metric_table")
-        metrics_dataframe = spark.sql(
-            """
-            SELECT * FROM metric_table
-            JOIN time_period_table ON time_period_table.id = metric_table.period_id
-            WHERE metric_table.id = '{}' AND metric_table.name = '{}'
-            AND time_period_table.period_name = '{}'
-            """.format(
-                metric_id, metric_name, period_name
-            )
-        )
-        result_metrics_dataframe = metrics_dataframe.collect()
-        metrics_ids = [row for row in result_metrics_dataframe]
-
-        if metrics_ids:
-            resultant_metric_id = metrics_ids
-            break
-
-    return resultant_metric_id
-
-
-def validate_existing_metric_from_dataframe(env, metric_id):
-    result = False
-    database = "kpinetworkdb"
-    if env == "demo":
-        database = "demokpinetworkdb"
+    return metrics_dataframe.cache()
 
-    dynamic_metrics_frame = read_table_from_database(env, database, "metric")
-    dynamic_metrics_frame = create_temp_table(dynamic_metrics_frame, "metric_table")
-    metrics_dataframe = spark.sql(
-        "SELECT * FROM metric_table WHERE id = '{}'".format(metric_id)
+
+def get_existing_metrics_lookup(existing_metrics_dataframe, company_ids):
+    existing_metrics = dict()
+    if not company_ids:
+        return existing_metrics
+
+    metrics_dataframe = existing_metrics_dataframe.filter(
+        existing_metrics_dataframe.company_id.isin(company_ids)
     )
-    result_metrics_dataframe = metrics_dataframe.collect()
-    if result_metrics_dataframe:
-        result = True
 
-    return result
+    for row in metrics_dataframe.collect():
+        key = (row.company_id, row.scenario_name, row.metric_name, row.period_name)
+        existing_metrics.setdefault(key, row)
 
+    return existing_metrics
 
-def save_to_database(env, db_table, dataframe):
+
+def get_database_connection(env):
     database = "kpinetworkdb"
     if env == "demo":
         database = "demokpinetworkdb"
 
-    logger.warning("==========Save in Database===============================")
-    logger.warning("env: {} database: {} db_table: {}".format(env, database, db_table))
-
-    dynamic_frame = DynamicFrame.fromDF(dataframe, glueContext, db_table)
-    glueContext.write_dynamic_frame.from_jdbc_conf(
-        dynamic_frame,
-        catalog_connection="{}_connection".format(env),
-        connection_options={"dbtable": db_table, "database": database},
+    ctg_connection = "{}_connection".format(env)
+    catalog_connection = glueContext.extract_jdbc_conf(ctg_connection)
+    url = urllib.parse.urlparse(catalog_connection["url"].replace("jdbc:", "", 1))
+
+    return psycopg2.connect(
+        host=url.hostname,
+        port=url.port or 5432,
+        user=catalog_connection["user"],
+        password=catalog_connection["password"],
+        dbname=database,
     )
 
 
 def get_data_from_dataframe(dataframe):
     headers = dataframe.columns
-    data = dataframe.collect()
-    return (headers, data)
-
-
-def get_index_limits(row):
-    return [i for i in range(0, len(row)) if row[i] and row[i].startswith(":")]
-
-
-def get_row_value(row, column):
-    if column in row:
-        return row[column]
-    return None
-
-
-def get_row_value_with_default(row, column):
-    if column in row:
-        return row[column]
-    return ""
-
-
-def is_valid_value(value):
-    return value is not None and value.strip()
-
-
-def get_metric_value(value):
-    try:
-        return float(value)
-    except Exception as error:
-        logger.warning(error)
-        return None
-
-
-def get_name(row, index):
-    cell = row[index]
-    return cell.split(":")[1]
-
-
-def get_limits(limits, count):
-    index_limits = []
-    for index in range(len(limits)):
-        max_index = len(limits) - 1
-        next_index = count if max_index == index else limits[index + 1]
-        index_limits.append((limits[index], next_index))
-
-    return index_limits
-
-
-def get_company_description(row, env):
-    existing_ids = existing_ids_from_database(env, "company")
-    id_from_file = get_row_value(row, "Unique ID")
-    if id_from_file in existing_ids:
-        company_id = id_from_file
-    else:
-        company_id = str(uuid.uuid4())
-    name = get_row_value(row, "Name")
-    sector = get_row_value_with_default(row, "Sector")
-    vertical = get_row_value_with_default(row, "Vertical")
-    inves_profile = get_row_value(row, "Investor profile")
-
-    return [
-        company_id,
-        name,
-        sector,
-        vertical,
-        inves_profile,
-        True,
-    ]
-
-
-def get_time_period(start, end, period_name):
-    return [str(uuid.uuid4()), start, end, period_name]
-
-
-def get_scenario(name, scenario_type, period, company):
-    return [str(uuid.uuid4()), name, "USD", scenario_type, period, company]
+    rows = dataframe.toLocalIterator()
+    return (headers, rows)
 
 
-def get_metric(name, value, period, company):
-    return [str(uuid.uuid4()), name, value, "standard", "currency", period, company]
-
-
-def get_existing_metric(row, name, value, company):
-    return [
-        str(row[0].id),
-        name,
-        value,
-        "standard",
-        "currency",
-        str(row[0].period_id),
-        company,
-    ]
-
-
-def get_time_period_str(year, period_name):
-    period_range = periods.get(period_name)
-    start = "{}-{}".format(year, period_range.get("start_at"))
-    end = "{}-{}".format(year, period_range.get("end_at"))
-    return (start, end)
-
-
-def get_scenario_data(year, scenario_type, company, scenarios, periods, period_name):
-
-    scenario_name = "{}-{}".format(scenario_type, year)
-    start_time, end_time = get_time_period_str(year, period_name)
-    time_period = []
-    scenario = []
-
-    time_period = get_time_period(start_time, end_time, period_name)
-    periods.append(time_period)
-
-    scenario = get_scenario(scenario_name, scenario_type, time_period[0], company[0])
-    scenarios.append(scenario)
-
-    return (time_period, scenario)
-
-
-def get_metric_data(metric_name, period_id, scenario_id, company_id, value):
-    metric = get_metric(metric_name, value, period_id, company_id)
-
-    currency_metric = [str(uuid.uuid4()), "USD", metric[0]]
-
-    scenario_metric = [str(uuid.uuid4()), metric[0], scenario_id]
-
-    return (metric, currency_metric, scenario_metric)
-
-
-def get_updating_metric_data(row, metric_name, company_id, value):
-    metric = get_existing_metric(row, metric_name, value, company_id)
-    return metric
-
-
-def get_financial_data(
-    row,
-    year_limits,
-    scenarios_index,
-    metrics_index,
-    header,
-    years_row,
-    periods_row,
-    metric_row,
-    company,
-    env,
-):
-
-    periods, scenarios, metrics, scenario_metrics, currencies = [], [], [], [], []
-    scenario_type = ""
-    for year_limit in year_limits:
-        start_year, end_year = year_limit
-        year = get_name(years_row, start_year)
-        if start_year in scenarios_index:
-            scenario_type = get_name(header, start_year)
-        if start_year in metrics_index:
-            metric_name = get_name(metric_row, start_year)
-
-        for index in range(start_year, end_year):
-            metric_value = row[index]
-            period_name = periods_row[index]
-            value = get_metric_value(metric_value)
-
-            if is_valid_value(metric_value) and value is not None:
-                metric_and_year = scenario_type + "-" + year
-                metric_exists = existing_metric_from_file(
-                    env, company[0], metric_and_year, metric_name, period_name
-                )
-
-                if metric_exists is None:
-                    time_period, scenario = get_scenario_data(
-                        year, scenario_type, company, scenarios, periods, period_name
-                    )
-
-                    metric, currency, scenario_metric = get_metric_data(
-                        metric_name, time_period[0], scenario[0], company[0], value
-                    )
-                    metrics.append(metric)
-                    currencies.append(currency)
-                    scenario_metrics.append(scenario_metric)
-                else:
-                    metric = get_updating_metric_data(
-                        metric_exists, metric_name, company[0], value
-                    )
-                    metrics.append(metric)
-
-    return (periods, scenarios, metrics, scenario_metrics, currencies)
-
-
-def get_company_financial_data(
-    row,
-    year_limits,
-    scenarios_index,
-    metrics_index,
-    header,
-    years_row,
-    periods_row,
-    metric_row,
-    env,
-):
-
-    companies = []
-
-    company = get_company_description(row, env)
-    companies.append(company)
-
-    periods, scenarios, metrics, scenario_metrics, currencies = get_financial_data(
-        row,
-        year_limits,
-        scenarios_index,
-        metrics_index,
-        header,
-        years_row,
-        periods_row,
-        metric_row,
-        company,
-        env,
-    )
-
-    return (companies, periods, scenarios, metrics, scenario_metrics, currencies)
-
-
-def get_schemas_data_from_dataframe(headers, data, env):
-    data_periods = []
-    data_metrics = []
-    data_companies = []
-    data_scenarios = []
-    data_currencies = []
-    data_scenario_metrics = []
-
-    metric_row = data[0]
-    year_row = data[1]
-    year_limits = get_limits(get_index_limits(year_row), len(headers))
-    scenarios_index = get_index_limits(headers)
-    metrics_index = get_index_limits(metric_row)
-    for index in range(3, len(data)):
-        if not is_valid_value(data[index][0]):
-            (
-                _companies,
-                _periods,
-                _scenarios,
-                _metrics,
-                _scenario_metrics,
-                _currencies,
-            ) = get_company_financial_data(
-                data[index],
-                year_limits,
-                scenarios_index,
-                metrics_index,
-                headers,
-                data[1],
-                data[2],
-                metric_row,
-                env,
-            )
-            data_periods.extend(_periods)
-            data_companies.extend(_companies)
-            data_scenarios.extend(_scenarios)
-            data_metrics.extend(_metrics)
-            data_scenario_metrics.extend(_scenario_metrics)
-            data_currencies.extend(_currencies)
-
-    return (
-        data_companies,
-        data_periods,
-        data_scenarios,
-        data_metrics,
-        data_scenario_metrics,
-        data_currencies,
-    )
-
-
-def get_existing_schemas_data_from_dataframe(headers, data, env):
-    data_periods = []
-    data_metrics = []
-    data_companies = []
-    data_scenarios = []
-    data_currencies = []
-    data_scenario_metrics = []
-
-    metric_row = data[0]
-    year_row = data[1]
-    year_limits = get_limits(get_index_limits(year_row), len(headers))
-    metrics_index = get_index_limits(metric_row)
-    scenarios_index = get_index_limits(headers)
-
-    for index in range(3, len(data)):
-        ids = existing_ids_from_database(env, "company")
-        if is_valid_value(data[index][0]) and data[index][0] in ids:
-            (
-                _companies,
-                _periods,
-                _scenarios,
-                _metrics,
-                _scenario_metrics,
-                _currencies,
-            ) = get_company_financial_data(
-                data[index],
-                year_limits,
-                scenarios_index,
-                metrics_index,
-                headers,
-                year_row,
-                data[2],
-                metric_row,
-                env,
-            )
-            data_periods.extend(_periods)
-            data_companies.extend(_companies)
-            data_scenarios.extend(_scenarios)
-            data_metrics.extend(_metrics)
-            data_scenario_metrics.extend(_scenario_metrics)
-            data_currencies.extend(_currencies)
-
-    return (
-        data_companies,
-        data_periods,
-        data_scenarios,
-        data_metrics,
-        data_scenario_metrics,
-        data_currencies,
-    )
-
-
-def dataframe_cast_date_type(data_frame, columns):
-    for column in columns:
-        data_frame = data_frame.withColumn(column, data_frame[column].cast(DateType()))
-
-    return data_frame
-
-
-def get_dataframes_from_lists(data):
-    (companies, periods, scenarios, metrics, scenario_metrics, currencies) = data
-
-    df_companies = spark.createDataFrame(companies, schema=company_schema)
-    df_time_periods = spark.createDataFrame(periods, schema=time_period_schema)
-    df_time_periods = dataframe_cast_date_type(df_time_periods, ["start_at", "end_at"])
-    df_scenarios = spark.createDataFrame(scenarios, schema=scenario_schema)
-    df_metrics = spark.createDataFrame(metrics, schema=metric_schema)
-    df_currencies = spark.createDataFrame(currencies, schema=currency_schema)
-    df_scenario_metrics = spark.createDataFrame(
-        scenario_metrics, schema=scenario_metric_schema
-    )
-
-    return (
-        df_companies,
-        df_time_periods,
-        df_scenarios,
-        df_metrics,
-        df_scenario_metrics,
-        df_currencies,
-    )
-
-
-def get_updating_dataframes_from_lists(data):
-    (companies, periods, scenarios, metrics, scenario_metrics, currencies) = data
-
-    df_companies = spark.createDataFrame(companies, schema=company_schema)
-    df_time_periods = spark.createDataFrame(periods, schema=time_period_schema)
-    df_time_periods = dataframe_cast_date_type(df_time_periods, ["start_at", "end_at"])
-    df_scenarios = spark.createDataFrame(scenarios, schema=scenario_schema)
-    df_metrics = spark.createDataFrame(metrics, schema=metric_schema)
-    df_currencies = spark.createDataFrame(currencies, schema=currency_schema)
-    df_scenario_metrics = spark.createDataFrame(
-        scenario_metrics, schema=scenario_metric_schema
-    )
-
-    return (
-        df_companies,
-        df_time_periods,
-        df_scenarios,
-        df_metrics,
-        df_scenario_metrics,
-        df_currencies,
-    )
-
-
-def call_lambda_to_update(env, data):
-    name = name = "{}_update_data_lambda_function".format(env)
-    client = boto3.client("lambda")
-    body = json.dumps(data)
-    event = {"body": body}
-
-    client.invoke(FunctionName=name, Payload=json.dumps(event))
-
-
-def update_data_to_database(data, env):
-    (
-        df_companies,
-        df_time_periods,
-        df_scenarios,
-        df_metrics,
-        df_scenario_metrics,
-        df_currencies,
-    ) = get_updating_dataframes_from_lists(data)
-
-    logger.warning("==========Company===============================")
-    df_companies.show()
-    companies_updatables = df_companies.rdd.map(lambda x: x.asDict()).collect()
-
-    logger.warning("==========Existing Metrics===============================")
-    result_metrics_df = df_metrics.collect()
-
-    new_metrics = []
-    existing_metrics = []
-    for row in result_metrics_df:
-        if validate_existing_metric_from_dataframe(env, row.id):
-            existing_metrics.append(row)
-        else:
-            new_metrics.append(row)
-    df_existing_metrics = spark.createDataFrame(existing_metrics, schema=metric_schema)
-    df_new_metrics = spark.createDataFrame(new_metrics, schema=metric_schema)
-    df_existing_metrics.show()
-
-    metrics_updatables = df_existing_metrics.rdd.map(lambda x: x.asDict()).collect()
-    data_to_update = {"companies": companies_updatables, "metrics": metrics_updatables}
-    call_lambda_to_update(env, data_to_update)
-
-    if (
-        df_new_metrics.collect()
-        and df_time_periods.collect()
-        and df_scenarios.collect()
-        and df_scenario_metrics.collect()
-        and df_currencies.collect()
-    ):
-        logger.warning("==========Time Period============================")
-        df_time_periods.show()
-        save_to_database(env, "time_period", df_time_periods)
-
-        logger.warning("==========Scenario===============================")
-        df_scenarios.show()
-        save_to_database(env, "financial_scenario", df_scenarios)
-
-        logger.warning("==========New Metric===============================")
-        df_new_metrics.show()
-        save_to_database(env, "metric", df_new_metrics)
-
-        logger.warning("==========Currency==============================")
-        df_currencies.show()
-        save_to_database(env, "currency", df_currencies)
-
-        logger.warning("==========Scenario Metric========================")
-        df_scenario_metrics.show()
-        save_to_database(env, "scenario_metric", df_scenario_metrics)
-
-
-def save_data_to_database(data, env):
-
-    (
-        df_companies,
-        df_time_periods,
-        df_scenarios,
-        df_metrics,
-        df_scenario_metrics,
-        df_currencies,
-    ) = get_dataframes_from_lists(data)
-
-    logger.warning("==========Company===============================")
-    df_companies.show()
-    save_to_database(env, "company", df_companies)
-
-    logger.warning("==========Time period===========================")
-    df_time_periods.show()
-    save_to_database(env, "time_period", df_time_periods)
-
-    logger.warning("==========Financial scenario====================")
-    df_scenarios.show()
-    save_to_database(env, "financial_scenario", df_scenarios)
-
-    logger.warning("==========Metric================================")
-    df_metrics.show()
-    save_to_database(env, "metric", df_metrics)
-
-    logger.warning("==========Currency metric=======================")
-    df_currencies.show()
-    save_to_database(env, "currency_metric", df_currencies)
-
-    logger.warning("==========Scenario metric=======================")
-    df_scenario_metrics.show()
-    save_to_database(env, "scenario_metric", df_scenario_metrics)
+def get_existing_company_ids(env):
+    return set(existing_ids_from_database(env, "company"))
 
 
 def get_dataframe_from_file(file_path):
@@ -732,20 +146,33 @@ def get_dataframe_from_file(file_path):
     return file_dataframe
 
 
+def save_file_data(cursor, headers, rows, env, existing_company_ids):
+    existing_metrics_dataframe = get_existing_metrics_dataframe(env)
+
+    def get_existing_metrics(company_ids):
+        return get_existing_metrics_lookup(existing_metrics_dataframe, company_ids)
+
+    for batch in get_batches(headers, rows, existing_company_ids, get_existing_metrics):
+        logger.warning("==========File Data Batch===============================")
+        save_batch(cursor, batch)
+
+
 def proccess_file(file_path, env):
     dataframe = get_dataframe_from_file(file_path)
-    headers, data = get_data_from_dataframe(dataframe)
+    headers, rows = get_data_from_dataframe(dataframe)
 
     logger.warning("==========File Headers===============================")
     logger.warning(headers)
 
-    logger.warning("==========New File Data===============================")
-    schemas_data = get_schemas_data_from_dataframe(headers, data, env)
-    save_data_to_database(schemas_data, env)
+    existing_company_ids = get_existing_company_ids(env)
+    connection = get_database_connection(env)
 
-    logger.warning("==========existing Data===============================")
-    schemas_existing_data = get_existing_schemas_data_from_dataframe(headers, data, env)
-    update_data_to_database(schemas_existing_data, env)
+    try:
+        with connection:
+            with connection.cursor() as cursor:
+                save_file_data(cursor, headers, rows, env, existing_company_ids)
+    finally:
+        connection.close()
 
 
 def start_job(env, file_name, bucket_name):
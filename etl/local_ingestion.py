@@ -0,0 +1,105 @@
+"""
+Spark-free ingestion of the CSV upload format.
+
+Runs the parsing shared with the Glue job (ingestion.py) over a local file,
+reading it row by row, and writes every batch to Postgres with COPY.
+
+Usage:
+    python etl/local_ingestion.py <file_path> [batch_size]
+
+The database connection is taken from the DB_HOST, DB_USERNAME, DB_PASSWORD and
+DB_NAME environment variables.
+"""
+
+import os
+import csv
+import sys
+import logging
+from collections import namedtuple
+import psycopg2
+from ingestion import DEFAULT_BATCH_SIZE, get_batches, save_batch
+
+logging.basicConfig()
+logger = logging.getLogger("logger")
+logger.setLevel(logging.WARNING)
+
+ExistingMetric = namedtuple("ExistingMetric", ["id", "period_id"])
+
+
+def get_connection():
+    return psycopg2.connect(
+        host=os.environ.get("DB_HOST"),
+        user=os.environ.get("DB_USERNAME"),
+        password=os.environ.get("DB_PASSWORD"),
+        dbname=os.environ.get("DB_NAME"),
+        port="5432",
+    )
+
+
+def get_existing_company_ids(cursor):
+    cursor.execute("SELECT id FROM company")
+    return {row[0] for row in cursor.fetchall()}
+
+
+def get_existing_metrics_lookup(cursor, company_ids):
+    existing_metrics = dict()
+    if not company_ids:
+        return existing_metrics
+
+    cursor.execute(
+        """
+        SELECT financial_scenario.company_id, financial_scenario.name,
+        metric.name, time_period.period_name, metric.id, metric.period_id
+        FROM financial_scenario
+        JOIN time_period ON time_period.id = financial_scenario.period_id
+        JOIN scenario_metric ON scenario_metric.scenario_id = financial_scenario.id
+        JOIN metric ON metric.id = scenario_metric.metric_id
+        JOIN time_period AS metric_period ON metric_period.id = metric.period_id
+        AND metric_period.period_name = time_period.period_name
+        WHERE financial_scenario.company_id = ANY(%s)
+        """,
+        (list(company_ids),),
+    )
+
+    for row in cursor.fetchall():
+        company_id, scenario_name, metric_name, period_name, metric_id, period_id = row
+        key = (company_id, scenario_name, metric_name, period_name)
+        existing_metrics.setdefault(key, ExistingMetric(metric_id, period_id))
+
+    return existing_metrics
+
+
+def proccess_file(file_path, connection, batch_size=DEFAULT_BATCH_SIZE):
+    with connection:
+        with connection.cursor() as cursor:
+            existing_company_ids = get_existing_company_ids(cursor)
+
+            def get_existing_metrics(company_ids):
+                return get_existing_metrics_lookup(cursor, company_ids)
+
+            with open(file_path, newline="") as file:
+                reader = csv.reader(file)
+                for batch in get_batches(
+                    next(reader),
+                    reader,
+                    existing_company_ids,
+                    get_existing_metrics,
+                    batch_size,
+                ):
+                    save_batch(cursor, batch)
+
+
+def main():
+    file_path = sys.argv[1]
+    batch_size = int(sys.argv[2]) if len(sys.argv) > 2 else DEFAULT_BATCH_SIZE
+
+    logger.warning("file path: {}".format(file_path))
+    connection = get_connection()
+    try:
+        proccess_file(file_path, connection, batch_size)
+    finally:
+        connection.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -20,6 +20,11 @@ output "object_references" {
       key : aws_s3_bucket_object.glue_trigger_function_object.key,
       bucket : aws_s3_bucket_object.glue_trigger_function_object.bucket
     }
+    "etl_ingestion_bucket" : {
+      etag : aws_s3_bucket_object.etl_ingestion_object.etag,
+      key : aws_s3_bucket_object.etl_ingestion_object.key,
+      bucket : aws_s3_bucket_object.etl_ingestion_object.bucket
+    }
     
     "get_universe_overview_function_bucket" : {
       etag : aws_s3_bucket_object.get_universe_overview_function_object.etag,
@@ -170,12 +175,6 @@ output "object_references" {
       bucket : aws_s3_bucket_object.add_investment_function_object.bucket
     }
 
-    "update_data_function_bucket" : {
-      etag : aws_s3_bucket_object.update_data_function_object.etag,
-      key : aws_s3_bucket_object.update_data_function_object.key,
-      bucket : aws_s3_bucket_object.update_data_function_object.bucket
-    }
-
     "add_scenario_function_bucket" : {
       etag : aws_s3_bucket_object.add_scenario_function_object.etag,
       key : aws_s3_bucket_object.add_scenario_function_object.key,
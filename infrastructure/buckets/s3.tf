@@ -41,6 +41,13 @@ resource "aws_s3_bucket_object" "etl_script_object" {
   etag   = filemd5("${path.module}/../../etl/kpinetwork_analizer.py")
 }
 
+resource "aws_s3_bucket_object" "etl_ingestion_object" {
+  bucket = var.bucket_name
+  key    = "pyspark/ingestion.py"
+  source = "${path.module}/../../etl/ingestion.py"
+  etag   = filemd5("${path.module}/../../etl/ingestion.py")
+}
+
 resource "aws_s3_bucket_object" "get_universe_overview_function_object" {
   bucket = var.bucket_name
   key = "${var.lambda_resource_name}/${var.environment}/get_universe_overview_handler.zip"
@@ -217,13 +224,6 @@ resource "aws_s3_bucket_object" "add_investment_function_object" {
   etag = filemd5("${path.module}/../../dist/add_investment_handler.zip")
 }
 
-resource "aws_s3_bucket_object" "update_data_function_object" {
-  bucket = var.bucket_name
-  key = "${var.lambda_resource_name}/${var.environment}/update_data.zip"
-  source = "${path.module}/../../dist/update_data.zip"
-  etag = filemd5("${path.module}/../../dist/update_data.zip")
-}
-
 resource "aws_s3_bucket_object" "add_scenario_function_object" {
   bucket = var.bucket_name
   key = "${var.lambda_resource_name}/${var.environment}/add_scenario_handler.zip"
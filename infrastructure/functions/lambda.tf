@@ -33,13 +33,14 @@ resource "aws_lambda_function" "get_company_details_lambda_function" {
 
   environment {
     variables = {
-      ACCESS_KEY   = var.aws_access_key_id
-      SECRET_KEY   = var.aws_secret_access_key
-      USER_POOL_ID = var.user_pool_id
-      DB_HOST      = var.db_host
-      DB_NAME      = var.db_name
-      DB_USERNAME  = var.db_username
-      DB_PASSWORD  = var.db_password
+      ACCESS_KEY           = var.aws_access_key_id
+      SECRET_KEY           = var.aws_secret_access_key
+      USER_POOL_ID         = var.user_pool_id
+      DB_HOST              = var.db_host
+      DB_NAME              = var.db_name
+      DB_USERNAME          = var.db_username
+      DB_PASSWORD          = var.db_password
+      DB_STATEMENT_TIMEOUT = var.db_statement_timeout
     }
   }
 }
@@ -67,10 +68,11 @@ resource "aws_lambda_function" "get_all_companies_lambda_function" {
 
   environment {
     variables = {
-      DB_HOST     = var.db_host
-      DB_NAME     = var.db_name
-      DB_USERNAME = var.db_username
-      DB_PASSWORD = var.db_password
+      DB_HOST              = var.db_host
+      DB_NAME              = var.db_name
+      DB_USERNAME          = var.db_username
+      DB_PASSWORD          = var.db_password
+      DB_STATEMENT_TIMEOUT = var.db_statement_timeout
     }
   }
 }
@@ -98,13 +100,14 @@ resource "aws_lambda_function" "get_all_public_companies_lambda_function" {
 
   environment {
     variables = {
-      ACCESS_KEY   = var.aws_access_key_id
-      SECRET_KEY   = var.aws_secret_access_key
-      USER_POOL_ID = var.user_pool_id
-      DB_HOST      = var.db_host
-      DB_NAME      = var.db_name
-      DB_USERNAME  = var.db_username
-      DB_PASSWORD  = var.db_password
+      ACCESS_KEY           = var.aws_access_key_id
+      SECRET_KEY           = var.aws_secret_access_key
+      USER_POOL_ID         = var.user_pool_id
+      DB_HOST              = var.db_host
+      DB_NAME              = var.db_name
+      DB_USERNAME          = var.db_username
+      DB_PASSWORD          = var.db_password
+      DB_STATEMENT_TIMEOUT = var.db_statement_timeout
     }
   }
 }
@@ -128,6 +131,7 @@ resource "aws_lambda_function" "glue_trigger_lambda_function" {
     variables = {
       ENV          = var.environment
       BUCKET_FILES = var.bucket_files
+      ETL_MODULES  = "s3://${var.object_bucket_references.etl_ingestion_bucket.bucket}/${var.object_bucket_references.etl_ingestion_bucket.key}"
     }
   }
 }
@@ -165,13 +169,14 @@ resource "aws_lambda_function" "get_universe_overview_lambda_function" {
 
   environment {
     variables = {
-      ACCESS_KEY   = var.aws_access_key_id
-      SECRET_KEY   = var.aws_secret_access_key
-      USER_POOL_ID = var.user_pool_id
-      DB_HOST      = var.db_host
-      DB_NAME      = var.db_name
-      DB_USERNAME  = var.db_username
-      DB_PASSWORD  = var.db_password
+      ACCESS_KEY           = var.aws_access_key_id
+      SECRET_KEY           = var.aws_secret_access_key
+      USER_POOL_ID         = var.user_pool_id
+      DB_HOST              = var.db_host
+      DB_NAME              = var.db_name
+      DB_USERNAME          = var.db_username
+      DB_PASSWORD          = var.db_password
+      DB_STATEMENT_TIMEOUT = var.db_statement_timeout
     }
   }
 }
@@ -200,13 +205,14 @@ resource "aws_lambda_function" "get_company_report_vs_peers_lambda_function" {
 
   environment {
     variables = {
-      ACCESS_KEY   = var.aws_access_key_id
-      SECRET_KEY   = var.aws_secret_access_key
-      USER_POOL_ID = var.user_pool_id
-      DB_HOST      = var.db_host
-      DB_NAME      = var.db_name
-      DB_USERNAME  = var.db_username
-      DB_PASSWORD  = var.db_password
+      ACCESS_KEY           = var.aws_access_key_id
+      SECRET_KEY           = var.aws_secret_access_key
+      USER_POOL_ID         = var.user_pool_id
+      DB_HOST              = var.db_host
+      DB_NAME              = var.db_name
+      DB_USERNAME          = var.db_username
+      DB_PASSWORD          = var.db_password
+      DB_STATEMENT_TIMEOUT = var.db_statement_timeout
     }
   }
 }
@@ -235,13 +241,14 @@ resource "aws_lambda_function" "get_comparison_vs_peers_lambda_function" {
 
   environment {
     variables = {
-      ACCESS_KEY   = var.aws_access_key_id
-      SECRET_KEY   = var.aws_secret_access_key
-      USER_POOL_ID = var.user_pool_id
-      DB_HOST      = var.db_host
-      DB_NAME      = var.db_name
-      DB_USERNAME  = var.db_username
-      DB_PASSWORD  = var.db_password
+      ACCESS_KEY           = var.aws_access_key_id
+      SECRET_KEY           = var.aws_secret_access_key
+      USER_POOL_ID         = var.user_pool_id
+      DB_HOST              = var.db_host
+      DB_NAME              = var.db_name
+      DB_USERNAME          = var.db_username
+      DB_PASSWORD          = var.db_password
+      DB_STATEMENT_TIMEOUT = var.db_statement_timeout
     }
   }
 }
@@ -270,14 +277,15 @@ resource "aws_lambda_function" "download_comparison_vs_peers_lambda_function" {
 
   environment {
     variables = {
-      ACCESS_KEY   = var.aws_access_key_id
-      SECRET_KEY   = var.aws_secret_access_key
-      USER_POOL_ID = var.user_pool_id
-      DB_HOST      = var.db_host
-      DB_NAME      = var.db_name
-      DB_USERNAME  = var.db_username
-      DB_PASSWORD  = var.db_password
-      FILE_PATH    = var.comparison_file_path
+      ACCESS_KEY           = var.aws_access_key_id
+      SECRET_KEY           = var.aws_secret_access_key
+      USER_POOL_ID         = var.user_pool_id
+      DB_HOST              = var.db_host
+      DB_NAME              = var.db_name
+      DB_USERNAME          = var.db_username
+      DB_PASSWORD          = var.db_password
+      DB_STATEMENT_TIMEOUT = var.db_statement_timeout
+      FILE_PATH            = var.comparison_file_path
     }
   }
 }
@@ -306,13 +314,14 @@ resource "aws_lambda_function" "get_by_metric_report_lambda_function" {
 
   environment {
     variables = {
-      ACCESS_KEY   = var.aws_access_key_id
-      SECRET_KEY   = var.aws_secret_access_key
-      USER_POOL_ID = var.user_pool_id
-      DB_HOST      = var.db_host
-      DB_NAME      = var.db_name
-      DB_USERNAME  = var.db_username
-      DB_PASSWORD  = var.db_password
+      ACCESS_KEY           = var.aws_access_key_id
+      SECRET_KEY           = var.aws_secret_access_key
+      USER_POOL_ID         = var.user_pool_id
+      DB_HOST              = var.db_host
+      DB_NAME              = var.db_name
+      DB_USERNAME          = var.db_username
+      DB_PASSWORD          = var.db_password
+      DB_STATEMENT_TIMEOUT = var.db_statement_timeout
     }
   }
 }
@@ -341,13 +350,14 @@ resource "aws_lambda_function" "get_dynamic_report_lambda_function" {
 
   environment {
     variables = {
-      ACCESS_KEY   = var.aws_access_key_id
-      SECRET_KEY   = var.aws_secret_access_key
-      USER_POOL_ID = var.user_pool_id
-      DB_HOST      = var.db_host
-      DB_NAME      = var.db_name
-      DB_USERNAME  = var.db_username
-      DB_PASSWORD  = var.db_password
+      ACCESS_KEY           = var.aws_access_key_id
+      SECRET_KEY           = var.aws_secret_access_key
+      USER_POOL_ID         = var.user_pool_id
+      DB_HOST              = var.db_host
+      DB_NAME              = var.db_name
+      DB_USERNAME          = var.db_username
+      DB_PASSWORD          = var.db_password
+      DB_STATEMENT_TIMEOUT = var.db_statement_timeout
     }
   }
 }
@@ -505,6 +515,7 @@ resource "aws_lambda_function" "get_user_details_lambda_function" {
       DB_NAME = var.db_name
       DB_USERNAME = var.db_username
       DB_PASSWORD = var.db_password
+      DB_STATEMENT_TIMEOUT = var.db_statement_timeout
     }
   }
 }
@@ -538,6 +549,7 @@ resource "aws_lambda_function" "change_user_role_lambda_function" {
       DB_NAME = var.db_name
       DB_USERNAME = var.db_username
       DB_PASSWORD = var.db_password
+      DB_STATEMENT_TIMEOUT = var.db_statement_timeout
       ENVIRONMENT = var.environment
     }
   }
@@ -573,6 +585,7 @@ resource "aws_lambda_function" "assign_company_permissions_lambda_function" {
       DB_NAME = var.db_name
       DB_USERNAME = var.db_username
       DB_PASSWORD = var.db_password
+      DB_STATEMENT_TIMEOUT = var.db_statement_timeout
     }
   }
 }
@@ -607,6 +620,7 @@ resource "aws_lambda_function" "get_company_permissions_lambda_function" {
       DB_NAME = var.db_name
       DB_USERNAME = var.db_username
       DB_PASSWORD = var.db_password
+      DB_STATEMENT_TIMEOUT = var.db_statement_timeout
     }
   }
 }
@@ -634,13 +648,14 @@ resource "aws_lambda_function" "change_company_publicly_lambda_function" {
 
   environment {
     variables = {
-      ACCESS_KEY   = var.aws_access_key_id
-      SECRET_KEY   = var.aws_secret_access_key
-      USER_POOL_ID = var.user_pool_id
-      DB_HOST = var.db_host
-      DB_NAME = var.db_name
-      DB_USERNAME = var.db_username
-      DB_PASSWORD = var.db_password
+      ACCESS_KEY           = var.aws_access_key_id
+      SECRET_KEY           = var.aws_secret_access_key
+      USER_POOL_ID         = var.user_pool_id
+      DB_HOST              = var.db_host
+      DB_NAME              = var.db_name
+      DB_USERNAME          = var.db_username
+      DB_PASSWORD          = var.db_password
+      DB_STATEMENT_TIMEOUT = var.db_statement_timeout
     }
   }
 }
@@ -708,6 +723,7 @@ resource "aws_lambda_function" "disconnect_lambda_function" {
       DB_NAME = var.db_name
       DB_USERNAME = var.db_username
       DB_PASSWORD = var.db_password
+      DB_STATEMENT_TIMEOUT = var.db_statement_timeout
     }
   }
 }
@@ -740,6 +756,7 @@ resource "aws_lambda_function" "message_lambda_function" {
       DB_NAME = var.db_name
       DB_USERNAME = var.db_username
       DB_PASSWORD = var.db_password
+      DB_STATEMENT_TIMEOUT = var.db_statement_timeout
     }
   }
 }
@@ -772,6 +789,7 @@ resource "aws_lambda_function" "register_lambda_function" {
       DB_NAME = var.db_name
       DB_USERNAME = var.db_username
       DB_PASSWORD = var.db_password
+      DB_STATEMENT_TIMEOUT = var.db_statement_timeout
     }
   }
 }
@@ -803,6 +821,7 @@ resource "aws_lambda_function" "validate_data_lambda_function" {
       DB_NAME = var.db_name
       DB_USERNAME = var.db_username
       DB_PASSWORD = var.db_password
+      DB_STATEMENT_TIMEOUT = var.db_statement_timeout
     }
   }
 }
@@ -834,6 +853,7 @@ resource "aws_lambda_function" "get_company_investments_lambda_function" {
       DB_NAME = var.db_name
       DB_USERNAME = var.db_username
       DB_PASSWORD = var.db_password
+      DB_STATEMENT_TIMEOUT = var.db_statement_timeout
     }
   }
 }
@@ -865,42 +885,11 @@ resource "aws_lambda_function" "add_investment_lambda_function" {
       DB_NAME = var.db_name
       DB_USERNAME = var.db_username
       DB_PASSWORD = var.db_password
+      DB_STATEMENT_TIMEOUT = var.db_statement_timeout
     }
   }
 }
 
-resource "aws_lambda_function" "update_data_lambda_function" {
-  role = var.lambdas_exec_roles_arn.update_data_exec_role_arn
-  handler = "update_data.handler"
-  runtime = var.runtime
-  s3_bucket = var.object_bucket_references.update_data_function_bucket.bucket
-  s3_key = var.object_bucket_references.update_data_function_bucket.key
-  function_name = "${var.environment}_${var.lambdas_names.update_data_lambda_function}"
-  source_code_hash = base64sha256(var.object_bucket_references.update_data_function_bucket.etag)
-  timeout = 100
-
-  layers = [aws_lambda_layer_version.db_lambda_layer.arn]
-
-  vpc_config {
-    subnet_ids         = [element(var.private_subnet_ids, 0)]
-    security_group_ids = [var.security_group_id]
-  }
-
-  depends_on = [
-    aws_lambda_layer_version.db_lambda_layer
-  ]
-
-  environment {
-    variables = {
-      DB_HOST = var.db_host
-      DB_NAME = var.db_name
-      DB_USERNAME = var.db_username
-      DB_PASSWORD = var.db_password
-    }
-  }
-}
-
-
 resource "aws_lambda_function" "add_scenario_lambda_function" {
   role = var.lambdas_exec_roles_arn.add_scenario_exec_role_arn
   handler = "add_scenario_handler.handler"
@@ -931,6 +920,7 @@ resource "aws_lambda_function" "add_scenario_lambda_function" {
       DB_NAME = var.db_name
       DB_USERNAME = var.db_username
       DB_PASSWORD = var.db_password
+      DB_STATEMENT_TIMEOUT = var.db_statement_timeout
     }
   }
 }
@@ -965,6 +955,7 @@ resource "aws_lambda_function" "edit_modify_data_lambda_function" {
       DB_NAME = var.db_name
       DB_USERNAME = var.db_username
       DB_PASSWORD = var.db_password
+      DB_STATEMENT_TIMEOUT = var.db_statement_timeout
     }
   }
 }
@@ -999,6 +990,7 @@ resource "aws_lambda_function" "get_edit_modify_data_lambda_function" {
       DB_NAME = var.db_name
       DB_USERNAME = var.db_username
       DB_PASSWORD = var.db_password
+      DB_STATEMENT_TIMEOUT = var.db_statement_timeout
     }
   }
 }
@@ -1033,6 +1025,7 @@ resource "aws_lambda_function" "delete_scenarios_lambda_function" {
       DB_NAME = var.db_name
       DB_USERNAME = var.db_username
       DB_PASSWORD = var.db_password
+      DB_STATEMENT_TIMEOUT = var.db_statement_timeout
     }
   }
 }
@@ -1067,6 +1060,7 @@ resource "aws_lambda_function" "delete_company_lambda_function" {
       DB_NAME = var.db_name
       DB_USERNAME = var.db_username
       DB_PASSWORD = var.db_password
+      DB_STATEMENT_TIMEOUT = var.db_statement_timeout
     }
   }
 }
@@ -1098,6 +1092,7 @@ resource "aws_lambda_function" "get_metric_types_lambda_function" {
       DB_NAME = var.db_name
       DB_USERNAME = var.db_username
       DB_PASSWORD = var.db_password
+      DB_STATEMENT_TIMEOUT = var.db_statement_timeout
     }
   }
 }
@@ -1125,13 +1120,14 @@ resource "aws_lambda_function" "get_investment_date_report_lambda_function" {
 
   environment {
     variables = {
-      ACCESS_KEY   = var.aws_access_key_id
-      SECRET_KEY   = var.aws_secret_access_key
-      USER_POOL_ID = var.user_pool_id
-      DB_HOST      = var.db_host
-      DB_NAME      = var.db_name
-      DB_USERNAME  = var.db_username
-      DB_PASSWORD  = var.db_password
+      ACCESS_KEY           = var.aws_access_key_id
+      SECRET_KEY           = var.aws_secret_access_key
+      USER_POOL_ID         = var.user_pool_id
+      DB_HOST              = var.db_host
+      DB_NAME              = var.db_name
+      DB_USERNAME          = var.db_username
+      DB_PASSWORD          = var.db_password
+      DB_STATEMENT_TIMEOUT = var.db_statement_timeout
     }
   }
 }
@@ -1158,13 +1154,14 @@ resource "aws_lambda_function" "get_all_tags_lambda_function" {
 
   environment {
     variables = {
-      ACCESS_KEY   = var.aws_access_key_id
-      SECRET_KEY   = var.aws_secret_access_key
-      USER_POOL_ID = var.user_pool_id
-      DB_HOST      = var.db_host
-      DB_NAME      = var.db_name
-      DB_USERNAME  = var.db_username
-      DB_PASSWORD  = var.db_password
+      ACCESS_KEY           = var.aws_access_key_id
+      SECRET_KEY           = var.aws_secret_access_key
+      USER_POOL_ID         = var.user_pool_id
+      DB_HOST              = var.db_host
+      DB_NAME              = var.db_name
+      DB_USERNAME          = var.db_username
+      DB_PASSWORD          = var.db_password
+      DB_STATEMENT_TIMEOUT = var.db_statement_timeout
     }
   }
 }
@@ -1192,13 +1189,14 @@ resource "aws_lambda_function" "get_tags_by_company_lambda_function" {
 
   environment {
     variables = {
-      ACCESS_KEY   = var.aws_access_key_id
-      SECRET_KEY   = var.aws_secret_access_key
-      USER_POOL_ID = var.user_pool_id
-      DB_HOST      = var.db_host
-      DB_NAME      = var.db_name
-      DB_USERNAME  = var.db_username
-      DB_PASSWORD  = var.db_password
+      ACCESS_KEY           = var.aws_access_key_id
+      SECRET_KEY           = var.aws_secret_access_key
+      USER_POOL_ID         = var.user_pool_id
+      DB_HOST              = var.db_host
+      DB_NAME              = var.db_name
+      DB_USERNAME          = var.db_username
+      DB_PASSWORD          = var.db_password
+      DB_STATEMENT_TIMEOUT = var.db_statement_timeout
     }
   }
 }
@@ -1226,13 +1224,14 @@ resource "aws_lambda_function" "add_tag_lambda_function" {
 
   environment {
     variables = {
-      ACCESS_KEY   = var.aws_access_key_id
-      SECRET_KEY   = var.aws_secret_access_key
-      USER_POOL_ID = var.user_pool_id
-      DB_HOST      = var.db_host
-      DB_NAME      = var.db_name
-      DB_USERNAME  = var.db_username
-      DB_PASSWORD  = var.db_password
+      ACCESS_KEY           = var.aws_access_key_id
+      SECRET_KEY           = var.aws_secret_access_key
+      USER_POOL_ID         = var.user_pool_id
+      DB_HOST              = var.db_host
+      DB_NAME              = var.db_name
+      DB_USERNAME          = var.db_username
+      DB_PASSWORD          = var.db_password
+      DB_STATEMENT_TIMEOUT = var.db_statement_timeout
     }
   }
 }
@@ -1260,13 +1259,14 @@ resource "aws_lambda_function" "update_tags_lambda_function" {
 
   environment {
     variables = {
-      ACCESS_KEY   = var.aws_access_key_id
-      SECRET_KEY   = var.aws_secret_access_key
-      USER_POOL_ID = var.user_pool_id
-      DB_HOST      = var.db_host
-      DB_NAME      = var.db_name
-      DB_USERNAME  = var.db_username
-      DB_PASSWORD  = var.db_password
+      ACCESS_KEY           = var.aws_access_key_id
+      SECRET_KEY           = var.aws_secret_access_key
+      USER_POOL_ID         = var.user_pool_id
+      DB_HOST              = var.db_host
+      DB_NAME              = var.db_name
+      DB_USERNAME          = var.db_username
+      DB_PASSWORD          = var.db_password
+      DB_STATEMENT_TIMEOUT = var.db_statement_timeout
     }
   }
 }
@@ -1294,13 +1294,14 @@ resource "aws_lambda_function" "delete_tags_lambda_function" {
 
   environment {
     variables = {
-      ACCESS_KEY   = var.aws_access_key_id
-      SECRET_KEY   = var.aws_secret_access_key
-      USER_POOL_ID = var.user_pool_id
-      DB_HOST      = var.db_host
-      DB_NAME      = var.db_name
-      DB_USERNAME  = var.db_username
-      DB_PASSWORD  = var.db_password
+      ACCESS_KEY           = var.aws_access_key_id
+      SECRET_KEY           = var.aws_secret_access_key
+      USER_POOL_ID         = var.user_pool_id
+      DB_HOST              = var.db_host
+      DB_NAME              = var.db_name
+      DB_USERNAME          = var.db_username
+      DB_PASSWORD          = var.db_password
+      DB_STATEMENT_TIMEOUT = var.db_statement_timeout
     }
   }
 }
@@ -1327,13 +1328,14 @@ resource "aws_lambda_function" "get_all_ranges_lambda_function" {
 
   environment {
     variables = {
-      ACCESS_KEY   = var.aws_access_key_id
-      SECRET_KEY   = var.aws_secret_access_key
-      USER_POOL_ID = var.user_pool_id
-      DB_HOST      = var.db_host
-      DB_NAME      = var.db_name
-      DB_USERNAME  = var.db_username
-      DB_PASSWORD  = var.db_password
+      ACCESS_KEY           = var.aws_access_key_id
+      SECRET_KEY           = var.aws_secret_access_key
+      USER_POOL_ID         = var.user_pool_id
+      DB_HOST              = var.db_host
+      DB_NAME              = var.db_name
+      DB_USERNAME          = var.db_username
+      DB_PASSWORD          = var.db_password
+      DB_STATEMENT_TIMEOUT = var.db_statement_timeout
     }
   }
 }
@@ -1362,13 +1364,14 @@ resource "aws_lambda_function" "get_ranges_by_metric_lambda_function" {
 
   environment {
     variables = {
-      ACCESS_KEY   = var.aws_access_key_id
-      SECRET_KEY   = var.aws_secret_access_key
-      USER_POOL_ID = var.user_pool_id
-      DB_HOST      = var.db_host
-      DB_NAME      = var.db_name
-      DB_USERNAME  = var.db_username
-      DB_PASSWORD  = var.db_password
+      ACCESS_KEY           = var.aws_access_key_id
+      SECRET_KEY           = var.aws_secret_access_key
+      USER_POOL_ID         = var.user_pool_id
+      DB_HOST              = var.db_host
+      DB_NAME              = var.db_name
+      DB_USERNAME          = var.db_username
+      DB_PASSWORD          = var.db_password
+      DB_STATEMENT_TIMEOUT = var.db_statement_timeout
     }
   }
 }
@@ -1395,13 +1398,14 @@ resource "aws_lambda_function" "modify_ranges_lambda_function" {
 
   environment {
     variables = {
-      ACCESS_KEY   = var.aws_access_key_id
-      SECRET_KEY   = var.aws_secret_access_key
-      USER_POOL_ID = var.user_pool_id
-      DB_HOST      = var.db_host
-      DB_NAME      = var.db_name
-      DB_USERNAME  = var.db_username
-      DB_PASSWORD  = var.db_password
+      ACCESS_KEY           = var.aws_access_key_id
+      SECRET_KEY           = var.aws_secret_access_key
+      USER_POOL_ID         = var.user_pool_id
+      DB_HOST              = var.db_host
+      DB_NAME              = var.db_name
+      DB_USERNAME          = var.db_username
+      DB_PASSWORD          = var.db_password
+      DB_STATEMENT_TIMEOUT = var.db_statement_timeout
     }
   }
 }
@@ -1428,13 +1432,14 @@ resource "aws_lambda_function" "get_full_year_total_lambda_function" {
 
   environment {
     variables = {
-      ACCESS_KEY   = var.aws_access_key_id
-      SECRET_KEY   = var.aws_secret_access_key
-      USER_POOL_ID = var.user_pool_id
-      DB_HOST      = var.db_host
-      DB_NAME      = var.db_name
-      DB_USERNAME  = var.db_username
-      DB_PASSWORD  = var.db_password
+      ACCESS_KEY           = var.aws_access_key_id
+      SECRET_KEY           = var.aws_secret_access_key
+      USER_POOL_ID         = var.user_pool_id
+      DB_HOST              = var.db_host
+      DB_NAME              = var.db_name
+      DB_USERNAME          = var.db_username
+      DB_PASSWORD          = var.db_password
+      DB_STATEMENT_TIMEOUT = var.db_statement_timeout
     }
   }
 }
@@ -1463,13 +1468,14 @@ resource "aws_lambda_function" "get_quarters_report_lambda_function" {
 
   environment {
     variables = {
-      ACCESS_KEY   = var.aws_access_key_id
-      SECRET_KEY   = var.aws_secret_access_key
-      USER_POOL_ID = var.user_pool_id
-      DB_HOST      = var.db_host
-      DB_NAME      = var.db_name
-      DB_USERNAME  = var.db_username
-      DB_PASSWORD  = var.db_password
+      ACCESS_KEY           = var.aws_access_key_id
+      SECRET_KEY           = var.aws_secret_access_key
+      USER_POOL_ID         = var.user_pool_id
+      DB_HOST              = var.db_host
+      DB_NAME              = var.db_name
+      DB_USERNAME          = var.db_username
+      DB_PASSWORD          = var.db_password
+      DB_STATEMENT_TIMEOUT = var.db_statement_timeout
     }
   }
 }
@@ -27,7 +27,6 @@ output "lambdas_invoke_arns" {
     "validate_data_lambda_function": aws_lambda_function.validate_data_lambda_function.invoke_arn
     "get_company_investments_lambda_function": aws_lambda_function.get_company_investments_lambda_function.invoke_arn
     "add_investment_lambda_function": aws_lambda_function.add_investment_lambda_function.invoke_arn
-    "update_data_lambda_function": aws_lambda_function.update_data_lambda_function.invoke_arn
     "add_scenario_lambda_function": aws_lambda_function.add_scenario_lambda_function.invoke_arn
     "edit_modify_data_lambda_function": aws_lambda_function.edit_modify_data_lambda_function.invoke_arn
     "get_edit_modify_data_lambda_function": aws_lambda_function.get_edit_modify_data_lambda_function.invoke_arn
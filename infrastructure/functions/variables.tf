@@ -35,6 +35,9 @@ variable "db_host" {}
 variable "db_name" {}
 variable "db_username" {}
 variable "db_password" {}
+variable "db_statement_timeout" {
+  default = 30000
+}
 variable "aws_access_key_id" {}
 variable "aws_secret_access_key" {}
 variable "comparison_file_path" {}
@@ -1814,41 +1814,6 @@ resource "aws_lambda_permission" "apigw_add_investment_lambda" {
   source_arn    = "arn:aws:execute-api:${var.region}:${var.account_id}:${var.api_gateway_references.apigw_add_investment_lambda_function.api_id}/*/${var.api_gateway_references.apigw_add_investment_lambda_function.http_method}${var.api_gateway_references.apigw_add_investment_lambda_function.resource_path}"
 }
 
-# ----------------------------------------------------------------------------------------------------------------------
-# AWS UPDATE DATA LAMBDA FOR GLUE SCRIPT
-# ----------------------------------------------------------------------------------------------------------------------
-
-resource "aws_iam_role" "update_data_lambda_exec_role" {
-  name               = "${var.environment}_update_data_lambda_exec_role"
-  path               = "/"
-  description        = "Allows Lambda Function to call AWS services on your behalf."
-  assume_role_policy = <<EOF
-{
-  "Version": "2012-10-17",
-  "Statement": [
-    {
-      "Effect": "Allow",
-      "Principal": {
-        "Service": "lambda.amazonaws.com"
-      },
-      "Action": "sts:AssumeRole"
-    }
-  ]
-}
-EOF
-}
-
-resource "aws_iam_role_policy_attachment" "update_data_lambda_logs" {
-  role       = aws_iam_role.update_data_lambda_exec_role.name
-  policy_arn = var.aws_iam_policy_logs_arn
-}
-
-resource "aws_iam_role_policy_attachment" "update_data_lambda_vpc" {
-  role       = aws_iam_role.update_data_lambda_exec_role.name
-  policy_arn = var.aws_iam_policy_network_arn
-}
-
-
 # ----------------------------------------------------------------------------------------------------------------------
 # AWS IAM edit modify
 # ----------------------------------------------------------------------------------------------------------------------
@@ -31,7 +31,6 @@ output "lambdas_exec_roles_arn" {
       "validate_data_exec_role_arn": aws_iam_role.validate_data_lambda_exec_role.arn
       "company_investments_exec_role_arn": aws_iam_role.company_investments_lambda_exec_role.arn
       "add_investment_exec_role_arn": aws_iam_role.add_investment_lambda_exec_role.arn
-      "update_data_exec_role_arn": aws_iam_role.update_data_lambda_exec_role.arn
       "delete_scenarios_exec_role_arn": aws_iam_role.delete_scenarios_lambda_exec_role.arn
       "add_scenario_exec_role_arn": aws_iam_role.add_scenario_lambda_exec_role.arn
       "edit_modify_data_exec_role_arn": aws_iam_role.edit_modify_data_lambda_exec_role.arn
@@ -1,7 +1,10 @@
 import os
 import time
+import hashlib
 import logging
+import threading
 import requests
+from collections import OrderedDict
 from jose import jwk, jwt
 from jose.utils import base64url_decode
 from base_exception import AuthError
@@ -9,6 +12,15 @@ from base_exception import AuthError
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
+JWKS_TTL = int(os.environ.get("JWKS_TTL", 3600))
+JWKS_MIN_REFRESH_INTERVAL = 60
+jwks_cache = {"public_keys": dict(), "fetched_at": 0, "expires_at": 0}
+jwks_lock = threading.Lock()
+
+TOKEN_CACHE_SIZE = int(os.environ.get("TOKEN_CACHE_SIZE", 1024))
+verified_tokens = OrderedDict()
+token_cache_stats = {"hits": 0, "misses": 0}
+
 
 def get_keys(region: str, user_pool_id: str) -> list:
     try:
@@ -23,17 +35,43 @@ def get_keys(region: str, user_pool_id: str) -> list:
         raise error
 
 
-def get_public_key(keys: list, headers: dict):
+def refresh_public_keys(region: str, user_pool_id: str) -> dict:
+    with jwks_lock:
+        keys = get_keys(region, user_pool_id)
+        now = time.time()
+        jwks_cache["public_keys"] = {key["kid"]: jwk.construct(key) for key in keys}
+        jwks_cache["fetched_at"] = now
+        jwks_cache["expires_at"] = now + JWKS_TTL
+        return jwks_cache["public_keys"]
+
+
+def refresh_public_keys_in_background(region: str, user_pool_id: str):
+    def refresh():
+        try:
+            refresh_public_keys(region, user_pool_id)
+        except Exception as error:
+            logger.info(error)
+
+    if not jwks_lock.locked():
+        threading.Thread(target=refresh, daemon=True).start()
+
+
+def get_public_key(region: str, user_pool_id: str, headers: dict):
     kid = headers.get("kid")
-    key_index = -1
-    for i in range(len(keys)):
-        if kid == keys[i]["kid"]:
-            key_index = i
-            break
-    if key_index == -1:
+    public_keys = jwks_cache["public_keys"]
+    if not public_keys:
+        public_keys = refresh_public_keys(region, user_pool_id)
+    elif time.time() > jwks_cache["expires_at"]:
+        refresh_public_keys_in_background(region, user_pool_id)
+
+    public_key = public_keys.get(kid)
+    can_refresh = time.time() - jwks_cache["fetched_at"] > JWKS_MIN_REFRESH_INTERVAL
+    if public_key is None and can_refresh:
+        public_key = refresh_public_keys(region, user_pool_id).get(kid)
+    if public_key is None:
         raise AuthError("Public key not found in jwks.json")
 
-    return jwk.construct(keys[key_index])
+    return public_key
 
 
 def verify_token(token: str, public_key: object):
@@ -54,10 +92,46 @@ def verify_token_application(app_client_id: str, claims: dict):
         raise AuthError("Token was not issued for this audience")
 
 
-def get_policy(permission: str, user: str) -> dict:
+def get_token_hash(token: str) -> str:
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
+def get_cached_principal(token_hash: str):
+    principal = verified_tokens.get(token_hash)
+    if principal and time.time() > principal["exp"]:
+        verified_tokens.pop(token_hash)
+        principal = None
+    if not principal:
+        token_cache_stats["misses"] += 1
+        return None
+
+    verified_tokens.move_to_end(token_hash)
+    token_cache_stats["hits"] += 1
+    return principal
+
+
+def cache_principal(
+    token_hash: str, user: str, expiration: float, context: dict = None
+):
+    verified_tokens[token_hash] = {"user": user, "exp": expiration, "context": context}
+    verified_tokens.move_to_end(token_hash)
+    while len(verified_tokens) > TOKEN_CACHE_SIZE:
+        verified_tokens.popitem(last=False)
+
+
+def get_identity_context(claims: dict) -> dict:
+    if not claims.get("email"):
+        return None
+    return {
+        "email": claims.get("email"),
+        "groups": ",".join(claims.get("cognito:groups", [])),
+    }
+
+
+def get_policy(permission: str, user: str, context: dict = None) -> dict:
     account_id = os.environ.get("AWS_ACCOUNT_ID")
     api_gateway = os.environ.get("API_GATEWAY")
-    return {
+    policy = {
         "principalId": user,
         "policyDocument": {
             "Version": "2012-10-17",
@@ -70,6 +144,9 @@ def get_policy(permission: str, user: str) -> dict:
             ],
         },
     }
+    if context:
+        policy["context"] = context
+    return policy
 
 
 def handler(event, _):
@@ -78,13 +155,17 @@ def handler(event, _):
         user_pool_id = os.environ.get("USER_POOL_ID")
         app_client_id = os.environ.get("APP_CLIENT_ID")
 
-        keys = get_keys(region, user_pool_id)
         token = event.get("authorizationToken")
         if not token:
             raise AuthError("No Token found")
 
+        token_hash = get_token_hash(token)
+        principal = get_cached_principal(token_hash)
+        if principal:
+            return get_policy("Allow", principal["user"], principal["context"])
+
         headers = jwt.get_unverified_headers(token)
-        public_key = get_public_key(keys, headers)
+        public_key = get_public_key(region, user_pool_id, headers)
         verify_token(token, public_key)
 
         claims = jwt.get_unverified_claims(token)
@@ -92,8 +173,10 @@ def handler(event, _):
         verify_token_application(app_client_id, claims)
 
         user = claims.get("cognito:username") if claims.get("cognito:username") else ""
+        context = get_identity_context(claims)
+        cache_principal(token_hash, user, claims["exp"], context)
 
-        return get_policy("Allow", user)
+        return get_policy("Allow", user, context)
 
     except Exception as error:
         logger.info(error)
@@ -36,7 +36,7 @@ class BaseMetricsReport:
 
         return companies_filtered
 
-    def get_allowed_companies(self) -> list:
+    def get_allowed_companies(self) -> frozenset:
         return self.company_anonymization.companies
 
     def set_company_permissions(self, username: str) -> None:
@@ -46,7 +46,7 @@ class BaseMetricsReport:
         return sorted(
             list(data.values()),
             key=lambda x: (
-                self.company_anonymization.is_anonymized(x.get("name", "")),
+                self.company_anonymization.is_company_anonymized(x.get("id")),
                 x.get("name", "").lower(),
             ),
         )
@@ -27,7 +27,7 @@ class ByMetricReport:
         self.company_anonymization = company_anonymization
 
     def get_standard_metrics(self) -> list:
-        return [*self.repository.get_functions_metric(dict())]
+        return self.repository.get_metric_names()
 
     def get_ratio_metrics(self) -> dict:
         return {
@@ -381,7 +381,7 @@ class ByMetricReport:
         return sorted(
             list(data.values()),
             key=lambda x: (
-                self.company_anonymization.is_anonymized(x.get("name", "")),
+                self.company_anonymization.is_company_anonymized(x.get("id")),
                 x.get("name", "").lower(),
             ),
         )
@@ -1,3 +1,4 @@
+from functools import partial
 from base_exception import AppError
 from app_names import TableNames, ScenarioNames, MetricNames
 from base_metrics_config_name import METRICS_CONFIG_NAME
@@ -5,6 +6,84 @@ from query_builder import QuerySQLBuilder
 from response_sql import ResponseSQL
 
 
+def get_arguments(filters: dict, metric: str = None, scenario: str = None) -> dict:
+    arguments = {"filters": filters}
+    if metric:
+        arguments["metric"] = metric
+    if scenario:
+        arguments["scenario"] = scenario
+    return arguments
+
+
+def get_ratio_arguments(
+    filters: dict, dividend: str = None, divisor: str = None
+) -> dict:
+    arguments = {"filters": filters}
+    if dividend:
+        arguments["dividend"] = dividend
+    if divisor:
+        arguments["divisor"] = divisor
+    return arguments
+
+
+def get_base_metric_functions(scenario_type: ScenarioNames) -> dict:
+    scenario = str(scenario_type).lower()
+    return {
+        f"{scenario}_{metric_alias}": (
+            "get_base_metric",
+            partial(get_arguments, metric=metric_name, scenario=scenario_type),
+        )
+        for metric_name, metric_alias in METRICS_CONFIG_NAME.items()
+    }
+
+
+METRIC_FUNCTIONS = {
+    "ebitda_margin": ("get_ebitda_margin_metric", get_arguments),
+    "gross_margin": ("get_gross_margin", get_arguments),
+    "sales_and_marketing": (
+        "get_metric_as_percentage_of_revenue",
+        partial(get_arguments, metric=MetricNames.SALES_AND_MARKETING),
+    ),
+    "general_and_admin": (
+        "get_metric_as_percentage_of_revenue",
+        partial(get_arguments, metric=MetricNames.GENERAL_AND_ADMINISTRATION),
+    ),
+    "research_and_development": (
+        "get_metric_as_percentage_of_revenue",
+        partial(get_arguments, metric=MetricNames.RESEARCH_AND_DEVELOPMENT),
+    ),
+    "clv_cac_ratio": (
+        "get_metric_ratio",
+        partial(get_ratio_arguments, dividend="CLV", divisor="CAC"),
+    ),
+    "cac_ratio": (
+        "get_metric_ratio",
+        partial(get_ratio_arguments, dividend="CAC", divisor="CAV"),
+    ),
+    "revenue_per_employee": ("get_revenue_per_employee", get_arguments),
+    "opex_as_revenue": ("get_opex_as_revenue", get_arguments),
+    "debt_ebitda": ("get_debt_ebitda", get_arguments),
+    **get_base_metric_functions(ScenarioNames.ACTUALS),
+    **get_base_metric_functions(ScenarioNames.BUDGET),
+    "actuals_gross_profit": (
+        "get_gross_profit",
+        partial(get_arguments, scenario=ScenarioNames.ACTUALS),
+    ),
+    "budget_gross_profit": (
+        "get_gross_profit",
+        partial(get_arguments, scenario=ScenarioNames.BUDGET),
+    ),
+    "revenue_vs_budget": (
+        "get_actuals_vs_budget_metric",
+        partial(get_arguments, metric="Revenue"),
+    ),
+    "ebitda_vs_budget": (
+        "get_actuals_vs_budget_metric",
+        partial(get_arguments, metric="Ebitda"),
+    ),
+}
+
+
 class MetricReportRepository:
     def __init__(
         self, session, query_builder: QuerySQLBuilder, response_sql: ResponseSQL, logger
@@ -763,141 +842,13 @@ class MetricReportRepository:
             self.logger.info(error)
             return []
 
-    def __get_arguments(
-        self, filters: dict, metric: str = None, scenario: str = None
-    ) -> dict:
-        arguments = {"filters": filters}
-        if metric:
-            arguments["metric"] = metric
-        if scenario:
-            arguments["scenario"] = scenario
-        return arguments
-
-    def __get_ratio_arguments(
-        self, filters: dict, dividend: str = None, divisor: str = None
-    ) -> dict:
-        arguments = {"filters": filters}
-        if dividend:
-            arguments["dividend"] = dividend
-        if divisor:
-            arguments["divisor"] = divisor
-        return arguments
-
-    def __get_metric_names_config(self) -> dict:
-        return dict(
-            (metric_alias, metric_name)
-            for metric_name, metric_alias in METRICS_CONFIG_NAME.items()
-        )
-
-    def get_base_functions_metric(
-        self, filters: dict, scenario_type: ScenarioNames
-    ) -> dict:
-        metric_names = self.__get_metric_names_config()
-        scenario = str(scenario_type).lower()
-
-        return {
-            f"{scenario}_{metric}": {
-                "function": self.get_base_metric,
-                "arguments": self.__get_arguments(
-                    filters, metric_names[metric], scenario_type
-                ),
-            }
-            for metric in metric_names
-        }
-
-    def __get_actuals_vs_budget_functions_metric(self, filters: dict) -> dict:
-        return {
-            "revenue_vs_budget": {
-                "function": self.get_actuals_vs_budget_metric,
-                "arguments": self.__get_arguments(filters, "Revenue"),
-            },
-            "ebitda_vs_budget": {
-                "function": self.get_actuals_vs_budget_metric,
-                "arguments": self.__get_arguments(filters, "Ebitda"),
-            },
-        }
-
-    def __get_gross_profit_functions_metric(self, filters: dict) -> dict:
-        return {
-            "actuals_gross_profit": {
-                "function": self.get_gross_profit,
-                "arguments": self.__get_arguments(
-                    filters, scenario=ScenarioNames.ACTUALS
-                ),
-            },
-            "budget_gross_profit": {
-                "function": self.get_gross_profit,
-                "arguments": self.__get_arguments(
-                    filters, scenario=ScenarioNames.BUDGET
-                ),
-            },
-        }
-
-    def get_functions_metric(self, filters: dict) -> dict:
-        metric_config = {
-            "ebitda_margin": {
-                "function": self.get_ebitda_margin_metric,
-                "arguments": self.__get_arguments(filters),
-            },
-            "gross_margin": {
-                "function": self.get_gross_margin,
-                "arguments": self.__get_arguments(filters),
-            },
-            "sales_and_marketing": {
-                "function": self.get_metric_as_percentage_of_revenue,
-                "arguments": self.__get_arguments(
-                    filters, MetricNames.SALES_AND_MARKETING
-                ),
-            },
-            "general_and_admin": {
-                "function": self.get_metric_as_percentage_of_revenue,
-                "arguments": self.__get_arguments(
-                    filters, MetricNames.GENERAL_AND_ADMINISTRATION
-                ),
-            },
-            "research_and_development": {
-                "function": self.get_metric_as_percentage_of_revenue,
-                "arguments": self.__get_arguments(
-                    filters, MetricNames.RESEARCH_AND_DEVELOPMENT
-                ),
-            },
-            "clv_cac_ratio": {
-                "function": self.get_metric_ratio,
-                "arguments": self.__get_ratio_arguments(filters, "CLV", "CAC"),
-            },
-            "cac_ratio": {
-                "function": self.get_metric_ratio,
-                "arguments": self.__get_ratio_arguments(filters, "CAC", "CAV"),
-            },
-            "revenue_per_employee": {
-                "function": self.get_revenue_per_employee,
-                "arguments": self.__get_arguments(filters),
-            },
-            "opex_as_revenue": {
-                "function": self.get_opex_as_revenue,
-                "arguments": self.__get_arguments(filters),
-            },
-            "debt_ebitda": {
-                "function": self.get_debt_ebitda,
-                "arguments": self.__get_arguments(filters),
-            },
-        }
-        metric_config.update(
-            self.get_base_functions_metric(filters, ScenarioNames.ACTUALS)
-        )
-        metric_config.update(
-            self.get_base_functions_metric(filters, ScenarioNames.BUDGET)
-        )
-        metric_config.update(self.__get_gross_profit_functions_metric(filters))
-        metric_config.update(self.__get_actuals_vs_budget_functions_metric(filters))
-
-        return metric_config
+    def get_metric_names(self) -> list:
+        return list(METRIC_FUNCTIONS)
 
     def get_metric_records(self, metric: str, filters: dict) -> list:
-        functions_metric = self.get_functions_metric(filters)
-        metric_config = functions_metric.get(metric)
-        if not metric_config:
+        metric_function = METRIC_FUNCTIONS.get(metric)
+        if not metric_function:
             raise AppError("Metric not found")
 
-        function = metric_config["function"]
-        return function(**metric_config["arguments"])
+        function_name, build_arguments = metric_function
+        return getattr(self, function_name)(**build_arguments(filters))
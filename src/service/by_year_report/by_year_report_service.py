@@ -41,32 +41,19 @@ class ByYearReportService:
         allowed_companies: list,
         profile_ranges: dict,
     ) -> None:
-        for company_id in companies:
-            company_data = companies[company_id]
-            if company_id not in allowed_companies:
-                self._anonymize_metrics_by_company(
-                    company_data,
-                    profile_ranges,
-                )
-
-    def _replace_metric_by_defined_ranges(
-        self, company: dict, metric: str, ranges: list
-    ) -> None:
-        value = company.get(metric)
-        value_range = self.profile_range.get_range_from_value(
-            value, profile=metric, ranges=ranges
-        )
-        company[metric] = value_range
-
-    def _anonymize_metrics_by_company(
-        self,
-        company: dict,
-        profile_ranges: dict,
-    ) -> None:
+        anonymized_companies = [
+            companies[company_id]
+            for company_id in companies
+            if company_id not in allowed_companies
+        ]
         for metric in YEAR_REPORT_ANONYMIZABLE_METRICS:
-            self._replace_metric_by_defined_ranges(
-                company, metric, profile_ranges.get(metric, [])
+            value_ranges = self.profile_range.get_ranges_from_values(
+                [company.get(metric) for company in anonymized_companies],
+                profile=metric,
+                ranges=profile_ranges.get(metric, []),
             )
+            for company, value_range in zip(anonymized_companies, value_ranges):
+                company[metric] = value_range
 
     def get_comparison_vs_data(
         self, access: bool, data: dict, allowed_companies: list, profile_ranges: dict
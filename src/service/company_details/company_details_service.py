@@ -1,4 +1,5 @@
 from typing import Union
+from sqlalchemy.sql.elements import TextClause
 
 from base_exception import AppError
 from app_names import TableNames, ScenarioNames, METRIC_PERIOD_NAMES
@@ -20,9 +21,9 @@ class CompanyDetails:
         try:
             query = (
                 self.query_builder.add_table_name(self.table)
-                .add_sql_where_equal_condition({f"{self.table}.id": f"'{company_id}'"})
+                .add_sql_where_equal_parameters({f"{self.table}.id": company_id})
                 .build()
-                .get_query()
+                .get_statement()
             )
             result = self.session.execute(query).fetchall()
             return self.response_sql.process_query_result(result)
@@ -52,11 +53,11 @@ class CompanyDetails:
                         }
                     }
                 )
-                .add_sql_where_equal_condition(
+                .add_sql_where_equal_parameters(
                     {
-                        f"{TableNames.SCENARIO}.company_id": f"'{company_id}'",
-                        f"{TableNames.SCENARIO}.type": "'Actuals'",
-                        f"{TableNames.METRIC}.name": "'Revenue'",
+                        f"{TableNames.SCENARIO}.company_id": company_id,
+                        f"{TableNames.SCENARIO}.type": "Actuals",
+                        f"{TableNames.METRIC}.name": "Revenue",
                     }
                 )
                 .add_sql_order_by_condition(
@@ -64,7 +65,7 @@ class CompanyDetails:
                 )
                 .add_sql_limit_condition(2)
                 .build()
-                .get_query()
+                .get_statement()
             )
             result = self.session.execute(query).fetchall()
             return self.response_sql.process_revenue_profile_results(result)
@@ -115,11 +116,11 @@ class CompanyDetails:
                         }
                     }
                 )
-                .add_sql_where_equal_condition(
-                    {f"{TableNames.SCENARIO}.company_id": f"'{company_id}'"}
+                .add_sql_where_equal_parameters(
+                    {f"{TableNames.SCENARIO}.company_id": company_id}
                 )
                 .build()
-                .get_query()
+                .get_statement()
             )
             result = self.session.execute(query).fetchall()
             return self.response_sql.process_query_result(result).get("count")
@@ -196,8 +197,8 @@ class CompanyDetails:
                         }
                     }
                 )
-                .add_sql_where_equal_condition(
-                    {f"{TableNames.SCENARIO}.company_id": f"'{company_id}'"}
+                .add_sql_where_equal_parameters(
+                    {f"{TableNames.SCENARIO}.company_id": company_id}
                 )
                 .add_sql_order_by_condition(
                     [
@@ -213,7 +214,7 @@ class CompanyDetails:
                 .add_sql_offset_condition(offset)
                 .add_sql_limit_condition(limit)
                 .build()
-                .get_query()
+                .get_statement()
             )
 
             result = self.session.execute(query).fetchall()
@@ -270,11 +271,11 @@ class CompanyDetails:
                         }
                     }
                 )
-                .add_sql_where_equal_condition(
-                    {f"{TableNames.SCENARIO}.company_id": f"'{company_id}'"}
+                .add_sql_where_equal_parameters(
+                    {f"{TableNames.SCENARIO}.company_id": company_id}
                 )
                 .build()
-                .get_query()
+                .get_statement()
             )
             result = self.session.execute(query).fetchall()
             self.session.commit()
@@ -291,11 +292,11 @@ class CompanyDetails:
             query = (
                 self.query_builder.add_table_name(TableNames.INVESTMENT)
                 .add_select_conditions(["id as invest"])
-                .add_sql_where_equal_condition(
-                    {f"{TableNames.INVESTMENT}.company_id": f"'{company_id}'"}
+                .add_sql_where_equal_parameters(
+                    {f"{TableNames.INVESTMENT}.company_id": company_id}
                 )
                 .build()
-                .get_query()
+                .get_statement()
             )
             result = self.session.execute(query).fetchall()
             return self.response_sql.process_query_list_results(result)
@@ -376,9 +377,9 @@ class CompanyDetails:
                 raise AppError("Invalid company id")
             query = (
                 self.query_builder.add_table_name(self.table)
-                .add_sql_where_equal_condition({"id": f"'{company_id}'"})
+                .add_sql_where_equal_parameters({"id": company_id})
                 .build()
-                .get_query()
+                .get_statement()
             )
             result = self.session.execute(query).fetchall()
             if not result:
@@ -414,7 +415,7 @@ class CompanyDetails:
         metric: str,
         year: int,
         period_name: str,
-    ) -> str:
+    ) -> TextClause:
         return (
             self.query_builder.add_table_name(TableNames.SCENARIO)
             .add_select_conditions(
@@ -446,16 +447,16 @@ class CompanyDetails:
                     }
                 }
             )
-            .add_sql_where_equal_condition(
+            .add_sql_where_equal_parameters(
                 {
-                    f"{TableNames.SCENARIO}.company_id": f"'{company_id}'",
-                    f"{TableNames.SCENARIO}.name": f"'{scenario_name}-{year}'",
-                    f"{TableNames.METRIC}.name": f"'{metric}'",
-                    f"{TableNames.PERIOD}.period_name": f"'{period_name}'",
+                    f"{TableNames.SCENARIO}.company_id": company_id,
+                    f"{TableNames.SCENARIO}.name": f"{scenario_name}-{year}",
+                    f"{TableNames.METRIC}.name": metric,
+                    f"{TableNames.PERIOD}.period_name": period_name,
                 }
             )
             .build()
-            .get_query()
+            .get_statement()
         )
 
     def get_values_from_list(self, values: list):
@@ -1,6 +1,7 @@
 from app_names import TableNames
 from query_builder import QuerySQLBuilder
 from response_sql import ResponseSQL
+from metric_records_cache import get_update_version_query
 
 
 class EditModifyRepository:
@@ -237,6 +238,7 @@ class EditModifyRepository:
             queries = self.__get_companies_query(companies)
             if not queries:
                 return True
+            queries.append(get_update_version_query())
             query = """
                 {updates};
             """.format(
@@ -111,7 +111,7 @@ class EditModifyService:
                 scenario.get("scenario").split("-")[0],
             )
             for scenario in scenarios
-            if scenario.get("metric") in self.metric_service.get_metric_types()
+            if self.metric_service.is_metric_type(scenario.get("metric"))
         ]
 
     def __build_row(
@@ -125,9 +125,8 @@ class EditModifyService:
         return row
 
     def __is_metric_scenario_valid(self, scenario: str, metric: str) -> bool:
-        return (
-            scenario in list(ScenarioNames)
-            and metric in self.metric_service.get_metric_types()
+        return scenario in list(ScenarioNames) and self.metric_service.is_metric_type(
+            metric
         )
 
     def __add_company_description(self, company: dict) -> dict:
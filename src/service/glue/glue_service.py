@@ -1,6 +1,8 @@
 import os
 import urllib.parse
 
+ETL_PYTHON_MODULES = "psycopg2-binary"
+
 
 class GlueService:
     def __init__(self, logger):
@@ -12,18 +14,20 @@ class GlueService:
         )
         env = os.environ.get("ENV")
         bucket_files = os.environ.get("BUCKET_FILES")
+        etl_modules = os.environ.get("ETL_MODULES")
         job_name = "kpinetwork_job"
+        arguments = {
+            "--ENV": env,
+            "--FILENAME": filename,
+            "--BUCKET": bucket_files,
+            "--additional-python-modules": ETL_PYTHON_MODULES,
+        }
+        if etl_modules:
+            arguments["--extra-py-files"] = etl_modules
         try:
             logger.info("BUCKET: " + bucket_files)
             logger.info("FILENAME: " + filename)
-            response = glue_client.start_job_run(
-                JobName=job_name,
-                Arguments={
-                    "--ENV": env,
-                    "--FILENAME": filename,
-                    "--BUCKET": bucket_files,
-                },
-            )
+            response = glue_client.start_job_run(JobName=job_name, Arguments=arguments)
             job_id = response["JobRunId"]
             logger.info("STARTED GLUE JOB: " + job_name)
             logger.info("GLUE JOB RUN ID: " + job_id)
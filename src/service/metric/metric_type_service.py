@@ -1,5 +1,14 @@
+import os
+import time
 from app_names import TableNames
 
+METRIC_TYPES_TTL = int(os.environ.get("METRIC_TYPES_TTL", 300))
+metric_types = {"names": [], "names_set": frozenset(), "expires_at": 0}
+
+
+def clear_metric_types() -> None:
+    metric_types.update({"names": [], "names_set": frozenset(), "expires_at": 0})
+
 
 class MetricTypesService:
     def __init__(self, session, query_builder, response_sql, logger) -> None:
@@ -8,28 +17,50 @@ class MetricTypesService:
         self.query_builder = query_builder
         self.response_sql = response_sql
 
-    def get_metric_types(self) -> list:
-        try:
-            query = (
-                self.query_builder.add_table_name(TableNames.METRIC_TYPES)
-                .add_join_clause(
-                    {
-                        f"{TableNames.METRIC_SORT}": {
-                            "from": f"{TableNames.METRIC_SORT}.name",
-                            "to": f"{TableNames.METRIC_TYPES}.name",
-                        }
+    def __load_metric_types(self) -> None:
+        query = (
+            self.query_builder.add_table_name(TableNames.METRIC_TYPES)
+            .add_join_clause(
+                {
+                    f"{TableNames.METRIC_SORT}": {
+                        "from": f"{TableNames.METRIC_SORT}.name",
+                        "to": f"{TableNames.METRIC_TYPES}.name",
                     }
-                )
-                .add_sql_order_by_condition(
-                    ["group_sort_value", "sort_value"], self.query_builder.Order.ASC
-                )
-                .build()
-                .get_query()
+                }
+            )
+            .add_sql_order_by_condition(
+                ["group_sort_value", "sort_value"], self.query_builder.Order.ASC
             )
+            .build()
+            .get_query()
+        )
+
+        results = self.session.execute(query)
+        names = self.response_sql.process_query_list_results(results)
+        names = [name.get("name") for name in names if name.get("name")]
+        metric_types.update(
+            {
+                "names": names,
+                "names_set": frozenset(names),
+                "expires_at": time.time() + METRIC_TYPES_TTL,
+            }
+        )
 
-            results = self.session.execute(query)
-            names = self.response_sql.process_query_list_results(results)
-            return [name.get("name") for name in names if name.get("name")]
+    def __get_catalog(self) -> dict:
+        if time.time() >= metric_types["expires_at"]:
+            self.__load_metric_types()
+        return metric_types
+
+    def get_metric_types(self) -> list:
+        try:
+            return list(self.__get_catalog()["names"])
         except Exception as error:
             self.logger.info(error)
             return []
+
+    def is_metric_type(self, name: str) -> bool:
+        try:
+            return name in self.__get_catalog()["names_set"]
+        except Exception as error:
+            self.logger.info(error)
+            return False
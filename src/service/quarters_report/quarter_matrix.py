@@ -0,0 +1,164 @@
+import numpy
+
+QUARTERS = ["Q1", "Q2", "Q3", "Q4"]
+QUARTER_INDEXES = {quarter: index for index, quarter in enumerate(QUARTERS)}
+
+
+class QuarterMatrix:
+    def __init__(self, years: list) -> None:
+        self.years = [str(year) for year in years]
+        self.year_indexes = {year: index for index, year in enumerate(self.years)}
+        self.previous_years = numpy.array(
+            [self.year_indexes.get(str(int(year) - 1), -1) for year in self.years],
+            dtype=int,
+        )
+        self.ids = []
+        self.id_indexes = dict()
+        self.__cells = []
+        self.__rows = []
+        self.__rows_values = []
+        self.__rows_present = []
+        self.__values = None
+        self.__present = None
+        self.__loaded = None
+        self.__rolling_quarters = None
+
+    def __get_row(self, id: str) -> int:
+        row = self.id_indexes.get(id)
+        if row is None:
+            row = len(self.ids)
+            self.id_indexes[id] = row
+            self.ids.append(id)
+        return row
+
+    def add_value(self, id: str, year, quarter: str, value) -> None:
+        row = self.__get_row(id)
+        column = self.year_indexes.get(str(year))
+        if column is None or quarter not in QUARTER_INDEXES:
+            return
+        self.__cells.append((row, column, QUARTER_INDEXES[quarter], value))
+        self.__values = None
+
+    def add_quarters(self, id: str, year, quarters: dict) -> None:
+        row = self.__get_row(id)
+        column = self.year_indexes.get(str(year))
+        if column is None:
+            return
+        self.__rows.append((row, column))
+        self.__rows_values.append([quarters.get(quarter) for quarter in QUARTERS])
+        self.__rows_present.append([quarter in quarters for quarter in QUARTERS])
+        self.__values = None
+
+    def __build(self) -> None:
+        shape = (len(self.ids), len(self.years), len(QUARTERS))
+        self.__rolling_quarters = None
+        self.__values = numpy.full(shape, numpy.nan)
+        self.__present = numpy.zeros(shape, dtype=bool)
+        if self.__cells:
+            rows, columns, quarters, values = zip(*self.__cells)
+            self.__values[rows, columns, quarters] = numpy.array(values, dtype=float)
+            self.__present[rows, columns, quarters] = True
+        self.__loaded = self.__present.any(axis=2)
+        if self.__rows:
+            rows, columns = zip(*self.__rows)
+            self.__values[rows, columns] = numpy.array(self.__rows_values, dtype=float)
+            self.__present[rows, columns] = self.__rows_present
+            self.__loaded[rows, columns] = True
+
+    @property
+    def values(self) -> numpy.ndarray:
+        if self.__values is None:
+            self.__build()
+        return self.__values
+
+    @property
+    def present(self) -> numpy.ndarray:
+        if self.__values is None:
+            self.__build()
+        return self.__present
+
+    @property
+    def loaded(self) -> numpy.ndarray:
+        if self.__values is None:
+            self.__build()
+        return self.__loaded
+
+    def get_quarter(self, quarter: str) -> numpy.ndarray:
+        return self.values[:, :, QUARTER_INDEXES[quarter]]
+
+    def get_year_to_date(self, period: str = "Q4", missing=numpy.nan) -> numpy.ndarray:
+        values = numpy.where(self.present, self.values, missing)
+        return values[:, :, : QUARTER_INDEXES[period] + 1].sum(axis=2)
+
+    def get_full_year(self) -> numpy.ndarray:
+        return self.get_year_to_date()
+
+    @property
+    def rolling_quarters(self) -> "RollingQuarters":
+        if self.__values is None or self.__rolling_quarters is None:
+            self.__rolling_quarters = RollingQuarters(self.values, self.previous_years)
+        return self.__rolling_quarters
+
+    def get_last_twelve_months(self, period: str) -> numpy.ndarray:
+        last_twelve_months = self.rolling_quarters.get_windows(period)
+        last_twelve_months[:, :1] = numpy.nan
+        return last_twelve_months
+
+    def get_year_before(
+        self, values: numpy.ndarray, fill_value=numpy.nan
+    ) -> numpy.ndarray:
+        previous = numpy.take(values, numpy.maximum(self.previous_years, 0), axis=1)
+        previous[:, self.previous_years < 0] = fill_value
+        return previous
+
+    def get_previous_loaded(self, values: numpy.ndarray) -> numpy.ndarray:
+        columns = numpy.arange(len(self.years))
+        last_loaded = numpy.maximum.accumulate(
+            numpy.where(self.loaded, columns, -1), axis=1
+        )
+        previous_loaded = get_previous_year(last_loaded, fill_value=-1)
+        previous = numpy.take_along_axis(
+            values, numpy.maximum(previous_loaded, 0), axis=1
+        )
+        previous[previous_loaded < 0] = numpy.nan
+        return previous
+
+
+class RollingQuarters:
+    def __init__(self, values: numpy.ndarray, previous_years: numpy.ndarray) -> None:
+        self.__values = values
+        self.__previous_years = previous_years
+        self.__previous_values = numpy.take(
+            values, numpy.maximum(previous_years, 0), axis=1
+        )
+
+    def get_windows(self, period: str) -> numpy.ndarray:
+        next_index = QUARTER_INDEXES[period] + 1
+        previous_quarters = self.__previous_values[:, :, next_index:].sum(axis=2)
+        if next_index < len(QUARTERS):
+            previous_quarters[:, self.__previous_years < 0] = numpy.nan
+        return previous_quarters + self.__values[:, :, :next_index].sum(axis=2)
+
+
+def get_previous_year(values: numpy.ndarray, fill_value=numpy.nan) -> numpy.ndarray:
+    previous = numpy.full_like(values, fill_value)
+    previous[:, 1:] = values[:, :-1]
+    return previous
+
+
+def get_comparison(
+    values: numpy.ndarray, previous: numpy.ndarray = None
+) -> numpy.ndarray:
+    if previous is None:
+        previous = get_previous_year(values)
+    with numpy.errstate(divide="ignore", invalid="ignore"):
+        comparison = values / previous
+    comparison[~numpy.isfinite(comparison)] = numpy.nan
+    return comparison
+
+
+def get_averages(values: numpy.ndarray) -> numpy.ndarray:
+    counts = numpy.count_nonzero(~numpy.isnan(values), axis=0)
+    totals = numpy.nansum(values, axis=0)
+    with numpy.errstate(divide="ignore", invalid="ignore"):
+        return numpy.where(counts > 0, totals / counts, numpy.nan)
@@ -0,0 +1,84 @@
+from quarter_matrix import QUARTERS, QUARTER_INDEXES
+
+FULL_YEAR = "Full Year"
+COMPARISON = "vs"
+LAST_TWELVE_MONTHS = "last_twelve_months"
+
+LAYOUTS_SIZE = 256
+layouts = dict()
+
+
+def clear_layouts() -> None:
+    layouts.clear()
+
+
+class QuartersLayout:
+    def __init__(self, subheaders: dict) -> None:
+        self.subheaders = {year: tuple(keys) for year, keys in subheaders.items()}
+        self.years = tuple(self.subheaders)
+        self.header = ["Company"]
+        self.subheader = [""]
+        self.columns = dict()
+        for year, keys in self.subheaders.items():
+            self.header.extend([year] + [""] * (len(keys) - 1))
+            for key in keys:
+                self.columns[(str(year), key)] = len(self.subheader)
+                self.subheader.append(key)
+
+    def has_column(self, year, key: str) -> bool:
+        return (str(year), key) in self.columns
+
+    def get_subheaders_dict(self) -> dict:
+        return {year: list(keys) for year, keys in self.subheaders.items()}
+
+    def get_headers(self) -> tuple:
+        return list(self.header), list(self.subheader)
+
+
+def build_last_twelve_months_subheaders(years: list, period: str) -> dict:
+    next_index = QUARTER_INDEXES[period] + 1
+    quarters_for_year = QUARTERS[:next_index]
+    quarters_ltm = QUARTERS[next_index:]
+    last_position = len(years) - 1
+    subheaders = dict()
+    for position, year in enumerate(years):
+        comparison = [COMPARISON] if position > 1 else []
+        if position == last_position:
+            subheaders[year] = quarters_for_year + [FULL_YEAR] + comparison
+        elif position == 0:
+            subheaders[year] = quarters_ltm
+        else:
+            subheaders[year] = (
+                quarters_for_year + [FULL_YEAR] + comparison + quarters_ltm
+            )
+    return subheaders
+
+
+def build_quarters_subheaders(years: list) -> dict:
+    subheaders = dict()
+    for position, year in enumerate(sorted(years)):
+        subheaders[year] = QUARTERS + [FULL_YEAR] + ([COMPARISON] if position else [])
+    return subheaders
+
+
+def get_quarters_layout(
+    years: list, period: str = None, report_type: str = None
+) -> QuartersLayout:
+    is_last_twelve_months = report_type == LAST_TWELVE_MONTHS
+    key = (
+        tuple(years),
+        (period or "Q4") if is_last_twelve_months else None,
+        is_last_twelve_months,
+    )
+    layout = layouts.get(key)
+    if layout is None:
+        if len(layouts) >= LAYOUTS_SIZE:
+            clear_layouts()
+        subheaders = (
+            build_last_twelve_months_subheaders(years, key[1])
+            if is_last_twelve_months
+            else build_quarters_subheaders(years)
+        )
+        layout = QuartersLayout(subheaders)
+        layouts[key] = layout
+    return layout
@@ -3,9 +3,9 @@ from typing import Union
 import numbers
 from functools import reduce
 from datetime import date
-import operator
 import statistics
 import copy
+import numpy
 
 from calculator_service import CalculatorService
 from base_metrics_config_name import METRICS_CONFIG_NAME, METRICS_TO_ANONYMIZE
@@ -14,6 +14,13 @@ from company_anonymization import CompanyAnonymization
 from metric_report_repository import MetricReportRepository
 from base_exception import AppError
 from app_names import MetricNames, DEFAULT_RANGES
+from quarter_matrix import (
+    QUARTERS,
+    QuarterMatrix,
+    get_averages,
+    get_comparison,
+)
+from quarters_layout import FULL_YEAR, QuartersLayout, get_quarters_layout
 
 
 class QuartersReport:
@@ -31,7 +38,7 @@ class QuartersReport:
         self.calculator = calculator
         self.profile_range = profile_range
         self.company_anonymization = company_anonymization
-        self.full_year = "Full Year"
+        self.full_year = FULL_YEAR
 
     def get_quarters(self) -> dict:
         return {"Q1": [1, 2, 3], "Q2": [4, 5, 6], "Q3": [7, 8, 9], "Q4": [10, 11, 12]}
@@ -52,114 +59,24 @@ class QuartersReport:
         return ltm_year
 
     def build_subheaders_dict(self, period: str, years: list) -> dict:
-        quarters = list(self.get_quarters().keys())
-        index = quarters.index(period)
-        next_index = index + 1
-        quarters_for_year = quarters[:next_index]
-        quarters_ltm = quarters[next_index:]
-        subheaders = dict()
-        for year in years:
-            initial_years = years[1:]
-            if years.index(year) == (len(years) - 1):
-                subheaders[year] = quarters_for_year + [self.full_year]
-                if len(initial_years) > 1:
-                    subheaders[year].append("vs")
-            elif years.index(year) == 0:
-                subheaders[year] = quarters_ltm
-            else:
-                subheaders[year] = quarters_for_year + [self.full_year] + quarters_ltm
-                if initial_years.index(year) != 0:
-                    full_year_index = subheaders[year].index(self.full_year)
-                    subheaders[year].insert(full_year_index + 1, "vs")
-        return subheaders
-
-    def get_header(self, subheaders_dict: dict) -> list:
-        headers = ["Company"]
-        for key, value in subheaders_dict.items():
-            headers.extend([key] + [""] * (len(value) - 1))
-        return headers
-
-    def get_subheaders(self, subheaders_dict: dict) -> list:
-        return [""] + reduce(operator.iconcat, subheaders_dict.values(), [])
+        return get_quarters_layout(
+            years, period, "last_twelve_months"
+        ).get_subheaders_dict()
 
     def get_headers(
         self,
         years: list,
         period: str = "Q4",
     ) -> tuple:
-        subheaders_dict = self.build_subheaders_dict(period, years)
-        header = self.get_header(subheaders_dict)
-        subheader = self.get_subheaders(subheaders_dict)
-        return header, subheader
+        return get_quarters_layout(years, period, "last_twelve_months").get_headers()
 
     def get_standard_metrics(self, scenario_type, years: list) -> list:
-        standard = list(
-            set(
-                [
-                    metric
-                    for metric in self.repository.get_functions_metric(
-                        scenario_type, years, dict()
-                    )
-                ]
-            )
-        )
+        standard = set(self.repository.get_metric_names())
         return [
             metric.split("-")[1] if len(metric.split("-")) > 1 else metric
             for metric in standard
         ]
 
-    def __get_ltm_full_year_base_scenarios(
-        self,
-        subheaders_dict,
-        year,
-        period,
-        company_id,
-        company,
-        quarters_per_companies,
-    ) -> dict:
-        def append_quarter_data(data, year, company_id):
-            if data:
-                quarters_per_companies.setdefault(company_id, {}).setdefault(
-                    year, []
-                ).append(data)
-
-        subheader_years = list(subheaders_dict.keys())
-        year_str = str(year)
-        next_year = str(year + 1)
-        if year_str == subheader_years[0]:
-            next_year_quarters = subheaders_dict.get(year_str, [])
-            next_quarter_data = (
-                self.__get_valid_value(company.get("value"))
-                if period in next_year_quarters
-                else None
-            )
-            append_quarter_data(next_quarter_data, next_year, company_id)
-        elif year_str == subheader_years[-1]:
-            year_quarters = subheaders_dict.get(year_str)
-            quarter_data = (
-                self.__get_valid_value(company.get("value"))
-                if period in year_quarters
-                else None
-            )
-            append_quarter_data(quarter_data, year_str, company_id)
-        else:
-            full_year_index = subheaders_dict[year_str].index(self.full_year)
-            next_index = full_year_index + 1
-            next_year_quarters = subheaders_dict[year_str][next_index:]
-            next_quarter_data = (
-                self.__get_valid_value(company.get("value"))
-                if period in next_year_quarters
-                else None
-            )
-            year_quarters = subheaders_dict[year_str][:full_year_index]
-            quarter_data = (
-                self.__get_valid_value(company.get("value"))
-                if period in year_quarters
-                else None
-            )
-            append_quarter_data(quarter_data, year_str, company_id)
-            append_quarter_data(next_quarter_data, next_year, company_id)
-
     def process_metrics(
         self,
         report_type: str,
@@ -202,11 +119,13 @@ class QuartersReport:
         data = self.process_metrics(
             report_type, metric, years, period, filters, scenario_type
         )
+        data_by_year = defaultdict(list)
+        for item in data:
+            if item["metric"] == metric:
+                data_by_year[item["scenario"].split("-")[-1]].append(item)
         result = []
         for year in years:
-            year_data = [
-                x for x in data if str(year) in x["scenario"] and x["metric"] == metric
-            ]
+            year_data = data_by_year.get(str(year), [])
             for actuals in [x for x in year_data if "Actuals" in x["scenario"]]:
                 budget = next(
                     (x for x in year_data if x["scenario"] == "Budget-" + str(year)),
@@ -237,33 +156,6 @@ class QuartersReport:
                     result.append(actuals)
         return result
 
-    def __get_calculate_full_year_property_year_to_year(
-        self, data: dict
-    ) -> Union[float, None]:
-        full_year = 0
-        if None in [data.get("Q1"), data.get("Q2"), data.get("Q3"), data.get("Q4")]:
-            full_year = None
-        else:
-            full_year = (
-                data.get("Q1") + data.get("Q2") + data.get("Q3") + data.get("Q4")
-            )
-
-        return full_year
-
-    def __get_calculate_full_year_property_year_to_date(
-        self, data: dict, period: str
-    ) -> Union[float, None]:
-        full_year = 0
-        quarters = ["Q1", "Q2", "Q3", "Q4"]
-        period_index = quarters.index(period)
-        needed_quarters = quarters[: period_index + 1]
-        quarters_values = [data.get(value, 0) for value in needed_quarters]
-        if None not in quarters_values:
-            full_year = sum(quarters_values)
-        if full_year == 0:
-            return None
-        return full_year
-
     def __split_periods_by_last_twelve_months(self):
         try:
             month = date.today().month
@@ -275,70 +167,84 @@ class QuartersReport:
         except ValueError:
             return None, None
 
-    def add_full_year_property_last_twelve_months(
-        self,
-        report_type: str,
-        metric: str,
-        years: list,
-        period: str,
-        filters: dict,
-        scenario_type: str = "actuals_budget",
-    ) -> list:
-        data = self.get_actuals_plus_budget(
-            report_type, metric, years, period, filters, scenario_type
-        )
-        actual_periods, previous_periods = self.__split_periods_by_last_twelve_months()
-        for company in data:
-            full_year = 0
-            company_id = company["id"]
-            year = int(company["year"])
-            previous_company_data = next(
-                (
-                    item
-                    for item in data
-                    if item["id"] == company_id and item["year"] == f"{year-1}"
-                ),
-                None,
-            )
-            previous_company_values = (
-                [previous_company_data.get(prop, None) for prop in previous_periods]
-                if previous_company_data is not None
-                else [None]
-            )
-            if None in previous_company_values:
-                full_year = None
-            else:
-                full_year = sum(previous_company_values)
-            actual_company_values = [company.get(prop, None) for prop in actual_periods]
-            if None in actual_company_values or full_year is None:
-                full_year = None
-            else:
-                full_year += sum(actual_company_values)
-            company[self.full_year] = full_year
-        return data
-
-    def add_full_year_property(
+    def __get_full_year_last_twelve_months(
+        self, matrix: QuarterMatrix
+    ) -> numpy.ndarray:
+        actual_periods, _ = self.__split_periods_by_last_twelve_months()
+        full_year = matrix.get_last_twelve_months(actual_periods[-1])
+        has_previous_year = matrix.get_year_before(matrix.loaded, fill_value=False)
+        return numpy.where(has_previous_year, full_year, numpy.nan)
+
+    def __get_full_year(
+        self, matrix: QuarterMatrix, report_type: str, period: str
+    ) -> numpy.ndarray:
+        if report_type == "last_twelve_months":
+            return self.__get_full_year_last_twelve_months(matrix)
+        if report_type == "year_to_date" and period != "Q4":
+            full_year = matrix.get_year_to_date(period, missing=0)
+            return numpy.where(full_year == 0, numpy.nan, full_year)
+        return matrix.get_full_year()
+
+    def __round_values(self, values: numpy.ndarray, digits: int = 2) -> numpy.ndarray:
+        round_value = numpy.frompyfunc(round, 2, 1)
+        return round_value(values.astype(object), digits).astype(float)
+
+    def __get_report_values(self, values: numpy.ndarray) -> list:
+        report_values = values.astype(object)
+        report_values[numpy.isnan(values)] = "NA"
+        return report_values.tolist()
+
+    def __get_actuals_plus_budget_columns(
         self,
         report_type: str,
         metric: str,
         years: list,
         period: str,
         filters: dict,
-        scenario_type: str = "actuals_budget",
-    ) -> list:
+    ) -> tuple:
         data = self.get_actuals_plus_budget(report_type, metric, years, period, filters)
+        matrix = QuarterMatrix(years)
+        names = dict()
         for item in data:
-            if report_type == "year_to_date" and period != "Q4":
-                full_year = self.__get_calculate_full_year_property_year_to_date(
-                    item, period
-                )
-            else:
-                full_year = self.__get_calculate_full_year_property_year_to_year(item)
-            item[self.full_year] = full_year
-        return data
+            names.setdefault(item["id"], item["name"])
+            matrix.add_quarters(item["id"], item["year"], item)
+        full_year = self.__get_full_year(matrix, report_type, period)
+        comparison = get_comparison(full_year, matrix.get_previous_loaded(full_year))
+        columns = {quarter: matrix.get_quarter(quarter) for quarter in QUARTERS}
+        columns[self.full_year] = full_year
+        columns["vs"] = self.__round_values(comparison * 100)
+        return names, matrix, columns
+
+    def __get_quarters_keys(self, years: list, report_type: str) -> dict:
+        first_year = years[0] if report_type != "last_twelve_months" else years[1]
+        keys = QUARTERS + [self.full_year]
+        return {year: keys + (["vs"] if year != first_year else []) for year in years}
 
-    def is_valid_value(self, value) -> Union[float, str, None]:
-        return value if value is not None else "NA"
+    def __get_companies_quarters(
+        self,
+        names: dict,
+        matrix: QuarterMatrix,
+        columns: dict,
+        quarters_keys: dict,
+        only_loaded: bool = False,
+    ) -> list:
+        values = {
+            key: self.__get_report_values(column) for key, column in columns.items()
+        }
+        loaded = matrix.loaded.tolist()
+        years = [
+            (matrix.year_indexes[str(year)], year, keys)
+            for year, keys in quarters_keys.items()
+        ]
+        companies = []
+        for row, id in enumerate(matrix.ids):
+            quarters = [
+                {"year": year, **{key: values[key][row][column] for key in keys}}
+                for column, year, keys in years
+                if loaded[row][column] or not only_loaded
+            ]
+            companies.append({"id": id, "name": names[id], "quarters": quarters})
+        return companies
 
     def add_vs_property(
         self,
@@ -349,48 +255,16 @@ class QuartersReport:
         filters: dict,
         scenario_type: str = "actuals_budget",
     ) -> list:
-        data = []
-        if report_type == "last_twelve_months":
-            data = self.add_full_year_property_last_twelve_months(
-                report_type, metric, years, period, filters
-            )
-        else:
-            data = self.add_full_year_property(
-                report_type, metric, years, period, filters
-            )
-        first_year = years[0] if report_type != "last_twelve_months" else years[1]
-        companies = {}
-        prev_full_year = {}
-        for item in data:
-            if item["id"] not in companies:
-                companies[item["id"]] = {
-                    "id": item["id"],
-                    "name": item["name"],
-                    "quarters": [],
-                }
-                prev_full_year[item["id"]] = None
-            quarter = {
-                "year": item["year"],
-                "Q1": self.is_valid_value(item.get("Q1", None)),
-                "Q2": self.is_valid_value(item.get("Q2", None)),
-                "Q3": self.is_valid_value(item.get("Q3", None)),
-                "Q4": self.is_valid_value(item.get("Q4", None)),
-                self.full_year: self.is_valid_value(item.get(self.full_year, None)),
-            }
-            if quarter["year"] != first_year:
-                if (
-                    prev_full_year[item["id"]] is not None
-                    and prev_full_year[item["id"]] != "NA"
-                    and quarter[self.full_year] != "NA"
-                ):
-                    quarter["vs"] = round(
-                        (quarter[self.full_year] / prev_full_year[item["id"]] * 100), 2
-                    )
-                else:
-                    quarter["vs"] = "NA"
-            prev_full_year[item["id"]] = quarter[self.full_year]
-            companies[item["id"]]["quarters"].append(quarter)
-        return list(companies.values())
+        names, matrix, columns = self.__get_actuals_plus_budget_columns(
+            report_type, metric, years, period, filters
+        )
+        return self.__get_companies_quarters(
+            names,
+            matrix,
+            columns,
+            self.__get_quarters_keys(years, report_type),
+            only_loaded=True,
+        )
 
     def filter_companies(self, companies: list, years: list) -> list:
         filtered_companies = []
@@ -400,78 +274,20 @@ class QuartersReport:
                 filtered_companies.append(company)
         return filtered_companies
 
-    def __get_year_data(self, year, companies, is_first_year):
-        def initialize_year_data(is_first_year):
-            year_data = {"Q1": 0, "Q2": 0, "Q3": 0, "Q4": 0, self.full_year: 0}
-            if not is_first_year:
-                year_data["vs"] = 0
-            return year_data
-
-        def update_year_data(year_data, count, quarter):
-            for key, value in quarter.items():
-                if key != "year" and value != "NA":
-                    year_data[key] += value
-                    count[key] += 1
-
-        year_data = initialize_year_data(is_first_year)
-        count = initialize_year_data(is_first_year)
-
-        for company in companies:
-            for quarter in company["quarters"]:
-                if quarter["year"] == year:
-                    update_year_data(year_data, count, quarter)
-
-        return year_data, count
+    def __get_columns_averages(self, columns: dict) -> dict:
+        return {
+            key: self.__get_report_values(self.__round_values(get_averages(column)))
+            for key, column in columns.items()
+        }
 
-    def calculate_averages(self, companies, years):
+    def calculate_averages(self, columns: dict, years: list) -> list:
+        columns_averages = self.__get_columns_averages(columns)
         averages = []
-        first_year = True
-        for year in years:
-            year_data, count = self.__get_year_data(year, companies, first_year)
-            year_result = {}
-            for key in year_data.keys():
-                if count[key] > 0:
-                    year_result[key] = round((year_data[key] / count[key]), 2)
-                else:
-                    year_result[key] = "NA"
-
-            for key, value in year_result.items():
-                averages.append({key: value})
-
-            first_year = False
+        for index in range(len(years)):
+            keys = QUARTERS + [self.full_year] + (["vs"] if index > 0 else [])
+            averages.extend({key: columns_averages[key][index]} for key in keys)
         return averages
 
-    def add_missing_years(self, data, years, report_type):
-        first_year = years[0] if report_type != "last_twelve_months" else years[1]
-        for company in data:
-            company_quarters = company["quarters"]
-            self.__add_missing_quarters(company_quarters, years, first_year)
-            self.__sort_quarters(company_quarters)
-        return data
-
-    def __add_missing_quarters(self, company_quarters, years, first_year):
-        for year in years:
-            found = any(q["year"] == str(year) for q in company_quarters)
-            if not found:
-                quarter = self.__create_default_quarter(year, first_year)
-                company_quarters.append(quarter)
-
-    def __create_default_quarter(self, year, first_year):
-        default_quarter = {
-            "year": str(year),
-            "Q1": "NA",
-            "Q2": "NA",
-            "Q3": "NA",
-            "Q4": "NA",
-            self.full_year: "NA",
-        }
-        if year != first_year:
-            default_quarter["vs"] = "NA"
-        return default_quarter
-
-    def __sort_quarters(self, company_quarters):
-        company_quarters.sort(key=lambda x: int(x["year"]))
-
     def get_records(
         self,
         report_type: str,
@@ -589,12 +405,12 @@ class QuartersReport:
         report_type: str = None,
         subheaders_dict: dict = None,
     ) -> dict:
-        averages_dict = dict()
         data = defaultdict(dict)
         years.sort()
         averages = self.__build_default_average_object(years)
         comparison_object = {str(year): dict() for year in years}
         full_year_count = self.__get_full_year_count(period_type)
+        matrix = QuarterMatrix(years)
         for company in records:
             company_id = company.get("id")
             year = company.get("year")
@@ -605,9 +421,8 @@ class QuartersReport:
                 {period: average, self.full_year: full_year_average}
             )
             if report_type == "last_twelve_months":
-                subheaders_dict = self.build_subheaders_dict(period_type, years)
-                self.__get_ltm_full_year_base_scenarios(
-                    subheaders_dict, year, period, company_id, company, averages_dict
+                matrix.add_value(
+                    company_id, year, period, self.__get_valid_number(company)
                 )
 
             if company_id not in data.keys():
@@ -633,75 +448,73 @@ class QuartersReport:
                 company_updated.update({"quarters": quarters})
                 data.get(company_id).update(company_updated)
         if report_type == "last_twelve_months":
-            full_year_ltm = self.__update_full_year_ltm(
-                data, averages_dict, years, subheaders_dict
-            )
+            layout = get_quarters_layout(years, period_type, report_type)
+            full_year = matrix.get_last_twelve_months(period_type)
+            self.__update_full_year_ltm(data, full_year, matrix, layout)
             self.__update_comparison_ltm(
-                data, comparison_object, years, subheaders_dict
+                data,
+                comparison_object,
+                self.__round_values(get_comparison(full_year)) * 100,
+                matrix,
+                layout,
             )
-            self.__update_averages_ltm(full_year_ltm, averages)
+            self.__update_averages_ltm(get_averages(full_year), averages, years)
         self.__update_averages_with_comparison(years, averages, comparison_object)
         data.update({"averages": averages})
         return dict(data)
 
-    def __update_averages_ltm(self, full_year_ltm, averages):
-        for year in full_year_ltm:
+    def __get_valid_number(self, company: dict) -> Union[float, None]:
+        value = self.__get_valid_value(company.get("value"))
+        return value if value != "NA" else None
+
+    def __update_averages_ltm(
+        self, full_year_averages: numpy.ndarray, averages: dict, years: list
+    ) -> None:
+        for year, average in zip(years, full_year_averages.tolist()):
             if averages.get(year).get(self.full_year):
                 averages[year][self.full_year] = (
-                    self.__calculate_average(full_year_ltm.get(year))
-                    if full_year_ltm.get(year)
-                    else "NA"
+                    int(average) if not numpy.isnan(average) else "NA"
                 )
 
-    def __update_full_year_ltm(self, data, full_year_dict, years, subheaders_dict):
-        full_year_average_dict = {str(year): [] for year in years}
+    def __update_full_year_ltm(
+        self,
+        data: dict,
+        full_year: numpy.ndarray,
+        matrix: QuarterMatrix,
+        layout: QuartersLayout,
+    ) -> None:
+        full_years = self.__get_report_values(full_year)
         for company_id in data:
-            full_year_ltm = full_year_dict.get(company_id, [])
-            for quarter in data.get(company_id).get("quarters"):
+            row = matrix.id_indexes[company_id]
+            quarters = data.get(company_id).get("quarters")
+            for index, quarter in enumerate(quarters):
                 current_year = str(quarter.get("year"))
-                if full_year_ltm:
-                    valid_quarters = [
-                        quarter_value
-                        for quarter_value in full_year_ltm.get(current_year, [])
-                        if not isinstance(quarter_value, str)
-                    ]
-                    new_full_year = (
-                        sum(valid_quarters) if len(valid_quarters) == 4 else "NA"
-                    )
-                    if new_full_year != "NA":
-                        full_year_average_dict[current_year].append(new_full_year)
-                else:
-                    new_full_year = "NA"
-
-                quarter.update({self.full_year: new_full_year})
-
+                column = matrix.year_indexes[current_year]
+                quarter.update({self.full_year: full_years[row][column]})
                 new_quarter = {
                     key: value
                     for key, value in quarter.items()
-                    if key in subheaders_dict.get(current_year)
+                    if layout.has_column(current_year, key)
                 }
                 new_quarter.update({"year": current_year})
-                data[company_id]["quarters"][years.index(current_year)] = new_quarter
-
-        return full_year_average_dict
+                quarters[index] = new_quarter
 
-    def __update_comparison_ltm(self, data, comparison_object, years, subheaders_dict):
+    def __update_comparison_ltm(
+        self,
+        data: dict,
+        comparison_object: dict,
+        comparison: numpy.ndarray,
+        matrix: QuarterMatrix,
+        layout: QuartersLayout,
+    ) -> None:
+        comparisons = self.__get_report_values(comparison)
         for company_id in data:
-            quarters = data.get(company_id).get("quarters")
-            for quarter in quarters:
-                current_year = str(quarter.get("year"))
-                quarters_by_year = subheaders_dict.get(current_year)
-                if "vs" in quarters_by_year:
-                    prev_full_year = quarters[
-                        years.index(str(int(current_year) - 1))
-                    ].get(self.full_year)
-                    curren_full_year = quarter.get(self.full_year)
-                    comparison = self.__calculate_comparison_percentage(
-                        prev_full_year, curren_full_year
-                    )
-                    data[company_id]["quarters"][years.index(current_year)].update(
-                        {"vs": comparison}
-                    )
+            row = matrix.id_indexes[company_id]
+            for quarter in data.get(company_id).get("quarters"):
+                current_year = quarter.get("year")
+                if layout.has_column(current_year, "vs"):
+                    comparison = comparisons[row][matrix.year_indexes[current_year]]
+                    quarter.update({"vs": comparison})
                     comparison_object[current_year][company_id] = comparison
 
     def __update_averages_with_comparison(
@@ -740,18 +553,7 @@ class QuartersReport:
         return data
 
     def generate_headers(self, years):
-        sorted_years = sorted(years)
-        headers = ["Company"]
-        subHeaders = [""]
-        first_year = True
-        for year in sorted_years:
-            headers += [year, "", "", "", ""]
-            subHeaders += ["Q1", "Q2", "Q3", "Q4", self.full_year]
-            if not first_year:
-                headers += [""]
-                subHeaders += ["vs"]
-            first_year = False
-        return headers, subHeaders
+        return get_quarters_layout(years).get_headers()
 
     def get_actuals_or_budget_data(
         self,
@@ -770,16 +572,18 @@ class QuartersReport:
         peers = list(data.values())
         period = period if period is not None else "Q4"
         averages = self.__get_averages_for_base_scenarios(
-            report_type, default_averages, self.build_subheaders_dict(period, years)
+            report_type,
+            default_averages,
+            get_quarters_layout(years, period, report_type),
         )
         return peers, averages
 
     def __get_averages_for_base_scenarios(
-        self, report_type: str, default_averages: dict, subheaders_dict: dict
+        self, report_type: str, default_averages: dict, layout: QuartersLayout
     ) -> list:
         if report_type == "last_twelve_months":
             return self.__get_averages_for_actuals_or_budget_data_ltm(
-                default_averages, subheaders_dict
+                default_averages, layout
             )
         return self.__get_averages_for_actuals_or_budget_data(default_averages)
 
@@ -793,72 +597,31 @@ class QuartersReport:
         scenario_type: str = "actuals_budget",
     ) -> tuple:
         sorted_years = sorted(years)
-        averages = []
         filters = self.repository.add_filters(**conditions)
-        peers = self.add_vs_property(report_type, metric, sorted_years, period, filters)
-        self.filter_companies(peers, sorted_years)
-        self.add_missing_years(peers, sorted_years, report_type)
-        if report_type == "last_twelve_months":
-            self.__update_peers_actuals_budget_to_ltm(
-                peers, self.build_subheaders_dict(period, years)
-            )
+        names, matrix, columns = self.__get_actuals_plus_budget_columns(
+            report_type, metric, sorted_years, period, filters
+        )
         if report_type == "last_twelve_months":
-            averages = self.__get_averages_actuals_budget_ltm(
-                peers, self.build_subheaders_dict(period, years)
+            layout = get_quarters_layout(years, period, report_type)
+            peers = self.__get_companies_quarters(
+                names, matrix, columns, layout.subheaders
             )
+            averages = self.__get_averages_actuals_budget_ltm(columns, matrix, layout)
         else:
-            averages = self.calculate_averages(peers, sorted_years)
+            quarters_keys = self.__get_quarters_keys(sorted_years, report_type)
+            peers = self.__get_companies_quarters(names, matrix, columns, quarters_keys)
+            averages = self.calculate_averages(columns, sorted_years)
         return peers, averages
 
-    def __filter_quarter(self, quarter: dict, subheaders: dict) -> dict:
-        year = quarter["year"]
-        if year in subheaders:
-            filtered_quarter = {"year": year}
-            for key in subheaders[year]:
-                if key in quarter:
-                    filtered_quarter[key] = quarter[key]
-            return filtered_quarter
-        else:
-            return {"year": year}
-
-    def __update_company_quarters(self, data: list, subheaders: dict) -> list:
-        for company in data:
-            for i, quarter in enumerate(company["quarters"]):
-                filtered_quarter = self.__filter_quarter(quarter, subheaders)
-                company["quarters"][i] = filtered_quarter
-        return data
-
-    def __update_peers_actuals_budget_to_ltm(
-        self, data: list, subheaders: dict
+    def __get_averages_actuals_budget_ltm(
+        self, columns: dict, matrix: QuarterMatrix, layout: QuartersLayout
     ) -> list:
-        return self.__update_company_quarters(data, subheaders)
-
-    def __get_values_for_quarter_company(self, quarter, year, companies):
+        columns_averages = self.__get_columns_averages(columns)
         return [
-            quarter_company.get(quarter)
-            for company in companies
-            for quarter_company in company["quarters"]
-            if quarter_company.get("year") == year
-            and quarter_company.get(quarter) != "NA"
+            {key: columns_averages[key][matrix.year_indexes[str(year)]]}
+            for year, key in layout.columns
         ]
 
-    def __get_average_for_quarter(self, quarter, year, companies):
-        values = self.__get_values_for_quarter_company(quarter, year, companies)
-        if values:
-            return round(sum(values) / len(values), 2)
-        return "NA"
-
-    def __get_averages_actuals_budget_ltm(self, data: list, subheaders: list) -> list:
-        averages = []
-        for subheader in subheaders:
-            quarter_averages = defaultdict(str)
-            for quarter in subheaders[subheader]:
-                quarter_averages[quarter] = self.__get_average_for_quarter(
-                    quarter, subheader, data
-                )
-                averages.append({quarter: quarter_averages[quarter]})
-        return averages
-
     def __get_averages_for_actuals_or_budget_data(self, defaul_averages: dict) -> list:
         averages = []
         for year in defaul_averages:
@@ -867,15 +630,12 @@ class QuartersReport:
         return averages
 
     def __get_averages_for_actuals_or_budget_data_ltm(
-        self, defaul_averages: dict, subheaders_dict: dict = None
+        self, defaul_averages: dict, layout: QuartersLayout
     ) -> list:
-        averages = []
-        for year in subheaders_dict.keys():
-            for period in subheaders_dict.get(year):
-                averages.append(
-                    {period: defaul_averages.get(year, dict()).get(period, "NA")}
-                )
-        return averages
+        return [
+            {key: defaul_averages.get(year, dict()).get(key, "NA")}
+            for year, key in layout.columns
+        ]
 
     def get_actuals_plus_budget_data(
         self,
@@ -958,20 +718,14 @@ class QuartersReport:
         report_type: str,
         period: str = "Q4",
     ):
-        if scenario_type == "actuals_budget":
-            base_scenario_func = self.__get_base_metric_with_no_standard_scenario
-        else:
-            base_scenario_func = self.__get_base_metric_with_base_scenario
-
         new_bookings_years = [str(int(years[0]) - 1)] + years
-        new_bookings = base_scenario_func(
-            "new_bookings",
+        new_bookings = self.__get_base_metrics(
+            {"new_bookings": new_bookings_years},
             scenario_type,
-            new_bookings_years,
             filters,
             report_type,
             period,
-        )
+        )["new_bookings"]
 
         return self.process_new_bookings_growth(
             years, report_type, scenario_type, new_bookings, period
@@ -1113,25 +867,20 @@ class QuartersReport:
         report_type: str,
         period: str = "Q4",
     ):
-        if scenario_type == "actuals_budget":
-            base_scenario_func = self.__get_base_metric_with_no_standard_scenario
-        else:
-            base_scenario_func = self.__get_base_metric_with_base_scenario
-
-        growth_metrics = self.get_growth_rate_records(
-            scenario_type, years, filters, report_type, period
-        )
-        if scenario_type == "actuals_budget":
-            growth_metrics = {record.get("id"): record for record in growth_metrics[0]}
-        margin_metrics = base_scenario_func(
-            "ebitda_margin",
+        revenue_years = [str(int(years[0]) - 1)] + years
+        base_metrics = self.__get_base_metrics(
+            {"revenue": revenue_years, "ebitda_margin": years},
             scenario_type,
-            years,
             filters,
             report_type,
             period,
-            is_calculated=True,
         )
+        growth_metrics = self.process_growth_rate(
+            years, report_type, scenario_type, base_metrics["revenue"], period
+        )
+        if scenario_type == "actuals_budget":
+            growth_metrics = {record.get("id"): record for record in growth_metrics[0]}
+        margin_metrics = base_metrics["ebitda_margin"]
         return self.process_rule_of_40(
             years, report_type, scenario_type, growth_metrics, margin_metrics, period
         )
@@ -1250,15 +999,10 @@ class QuartersReport:
         report_type: str,
         period: str = "Q4",
     ):
-        if scenario_type == "actuals_budget":
-            base_scenario_func = self.__get_base_metric_with_no_standard_scenario
-        else:
-            base_scenario_func = self.__get_base_metric_with_base_scenario
-
         revenue_years = [str(int(years[0]) - 1)] + years
-        revenue = base_scenario_func(
-            "revenue", scenario_type, revenue_years, filters, report_type, period
-        )
+        revenue = self.__get_base_metrics(
+            {"revenue": revenue_years}, scenario_type, filters, report_type, period
+        )["revenue"]
 
         return self.process_growth_rate(
             years, report_type, scenario_type, revenue, period
@@ -1454,25 +1198,25 @@ class QuartersReport:
                     {company_id: quarter["vs"]}
                 )
 
-    def __get_base_metric_with_base_scenario(
+    def __get_base_metrics_with_base_scenario(
         self,
-        metric: str,
+        metrics_years: dict,
         scenario_type: str,
-        years: list,
         filters: dict,
         report_type: str,
         period: str = "Q4",
-        is_calculated: bool = False,
-    ):
-        metric_name = metric if is_calculated else f"{scenario_type}-{metric}"
-        metric_records = self.repository.get_metric_records_with_base_scenarios(
-            metric_name, scenario_type, years, filters, report_type, period
-        )
-        metric_data = self.process_standard_metrics(
-            metric_records, years, period, report_type
+    ) -> dict:
+        metrics_records = self.repository.get_base_metrics_records(
+            metrics_years, scenario_type, filters, report_type, period
         )
-        metric_data.pop("averages")
-        return metric_data
+        metrics_data = dict()
+        for metric, years in metrics_years.items():
+            metric_data = self.process_standard_metrics(
+                metrics_records.get(metric, []), years, period, report_type
+            )
+            metric_data.pop("averages")
+            metrics_data[metric] = metric_data
+        return metrics_data
 
     def __get_base_metric_with_no_standard_scenario(
         self,
@@ -1482,7 +1226,6 @@ class QuartersReport:
         filters: dict,
         report_type: str,
         period: str = "Q4",
-        is_calculated: bool = False,
     ):
         metric_data = self.actuals_budget_data(
             report_type, metric, years, period, filters, scenario_type
@@ -1490,6 +1233,25 @@ class QuartersReport:
         metric_dict = {company.get("id"): company for company in metric_data[0]}
         return metric_dict
 
+    def __get_base_metrics(
+        self,
+        metrics_years: dict,
+        scenario_type: str,
+        filters: dict,
+        report_type: str,
+        period: str = "Q4",
+    ) -> dict:
+        if scenario_type != "actuals_budget":
+            return self.__get_base_metrics_with_base_scenario(
+                metrics_years, scenario_type, filters, report_type, period
+            )
+        return {
+            metric: self.__get_base_metric_with_no_standard_scenario(
+                metric, scenario_type, years, filters, report_type, period
+            )
+            for metric, years in metrics_years.items()
+        }
+
     def get_retention_records_base_scenarios(
         self,
         metric: str,
@@ -1499,37 +1261,23 @@ class QuartersReport:
         report_type: str,
         period: str = "Q4",
     ):
-        if scenario_type == "actuals_budget":
-            base_scenario_func = self.__get_base_metric_with_no_standard_scenario
-        else:
-            base_scenario_func = self.__get_base_metric_with_base_scenario
-
-        run_rate_revenue_years = [str(int(years[0]) - 1)] + years[:-1]
-        run_rate_revenue = base_scenario_func(
-            "run_rate_revenue",
-            scenario_type,
-            run_rate_revenue_years,
-            filters,
-            report_type,
-            period,
-        )
-        losses_and_downgrades = base_scenario_func(
-            "losses_and_downgrades", scenario_type, years, filters, report_type, period
-        )
-
-        upsells = None
+        metrics_years = {
+            "run_rate_revenue": [str(int(years[0]) - 1)] + years[:-1],
+            "losses_and_downgrades": years,
+        }
         if metric == "net_retention":
-            upsells = base_scenario_func(
-                "upsells", scenario_type, years, filters, report_type, period
-            )
+            metrics_years["upsells"] = years
+        base_metrics = self.__get_base_metrics(
+            metrics_years, scenario_type, filters, report_type, period
+        )
         return self.process_retention_metrics(
             metric,
             years,
             report_type,
             scenario_type,
-            run_rate_revenue,
-            losses_and_downgrades,
-            upsells,
+            base_metrics["run_rate_revenue"],
+            base_metrics["losses_and_downgrades"],
+            base_metrics.get("upsells"),
             period,
         )
 
@@ -1563,7 +1311,7 @@ class QuartersReport:
         averages = records.pop("averages")
         years = [str(int(years[0]) - 1)] + years
         averages = self.__get_averages_for_base_scenarios(
-            report_type, averages, self.build_subheaders_dict(period, years)
+            report_type, averages, get_quarters_layout(years, period, report_type)
         )
         peers = list(records.values())
         return peers, averages
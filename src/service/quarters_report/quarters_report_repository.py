@@ -1,8 +1,196 @@
+from collections import defaultdict
+from functools import partial
 from base_exception import AppError
 from app_names import TableNames, ScenarioNames, MetricNames
 from base_metrics_config_name import METRICS_CONFIG_NAME
 from query_builder import QuerySQLBuilder
+from query_shape import QueryShape
 from response_sql import ResponseSQL
+from metric_records_cache import (
+    METRIC_RECORDS_VERSION,
+    add_metric_records,
+    get_cached_metric_records,
+    get_filters_key,
+)
+
+COMPANY_TAG_SAMPLE_TABLE = (
+    f"( SELECT * FROM {TableNames.COMPANY_TAG} LIMIT 1) as company_tag"
+)
+
+
+def get_metric_values_shape(
+    tag_table: str, tag_join_type: QuerySQLBuilder.JoinType
+) -> QueryShape:
+    return (
+        QueryShape(TableNames.COMPANY)
+        .join(
+            tag_table,
+            f"{TableNames.COMPANY_TAG}.company_id",
+            f"{TableNames.COMPANY}.id",
+            tag_join_type,
+        )
+        .join(
+            TableNames.TAG,
+            f"{TableNames.TAG}.id",
+            f"{TableNames.COMPANY_TAG}.tag_id",
+            tag_join_type,
+        )
+        .join(
+            TableNames.SCENARIO,
+            f"{TableNames.SCENARIO}.company_id",
+            f"{TableNames.COMPANY}.id",
+        )
+        .join(
+            TableNames.PERIOD,
+            f"{TableNames.PERIOD}.id",
+            f"{TableNames.SCENARIO}.period_id",
+        )
+        .join(
+            TableNames.SCENARIO_METRIC,
+            f"{TableNames.SCENARIO_METRIC}.scenario_id",
+            f"{TableNames.SCENARIO}.id",
+        )
+        .join(
+            TableNames.METRIC,
+            f"{TableNames.METRIC}.id",
+            f"{TableNames.SCENARIO_METRIC}.metric_id",
+        )
+    )
+
+
+METRIC_VALUES_SHAPES = {
+    (tag_table, tag_join_type): get_metric_values_shape(tag_table, tag_join_type)
+    for tag_table in (f"{TableNames.COMPANY_TAG}", COMPANY_TAG_SAMPLE_TABLE)
+    for tag_join_type in (QuerySQLBuilder.JoinType.JOIN, QuerySQLBuilder.JoinType.LEFT)
+}
+
+
+def get_arguments(
+    filters: dict,
+    metric: str = None,
+    scenario_type: str = None,
+    years: list = [],
+    report_type: str = None,
+    period: str = None,
+) -> dict:
+    arguments = {"filters": filters}
+    if metric:
+        arguments["metric"] = metric
+    if scenario_type:
+        arguments["scenario_type"] = scenario_type
+    if years:
+        arguments["years"] = years
+    if report_type:
+        arguments["report_type"] = report_type
+    if period:
+        arguments["period"] = period
+    return arguments
+
+
+def get_ratio_arguments(dividend: str, divisor: str, **kwargs) -> dict:
+    arguments = get_arguments(**kwargs)
+    arguments.update({"dividend": dividend, "divisor": divisor})
+    return arguments
+
+
+def get_scenario_arguments(scenario: str, **kwargs) -> dict:
+    kwargs["scenario_type"] = scenario
+    return get_arguments(**kwargs)
+
+
+def get_base_scenarios_vs_budget_arguments(
+    metric: str,
+    filters: dict,
+    scenario_type: str = None,
+    years: list = [],
+    report_type: str = None,
+    period: str = None,
+) -> dict:
+    return get_arguments(
+        filters,
+        metric,
+        scenario_type=period,
+        years=years,
+        report_type=scenario_type,
+        period=report_type,
+    )
+
+
+METRIC_NAMES = {
+    metric_alias: metric_name
+    for metric_name, metric_alias in METRICS_CONFIG_NAME.items()
+}
+
+PERCENTAGE_OF_REVENUE_METRICS = {"ebitda_margin": "ebitda"}
+
+CALCULATED_METRIC_FUNCTIONS = {
+    "ebitda_margin": ("get_ebitda_margin_metric", get_arguments),
+    "gross_margin": ("get_gross_margin", get_arguments),
+    "sales_and_marketing": (
+        "get_metric_as_percentage_of_revenue",
+        partial(get_arguments, metric=MetricNames.SALES_AND_MARKETING),
+    ),
+    "general_and_admin": (
+        "get_metric_as_percentage_of_revenue",
+        partial(get_arguments, metric=MetricNames.GENERAL_AND_ADMINISTRATION),
+    ),
+    "research_and_development": (
+        "get_metric_as_percentage_of_revenue",
+        partial(get_arguments, metric=MetricNames.RESEARCH_AND_DEVELOPMENT),
+    ),
+    "clv_cac_ratio": (
+        "get_metric_ratio",
+        partial(get_ratio_arguments, dividend="CLV", divisor="CAC"),
+    ),
+    "cac_ratio": (
+        "get_metric_ratio",
+        partial(get_ratio_arguments, dividend="CAC", divisor="CAV"),
+    ),
+    "revenue_per_employee": ("get_revenue_per_employee", get_arguments),
+    "opex_as_revenue": ("get_opex_as_revenue", get_arguments),
+    "debt_ebitda": ("get_debt_ebitda", get_arguments),
+}
+
+ACTUALS_PLUS_BUDGET_METRIC_FUNCTIONS = {
+    **CALCULATED_METRIC_FUNCTIONS,
+    **{
+        metric_alias: (
+            "get_actuals_plus_budget_metrics_query",
+            partial(get_scenario_arguments, "actuals_budget", metric=metric_name),
+        )
+        for metric_alias, metric_name in METRIC_NAMES.items()
+    },
+    "gross_profit": ("get_gross_profit", get_arguments),
+    "revenue_vs_budget": (
+        "get_actuals_vs_budget_metric",
+        partial(get_arguments, metric="Revenue"),
+    ),
+    "ebitda_vs_budget": (
+        "get_actuals_vs_budget_metric",
+        partial(get_arguments, metric="Ebitda"),
+    ),
+}
+
+BASE_SCENARIOS_METRIC_FUNCTIONS = {
+    **CALCULATED_METRIC_FUNCTIONS,
+    "gross_profit": ("get_gross_profit", get_arguments),
+    **{
+        f"{scenario_type}-{metric_alias}": (
+            "get_base_metric_records",
+            partial(get_scenario_arguments, scenario_type, metric=metric_name),
+        )
+        for scenario_type in (ScenarioNames.ACTUALS, ScenarioNames.BUDGET)
+        for metric_alias, metric_name in METRIC_NAMES.items()
+    },
+    "revenue_vs_budget": (
+        "get_actuals_vs_budget_metric",
+        partial(get_base_scenarios_vs_budget_arguments, "Revenue"),
+    ),
+    "ebitda_vs_budget": (
+        "get_actuals_vs_budget_metric",
+        partial(get_base_scenarios_vs_budget_arguments, "Ebitda"),
+    ),
+}
 
 
 class QuartersReportRepository:
@@ -14,36 +202,7 @@ class QuartersReportRepository:
         self.response_sql = response_sql
         self.logger = logger
         self.periods = ["Q1", "Q2", "Q3", "Q4"]
-
-    def __get_arguments(
-        self,
-        filters: dict,
-        metric: str = None,
-        scenario_type: str = None,
-        years: list = [],
-        report_type: str = None,
-        period: str = None,
-    ) -> dict:
-        arguments = {"filters": filters}
-        if metric:
-            arguments["metric"] = metric
-        if scenario_type:
-            arguments["scenario_type"] = scenario_type
-        if years:
-            arguments["years"] = years
-        if report_type:
-            arguments["report_type"] = report_type
-        if period:
-            arguments["period"] = period
-        return arguments
-
-    def __get_metric_names_config(
-        self,
-    ) -> dict:
-        return dict(
-            (metric_alias, metric_name)
-            for metric_name, metric_alias in METRICS_CONFIG_NAME.items()
-        )
+        self.records_version = None
 
     def add_filters(self, **kwargs) -> dict:
         filters = dict()
@@ -55,33 +214,59 @@ class QuartersReportRepository:
                 filters[k] = values
         return filters
 
+    def __get_view_key(self, report_type: str = None, period: str = None) -> tuple:
+        return (report_type, period) if report_type == "year_to_date" else None
+
+    def __get_view_records(
+        self, records: list, report_type: str = None, period: str = None
+    ) -> list:
+        if report_type != "year_to_date" or period is None:
+            return records
+        periods = self.periods[: self.periods.index(period) + 1]
+        return [record for record in records if record.get("period_name") in periods]
+
+    def get_records_version(self):
+        query = (
+            self.query_builder.add_table_name(TableNames.DATA_VERSION)
+            .add_select_conditions(["version"])
+            .add_sql_where_equal_condition({"name": f"'{METRIC_RECORDS_VERSION}'"})
+            .build()
+            .get_query()
+        )
+        return self.session.execute(query).scalar()
+
+    def __get_cached_records(self, key: tuple, years: list, load_records) -> list:
+        try:
+            if self.records_version is None:
+                self.records_version = self.get_records_version()
+        except Exception as error:
+            self.logger.error(error)
+            return load_records()
+        records = get_cached_metric_records(key, years, self.records_version)
+        if records is None:
+            records = load_records()
+            if records:
+                add_metric_records(key, years, records, self.records_version)
+        return records
+
     def __get_periods_conditions_array(self, index: int = None) -> list:
         periods_list = self.periods if index is None else self.periods[: index + 1]
         return [f"'{period}'" for period in periods_list]
 
     def __get_tag_join_type(self, where_conditions: dict):
         tag_join_type = (
-            self.query_builder.JoinType.JOIN
+            QuerySQLBuilder.JoinType.JOIN
             if where_conditions.get("tag")
-            else self.query_builder.JoinType.LEFT
+            else QuerySQLBuilder.JoinType.LEFT
         )
         return tag_join_type
 
-    def __get_company_tag_join_clause(self, table: str = f"{TableNames.COMPANY_TAG}"):
-        return {
-            table: {
-                "from": f"{TableNames.COMPANY_TAG}.company_id",
-                "to": f"{TableNames.COMPANY}.id",
-            }
-        }
-
-    def __get_tag_join_clause(self):
-        return {
-            f"{TableNames.TAG}": {
-                "from": f"{TableNames.TAG}.id",
-                "to": f"{TableNames.COMPANY_TAG}.tag_id",
-            }
-        }
+    def __get_metric_values_shape(
+        self, where_conditions: dict, tag_table: str = f"{TableNames.COMPANY_TAG}"
+    ) -> QueryShape:
+        shape_key = (tag_table, self.__get_tag_join_type(where_conditions))
+        shape = METRIC_VALUES_SHAPES.get(shape_key)
+        return shape if shape else get_metric_values_shape(*shape_key)
 
     def __get_base_where_conditions(
         self,
@@ -123,54 +308,11 @@ class QuartersReportRepository:
         group_by_conditions: list,
         tag_table=f"{TableNames.COMPANY_TAG}",
     ) -> str:
-        tag_join_type = self.__get_tag_join_type(where_conditions)
         return (
-            self.query_builder.add_table_name(TableNames.COMPANY)
-            .add_select_conditions(select_conditions)
-            .add_join_clause(
-                self.__get_company_tag_join_clause(tag_table),
-                tag_join_type,
-            )
-            .add_join_clause(
-                self.__get_tag_join_clause(),
-                tag_join_type,
-            )
-            .add_join_clause(
-                {
-                    f"{TableNames.SCENARIO}": {
-                        "from": f"{TableNames.SCENARIO}.company_id",
-                        "to": f"{TableNames.COMPANY}.id",
-                    }
-                },
-            )
-            .add_join_clause(
-                {
-                    f"{TableNames.PERIOD}": {
-                        "from": f"{TableNames.PERIOD}.id",
-                        "to": f"{TableNames.SCENARIO}.period_id",
-                    }
-                },
-            )
-            .add_join_clause(
-                {
-                    f"{TableNames.SCENARIO_METRIC}": {
-                        "from": f"{TableNames.SCENARIO_METRIC}.scenario_id",
-                        "to": f"{TableNames.SCENARIO}.id",
-                    }
-                },
-            )
-            .add_join_clause(
-                {
-                    f"{TableNames.METRIC}": {
-                        "from": f"{TableNames.METRIC}.id",
-                        "to": f"{TableNames.SCENARIO_METRIC}.metric_id",
-                    }
-                },
-            )
-            .add_sql_where_equal_condition(where_conditions)
-            .add_sql_group_by_condition(group_by_conditions)
-            .build()
-            .get_query()
+            self.__get_metric_values_shape(where_conditions, tag_table)
+            .select(select_conditions)
+            .group(group_by_conditions)
+            .build(where_conditions)
         )
 
     def get_quarters_total_query(
@@ -309,9 +451,7 @@ class QuartersReportRepository:
             where_conditions = self.__get_base_where_conditions(
                 metric, scenario_type, years, filters, report_type, period
             )
-            company_tag_table = (
-                f"( SELECT * FROM {TableNames.COMPANY_TAG} LIMIT 1) as company_tag"
-            )
+            company_tag_table = COMPANY_TAG_SAMPLE_TABLE
 
             full_year_table = self.get_quarters_total_query(
                 metric,
@@ -347,82 +487,30 @@ class QuartersReportRepository:
             AND {TableNames.SCENARIO}.name = total_quarters.scenario """
             quarters_average_join_condition = f""" average.scenario
             AND {TableNames.PERIOD}.period_name = average.period """
-            tag_join_type = self.__get_tag_join_type(where_conditions)
             query = (
-                self.query_builder.add_table_name(f"{TableNames.COMPANY}")
-                .add_select_conditions(columns)
-                .add_join_clause(
-                    self.__get_company_tag_join_clause(),
-                    tag_join_type,
-                )
-                .add_join_clause(
-                    self.__get_tag_join_clause(),
-                    tag_join_type,
-                )
-                .add_join_clause(
-                    {
-                        f"{TableNames.SCENARIO}": {
-                            "from": f"{TableNames.SCENARIO}.company_id",
-                            "to": f"{TableNames.COMPANY}.id",
-                        }
-                    },
-                )
-                .add_join_clause(
-                    {
-                        f"{TableNames.PERIOD}": {
-                            "from": f"{TableNames.PERIOD}.id",
-                            "to": f"{TableNames.SCENARIO}.period_id",
-                        }
-                    },
-                )
-                .add_join_clause(
-                    {
-                        f"{TableNames.SCENARIO_METRIC}": {
-                            "from": f"{TableNames.SCENARIO_METRIC}.scenario_id",
-                            "to": f"{TableNames.SCENARIO}.id",
-                        }
-                    },
-                )
-                .add_join_clause(
-                    {
-                        f"{TableNames.METRIC}": {
-                            "from": f"{TableNames.METRIC}.id",
-                            "to": f"{TableNames.SCENARIO_METRIC}.metric_id",
-                        }
-                    },
-                )
-                .add_join_clause(
-                    {
-                        f"( {full_year_table} ) total_quarters": {
-                            "from": f"{TableNames.COMPANY}.id",
-                            "to": full_year_join_condition,
-                        }
-                    }
+                self.__get_metric_values_shape(where_conditions)
+                .select(columns)
+                .join(
+                    f"( {full_year_table} ) total_quarters",
+                    f"{TableNames.COMPANY}.id",
+                    full_year_join_condition,
                 )
-                .add_join_clause(
-                    {
-                        f"( {quarters_averages_table} ) average": {
-                            "from": f"{TableNames.SCENARIO}.name",
-                            "to": quarters_average_join_condition,
-                        }
-                    }
+                .join(
+                    f"( {quarters_averages_table} ) average",
+                    f"{TableNames.SCENARIO}.name",
+                    quarters_average_join_condition,
                 )
-                .add_join_clause(
-                    {
-                        f"( {full_year_averages_table} ) full_year_average": {
-                            "from": f"{TableNames.SCENARIO}.name",
-                            "to": "full_year_average.scenario",
-                        }
-                    },
-                    self.query_builder.JoinType.LEFT,
+                .join(
+                    f"( {full_year_averages_table} ) full_year_average",
+                    f"{TableNames.SCENARIO}.name",
+                    "full_year_average.scenario",
+                    QuerySQLBuilder.JoinType.LEFT,
                 )
-                .add_sql_where_equal_condition(where_conditions)
-                .add_sql_order_by_condition(
+                .order(
                     [f"{TableNames.COMPANY}.name", f"{TableNames.SCENARIO}.name"],
-                    self.query_builder.Order.ASC,
+                    QuerySQLBuilder.Order.ASC,
                 )
-                .build()
-                .get_query()
+                .build(where_conditions)
             )
             result = self.session.execute(query).fetchall()
             return self.response_sql.process_query_list_results(result)
@@ -431,13 +519,158 @@ class QuartersReportRepository:
             self.logger.error(error)
             return []
 
+    def get_base_metrics_pivot_query(
+        self,
+        metrics: list,
+        scenario_type: str,
+        years: list,
+        filters: dict,
+        report_type: str = None,
+        period: str = None,
+    ) -> str:
+        from_count = len(scenario_type) + 2
+        where_conditions = self.__get_base_where_conditions(
+            None, scenario_type, years, filters, report_type, period
+        )
+        where_conditions[f"{TableNames.METRIC}.name"] = [
+            f"'{METRIC_NAMES[metric]}'" for metric in metrics
+        ]
+        columns = [
+            f"{TableNames.COMPANY}.id",
+            f"{TableNames.COMPANY}.name",
+            f"{TableNames.SCENARIO}.name as scenario",
+            f"substring({TableNames.SCENARIO}.name from {from_count})::int as year",
+            f"{TableNames.PERIOD}.period_name",
+        ]
+        for metric in metrics:
+            metric_filter = (
+                f"FILTER (WHERE {TableNames.METRIC}.name = '{METRIC_NAMES[metric]}')"
+            )
+            columns.extend(
+                [
+                    f"MAX({TableNames.METRIC}.value) {metric_filter} as {metric}",
+                    f"COUNT(DISTINCT {TableNames.METRIC}.id) {metric_filter} "
+                    f"as {metric}_count",
+                ]
+            )
+        return (
+            self.__get_metric_values_shape(where_conditions)
+            .select(columns)
+            .group(
+                [
+                    f"{TableNames.COMPANY}.id",
+                    f"{TableNames.COMPANY}.name",
+                    f"{TableNames.SCENARIO}.name",
+                    f"{TableNames.PERIOD}.period_name",
+                ]
+            )
+            .order(
+                [f"{TableNames.COMPANY}.name", f"{TableNames.SCENARIO}.name"],
+                QuerySQLBuilder.Order.ASC,
+            )
+            .build(where_conditions)
+        )
+
+    def __get_pivot_value(self, record: dict, metric: str):
+        base_metric = PERCENTAGE_OF_REVENUE_METRICS.get(metric)
+        if not base_metric:
+            return record.get(metric)
+        value = record.get(base_metric)
+        revenue = record.get("revenue")
+        return value * 100 / revenue if value is not None and revenue else None
+
+    def __get_pivot_metric_records(
+        self, records: list, metric: str, years: list
+    ) -> list:
+        base_metric = PERCENTAGE_OF_REVENUE_METRICS.get(metric, metric)
+        years = [int(year) for year in years]
+        metric_records = [
+            {
+                "id": record.get("id"),
+                "name": record.get("name"),
+                "scenario": record.get("scenario"),
+                "metric": METRIC_NAMES[base_metric],
+                "year": record.get("year"),
+                "period_name": record.get("period_name"),
+                "value": self.__get_pivot_value(record, metric),
+            }
+            for record in records
+            if record.get("year") in years and record.get(f"{base_metric}_count")
+        ]
+        totals = defaultdict(lambda: {"full_year": None, "quarters_count": 0})
+        for record in metric_records:
+            total = totals[(record["id"], record["scenario"])]
+            total["quarters_count"] += 1
+            if record["value"] is not None:
+                total["full_year"] = record["value"] + (total["full_year"] or 0)
+        for record in metric_records:
+            record.update(totals[(record["id"], record["scenario"])])
+        return metric_records
+
+    def __get_base_metrics_pivot_records(
+        self, metrics: list, scenario_type: str, years: list, filters: dict
+    ) -> list:
+        query = self.get_base_metrics_pivot_query(
+            metrics, scenario_type, years, filters
+        )
+        result = self.session.execute(query).fetchall()
+        return self.response_sql.process_query_list_results(result)
+
+    def get_base_metrics_records(
+        self,
+        metrics_years: dict,
+        scenario_type: str,
+        filters: dict,
+        report_type: str = None,
+        period: str = None,
+    ) -> dict:
+        try:
+            base_metrics = set()
+            for metric in metrics_years:
+                if metric in PERCENTAGE_OF_REVENUE_METRICS:
+                    base_metrics.update(
+                        [PERCENTAGE_OF_REVENUE_METRICS[metric], "revenue"]
+                    )
+                else:
+                    base_metrics.add(metric)
+            years = sorted(
+                {str(year) for years in metrics_years.values() for year in years}
+            )
+            records = self.__get_view_records(
+                self.__get_cached_records(
+                    (
+                        "base_metrics",
+                        tuple(sorted(base_metrics)),
+                        scenario_type,
+                        get_filters_key(filters),
+                    ),
+                    years,
+                    partial(
+                        self.__get_base_metrics_pivot_records,
+                        sorted(base_metrics),
+                        scenario_type,
+                        years,
+                        filters,
+                    ),
+                ),
+                report_type,
+                period,
+            )
+            return {
+                metric: self.__get_pivot_metric_records(records, metric, years)
+                for metric, years in metrics_years.items()
+            }
+        except Exception as error:
+            self.logger.error(error)
+            return {metric: [] for metric in metrics_years}
+
     def get_actuals_plus_budget_metrics_query(
         self,
         metric: str,
         years: list,
         filters: dict,
         scenario_type: str,
-        report_type: str,
+        report_type: str = None,
         period: str = None,
     ) -> list:
         try:
@@ -453,10 +686,9 @@ class QuartersReportRepository:
                 f"substring({TableNames.SCENARIO}.name from '.*([0-9]{{4}})$')::int": years,
             }
             where_conditions.update(filters)
-            tag_join_type = self.__get_tag_join_type(where_conditions)
             query = (
-                self.query_builder.add_table_name(TableNames.COMPANY)
-                .add_select_conditions(
+                self.__get_metric_values_shape(where_conditions)
+                .select(
                     [
                         f"{TableNames.COMPANY}.id",
                         f"{TableNames.COMPANY}.name",
@@ -466,48 +698,7 @@ class QuartersReportRepository:
                         f"{TableNames.METRIC}.value",
                     ]
                 )
-                .add_join_clause(
-                    self.__get_company_tag_join_clause(),
-                    tag_join_type,
-                )
-                .add_join_clause(
-                    self.__get_tag_join_clause(),
-                    tag_join_type,
-                )
-                .add_join_clause(
-                    {
-                        f"{TableNames.SCENARIO}": {
-                            "from": f"{TableNames.SCENARIO}.company_id",
-                            "to": f"{TableNames.COMPANY}.id",
-                        }
-                    },
-                )
-                .add_join_clause(
-                    {
-                        f"{TableNames.PERIOD}": {
-                            "from": f"{TableNames.PERIOD}.id",
-                            "to": f"{TableNames.SCENARIO}.period_id",
-                        }
-                    },
-                )
-                .add_join_clause(
-                    {
-                        f"{TableNames.SCENARIO_METRIC}": {
-                            "from": f"{TableNames.SCENARIO_METRIC}.scenario_id",
-                            "to": f"{TableNames.SCENARIO}.id",
-                        }
-                    },
-                )
-                .add_join_clause(
-                    {
-                        f"{TableNames.METRIC}": {
-                            "from": f"{TableNames.METRIC}.id",
-                            "to": f"{TableNames.SCENARIO_METRIC}.metric_id",
-                        }
-                    },
-                )
-                .add_sql_where_equal_condition(where_conditions)
-                .add_sql_group_by_condition(
+                .group(
                     [
                         f"{TableNames.COMPANY}.id",
                         f"{TableNames.SCENARIO}.name",
@@ -516,8 +707,7 @@ class QuartersReportRepository:
                         f"{TableNames.METRIC}.value",
                     ]
                 )
-                .build()
-                .get_query()
+                .build(where_conditions)
             )
             scenario_results = self.session.execute(query).fetchall()
             return self.response_sql.process_query_list_results(scenario_results)
@@ -525,31 +715,6 @@ class QuartersReportRepository:
             self.logger.info(error)
             return []
 
-    def get_base_functions_metric(
-        self,
-        filters: dict,
-        scenario_type: str,
-        years: list,
-        report_type: str = None,
-        period: str = None,
-    ) -> dict:
-        metric_names = self.__get_metric_names_config()
-
-        return {
-            f"{scenario_type}-{metric}": {
-                "function": self.get_base_metric_records,
-                "arguments": self.__get_arguments(
-                    filters,
-                    metric_names[metric],
-                    scenario_type,
-                    years,
-                    report_type,
-                    period,
-                ),
-            }
-            for metric in metric_names
-        }
-
     def __get_base_table_for_calculated_metrics(
         self, select_value: list, main_table: str
     ):
@@ -817,10 +982,9 @@ class QuartersReportRepository:
         if scenario_condition:
             where_conditions.update(scenario_condition)
 
-        tag_join_type = self.__get_tag_join_type(where_conditions)
         query = (
-            self.query_builder.add_table_name(TableNames.COMPANY)
-            .add_select_conditions(
+            self.__get_metric_values_shape(where_conditions)
+            .select(
                 [
                     f"{TableNames.COMPANY}.id",
                     f"{TableNames.COMPANY}.name",
@@ -831,48 +995,7 @@ class QuartersReportRepository:
                     f"{TableNames.METRIC}.value",
                 ]
             )
-            .add_join_clause(
-                self.__get_company_tag_join_clause(),
-                tag_join_type,
-            )
-            .add_join_clause(
-                self.__get_tag_join_clause(),
-                tag_join_type,
-            )
-            .add_join_clause(
-                {
-                    f"{TableNames.SCENARIO}": {
-                        "from": f"{TableNames.SCENARIO}.company_id",
-                        "to": f"{TableNames.COMPANY}.id",
-                    }
-                },
-            )
-            .add_join_clause(
-                {
-                    f"{TableNames.PERIOD}": {
-                        "from": f"{TableNames.PERIOD}.id",
-                        "to": f"{TableNames.SCENARIO}.period_id",
-                    }
-                },
-            )
-            .add_join_clause(
-                {
-                    f"{TableNames.SCENARIO_METRIC}": {
-                        "from": f"{TableNames.SCENARIO_METRIC}.scenario_id",
-                        "to": f"{TableNames.SCENARIO}.id",
-                    }
-                },
-            )
-            .add_join_clause(
-                {
-                    f"{TableNames.METRIC}": {
-                        "from": f"{TableNames.METRIC}.id",
-                        "to": f"{TableNames.SCENARIO_METRIC}.metric_id",
-                    }
-                },
-            )
-            .add_sql_where_equal_condition(where_conditions)
-            .add_sql_group_by_condition(
+            .group(
                 [
                     f"{TableNames.COMPANY}.id",
                     f"{TableNames.SCENARIO}.name",
@@ -881,8 +1004,7 @@ class QuartersReportRepository:
                     f"{TableNames.METRIC}.value",
                 ]
             )
-            .build()
-            .get_query()
+            .build(where_conditions)
         )
         return query
 
@@ -1322,205 +1444,8 @@ class QuartersReportRepository:
             years, "Ebitda", filters, scenario_type, report_type, period
         )
 
-    def __get_ratio_arguments(
-        self,
-        years: list,
-        filters: dict,
-        scenario_type: str = None,
-        dividend: str = None,
-        divisor: str = None,
-        report_type: str = None,
-        period: str = None,
-    ) -> dict:
-        arguments = {"filters": filters}
-        if dividend:
-            arguments["dividend"] = dividend
-        if divisor:
-            arguments["divisor"] = divisor
-        if years:
-            arguments["years"] = years
-        if scenario_type:
-            arguments["scenario_type"] = scenario_type
-        if report_type:
-            arguments["report_type"] = report_type
-        if period:
-            arguments["period"] = period
-        return arguments
-
-    def get_actuals_plus_budget_base_functions_metric(
-        self,
-        filters: dict,
-        years: list,
-        report_type: str = None,
-        period: str = None,
-        scenario_type: str = "actuals_budget",
-    ) -> dict:
-        metric_names = self.__get_metric_names_config()
-
-        return {
-            f"{metric}": {
-                "function": self.get_actuals_plus_budget_metrics_query,
-                "arguments": self.__get_arguments(
-                    metric=metric_names[metric],
-                    years=years,
-                    filters=filters,
-                    scenario_type=scenario_type,
-                    report_type=report_type,
-                    period=period,
-                ),
-            }
-            for metric in metric_names
-        }
-
-    def __get_gross_profit_functions_metric(
-        self, years: list, filters: dict, report_type: str, period: str
-    ) -> dict:
-        return {
-            "gross_profit": {
-                "function": self.get_gross_profit,
-                "arguments": self.__get_arguments(
-                    years=years, filters=filters, report_type=report_type, period=period
-                ),
-            }
-        }
-
-    def __get_actuals_vs_budget_functions_metric(
-        self,
-        years: list,
-        filters: dict,
-        report_type: str,
-        period: str,
-        scenario_type: str = "actuals_budget",
-    ) -> dict:
-        return {
-            "revenue_vs_budget": {
-                "function": self.get_actuals_vs_budget_metric,
-                "arguments": self.__get_arguments(
-                    years=years,
-                    filters=filters,
-                    report_type=report_type,
-                    period=period,
-                    scenario_type=scenario_type,
-                    metric="Revenue",
-                ),
-            },
-            "ebitda_vs_budget": {
-                "function": self.get_actuals_vs_budget_metric,
-                "arguments": self.__get_arguments(
-                    years=years,
-                    filters=filters,
-                    report_type=report_type,
-                    period=period,
-                    scenario_type=scenario_type,
-                    metric="Ebitda",
-                ),
-            },
-        }
-
-    def get_actuals_plus_budget_functions_metric(
-        self, years: list, filters: dict, report_type: str = None, period: str = None
-    ) -> dict:
-        metric_config = {
-            "ebitda_margin": {
-                "function": self.get_ebitda_margin_metric,
-                "arguments": self.__get_arguments(
-                    years=years, filters=filters, report_type=report_type, period=period
-                ),
-            },
-            "gross_margin": {
-                "function": self.get_gross_margin,
-                "arguments": self.__get_arguments(
-                    years=years, filters=filters, report_type=report_type, period=period
-                ),
-            },
-            "sales_and_marketing": {
-                "function": self.get_metric_as_percentage_of_revenue,
-                "arguments": self.__get_arguments(
-                    years=years,
-                    metric=MetricNames.SALES_AND_MARKETING,
-                    filters=filters,
-                    report_type=report_type,
-                    period=period,
-                ),
-            },
-            "general_and_admin": {
-                "function": self.get_metric_as_percentage_of_revenue,
-                "arguments": self.__get_arguments(
-                    years=years,
-                    filters=filters,
-                    metric=MetricNames.GENERAL_AND_ADMINISTRATION,
-                    report_type=report_type,
-                    period=period,
-                ),
-            },
-            "research_and_development": {
-                "function": self.get_metric_as_percentage_of_revenue,
-                "arguments": self.__get_arguments(
-                    years=years,
-                    metric=MetricNames.RESEARCH_AND_DEVELOPMENT,
-                    filters=filters,
-                    report_type=report_type,
-                    period=period,
-                ),
-            },
-            "clv_cac_ratio": {
-                "function": self.get_metric_ratio,
-                "arguments": self.__get_ratio_arguments(
-                    years,
-                    filters,
-                    dividend="CLV",
-                    divisor="CAC",
-                    report_type=report_type,
-                    period=period,
-                ),
-            },
-            "cac_ratio": {
-                "function": self.get_metric_ratio,
-                "arguments": self.__get_ratio_arguments(
-                    years,
-                    filters,
-                    dividend="CAC",
-                    divisor="CAV",
-                    report_type=report_type,
-                    period=period,
-                ),
-            },
-            "revenue_per_employee": {
-                "function": self.get_revenue_per_employee,
-                "arguments": self.__get_arguments(
-                    years=years, filters=filters, report_type=report_type, period=period
-                ),
-            },
-            "opex_as_revenue": {
-                "function": self.get_opex_as_revenue,
-                "arguments": self.__get_arguments(
-                    years=years, filters=filters, report_type=report_type, period=period
-                ),
-            },
-            "debt_ebitda": {
-                "function": self.get_debt_ebitda,
-                "arguments": self.__get_arguments(
-                    years=years, filters=filters, report_type=report_type, period=period
-                ),
-            },
-        }
-        metric_config.update(
-            self.get_actuals_plus_budget_base_functions_metric(
-                years=years, filters=filters, report_type=report_type, period=period
-            )
-        )
-        metric_config.update(
-            self.__get_gross_profit_functions_metric(
-                years, filters, report_type=report_type, period=period
-            )
-        )
-        metric_config.update(
-            self.__get_actuals_vs_budget_functions_metric(
-                years, filters, report_type=report_type, period=period
-            )
-        )
-
-        return metric_config
+    def get_metric_names(self) -> list:
+        return list(BASE_SCENARIOS_METRIC_FUNCTIONS)
 
     def get_quarters_year_to_year_records(
         self,
@@ -1531,159 +1456,20 @@ class QuartersReportRepository:
         period: str,
         filters: dict,
     ) -> list:
-        functions_metric = self.get_actuals_plus_budget_functions_metric(
-            years, filters, report_type, period
-        )
-        metric_config = functions_metric.get(metric)
-        if not metric_config:
+        metric_function = ACTUALS_PLUS_BUDGET_METRIC_FUNCTIONS.get(metric)
+        if not metric_function:
             raise AppError("Metric not found")
 
-        function = metric_config["function"]
-        return function(**metric_config["arguments"])
-
-    def get_functions_metric(
-        self,
-        scenario: str,
-        years: list,
-        filters: dict,
-        report_type: str = None,
-        period: str = None,
-    ) -> dict:
-        metric_config = {
-            "ebitda_margin": {
-                "function": self.get_ebitda_margin_metric,
-                "arguments": self.__get_arguments(
-                    filters,
-                    scenario_type=scenario,
-                    years=years,
-                    report_type=report_type,
-                    period=period,
-                ),
-            },
-            "gross_margin": {
-                "function": self.get_gross_margin,
-                "arguments": self.__get_arguments(
-                    filters,
-                    scenario_type=scenario,
-                    years=years,
-                    report_type=report_type,
-                    period=period,
-                ),
-            },
-            "sales_and_marketing": {
-                "function": self.get_metric_as_percentage_of_revenue,
-                "arguments": self.__get_arguments(
-                    filters,
-                    years=years,
-                    scenario_type=scenario,
-                    metric=MetricNames.SALES_AND_MARKETING,
-                    report_type=report_type,
-                    period=period,
-                ),
-            },
-            "general_and_admin": {
-                "function": self.get_metric_as_percentage_of_revenue,
-                "arguments": self.__get_arguments(
-                    filters,
-                    years=years,
-                    scenario_type=scenario,
-                    metric=MetricNames.GENERAL_AND_ADMINISTRATION,
-                    report_type=report_type,
-                    period=period,
-                ),
-            },
-            "research_and_development": {
-                "function": self.get_metric_as_percentage_of_revenue,
-                "arguments": self.__get_arguments(
-                    filters,
-                    years=years,
-                    scenario_type=scenario,
-                    metric=MetricNames.RESEARCH_AND_DEVELOPMENT,
-                    report_type=report_type,
-                    period=period,
-                ),
-            },
-            "clv_cac_ratio": {
-                "function": self.get_metric_ratio,
-                "arguments": self.__get_ratio_arguments(
-                    years,
-                    filters,
-                    scenario_type=scenario,
-                    dividend="CLV",
-                    divisor="CAC",
-                    report_type=report_type,
-                    period=period,
-                ),
-            },
-            "cac_ratio": {
-                "function": self.get_metric_ratio,
-                "arguments": self.__get_ratio_arguments(
-                    years,
-                    filters,
-                    scenario_type=scenario,
-                    dividend="CAC",
-                    divisor="CAV",
-                    report_type=report_type,
-                    period=period,
-                ),
-            },
-            "opex_as_revenue": {
-                "function": self.get_opex_as_revenue,
-                "arguments": self.__get_arguments(
-                    years=years,
-                    filters=filters,
-                    scenario_type=scenario,
-                    report_type=report_type,
-                    period=period,
-                ),
-            },
-            "revenue_per_employee": {
-                "function": self.get_revenue_per_employee,
-                "arguments": self.__get_arguments(
-                    years=years,
-                    filters=filters,
-                    scenario_type=scenario,
-                    report_type=report_type,
-                    period=period,
-                ),
-            },
-            "debt_ebitda": {
-                "function": self.get_debt_ebitda,
-                "arguments": self.__get_arguments(
-                    years=years,
-                    filters=filters,
-                    scenario_type=scenario,
-                    report_type=report_type,
-                    period=period,
-                ),
-            },
-            "gross_profit": {
-                "function": self.get_gross_profit,
-                "arguments": self.__get_arguments(
-                    years=years,
-                    filters=filters,
-                    scenario_type=scenario,
-                    report_type=report_type,
-                    period=period,
-                ),
-            },
-        }
-        metric_config.update(
-            self.get_base_functions_metric(
-                filters, ScenarioNames.ACTUALS, years, report_type, period
-            )
+        function_name, build_arguments = metric_function
+        records = self.__get_cached_records(
+            ("year_to_year", metric, get_filters_key(filters)),
+            years,
+            partial(
+                getattr(self, function_name),
+                **build_arguments(filters=filters, years=years),
+            ),
         )
-        metric_config.update(
-            self.get_base_functions_metric(
-                filters, ScenarioNames.BUDGET, years, report_type, period
-            )
-        )
-        metric_config.update(
-            self.__get_actuals_vs_budget_functions_metric(
-                years, filters, scenario, report_type, period
-            )
-        )
-        return metric_config
+        return self.__get_view_records(records, report_type, period)
 
     def get_metric_records_with_base_scenarios(
         self,
@@ -1694,17 +1480,32 @@ class QuartersReportRepository:
         report_type: str = None,
         period: str = None,
     ) -> list:
-        functions_metric = self.get_functions_metric(
-            scenario_type, years, filters, report_type, period
-        )
-        metric_names = list(self.__get_metric_names_config().keys())
-        metric_name = f"{scenario_type}-{metric}" if metric in metric_names else metric
-        metric_config = functions_metric.get(metric_name)
-        if not metric_config:
+        metric_name = f"{scenario_type}-{metric}" if metric in METRIC_NAMES else metric
+        metric_function = BASE_SCENARIOS_METRIC_FUNCTIONS.get(metric_name)
+        if not metric_function:
             raise AppError("Metric not found")
 
-        function = metric_config["function"]
-        return function(**metric_config["arguments"])
+        function_name, build_arguments = metric_function
+        return self.__get_cached_records(
+            (
+                "base_scenarios",
+                metric_name,
+                scenario_type,
+                get_filters_key(filters),
+                self.__get_view_key(report_type, period),
+            ),
+            years,
+            partial(
+                getattr(self, function_name),
+                **build_arguments(
+                    filters=filters,
+                    scenario_type=scenario_type,
+                    years=years,
+                    report_type=report_type,
+                    period=period,
+                ),
+            ),
+        )
 
     def get_metric_records_by_quarters(
         self,
@@ -63,7 +63,8 @@ class RangesRepository:
     ) -> str:
         return """
             UPDATE {value_range}
-            SET label= '{label}', max_value='{max_value}', type= '{type}'
+            SET label= '{label}', max_value='{max_value}', type= '{type}',
+            updated_at = now()
             WHERE id = '{record_id}'
             """.format(
             value_range=TableNames.RANGE,
@@ -80,7 +81,8 @@ class RangesRepository:
     ) -> str:
         return """
             UPDATE {value_range}
-            SET label= '{label}', min_value='{min_value}', type= '{type}'
+            SET label= '{label}', min_value='{min_value}', type= '{type}',
+            updated_at = now()
             WHERE id = '{record_id}'
             """.format(
             value_range=TableNames.RANGE,
@@ -101,6 +103,7 @@ class RangesRepository:
             return self.__get_query_to_add_last_range(range, metric_key, label)
         return """
         INSERT INTO {value_range}
+        (id, label, min_value, max_value, type)
         VALUES ('{record_id}', '{label}', '{min_value}', '{max_value}', '{type}')
         """.format(
             value_range=TableNames.RANGE,
@@ -122,7 +125,8 @@ class RangesRepository:
             return self.__get_query_to_modify_last_range(range, metric_key, label)
         return """
         UPDATE {value_range}
-        SET label= '{label}', min_value= '{min_value}', max_value='{max_value}', type= '{type}'
+        SET label= '{label}', min_value= '{min_value}', max_value='{max_value}', type= '{type}',
+        updated_at = now()
         WHERE id = '{record_id}'
         """.format(
             value_range=TableNames.RANGE,
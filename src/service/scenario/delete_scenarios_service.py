@@ -1,4 +1,5 @@
 from typing import Union
+from metric_records_cache import get_update_version_query
 
 
 class DeleteScenariosService:
@@ -37,9 +38,10 @@ class DeleteScenariosService:
             query = """
             BEGIN;
             {query}
+            {update_version};
             COMMIT;
             """.format(
-                query=query_to_delete_metric
+                query=query_to_delete_metric, update_version=get_update_version_query()
             )
             self.session.execute(query)
             self.session.commit()
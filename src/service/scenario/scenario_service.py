@@ -3,6 +3,7 @@ from decimal import Decimal
 from datetime import datetime
 from base_exception import AppError
 from app_names import TableNames, ScenarioNames, METRIC_PERIOD_NAMES
+from metric_records_cache import get_update_version_query
 
 
 class ScenarioService:
@@ -171,7 +172,7 @@ class ScenarioService:
     def __verify_names(self, scenario: str, metric: str) -> None:
         if scenario not in ScenarioNames._value2member_map_:
             raise AppError("Invalid scenario type")
-        if metric not in self.metric_scenario.get_metric_types():
+        if not self.metric_scenario.is_metric_type(metric):
             raise AppError("Invalid metric name")
 
     def __verify_numbers(self, year: int, value: float, scenario: str) -> None:
@@ -222,11 +223,13 @@ class ScenarioService:
         {metric}
         {scenario}
         {scenario_metric}
+        {update_version};
         """.format(
             period=period_query,
             metric=metric_query,
             scenario=scenario_query,
             scenario_metric=scenario_metric_query,
+            update_version=get_update_version_query(),
         )
 
     def add_company_scenario(
@@ -0,0 +1,134 @@
+from collections import namedtuple
+from unittest import TestCase
+from unittest.mock import Mock
+from etl.ingestion import (
+    get_file_layout,
+    get_company_rows,
+    get_batch,
+    get_last_rows_by_id,
+    save_batch,
+)
+
+ExistingMetric = namedtuple("ExistingMetric", ["id", "period_id"])
+
+
+class TestIngestion(TestCase):
+    def setUp(self):
+        self.headers = ["Unique ID", "Name", "Sector", ":Actuals", ""]
+        self.rows = iter(
+            [
+                ["", "", "", ":Revenue", ""],
+                ["", "", "", ":2021", ""],
+                ["", "", "", "Q1", "Q2"],
+                ["", "Company A", "Software", "10", "20"],
+                ["1", "Company B", "Education", "30"],
+                ["2", "Company C", "Education", "40", "50"],
+            ]
+        )
+
+    def test_get_file_layout_should_read_header_rows(self):
+        (
+            columns,
+            year_limits,
+            scenarios_index,
+            metrics_index,
+            headers,
+            years_row,
+            periods_row,
+            metric_row,
+        ) = get_file_layout(self.headers, self.rows)
+
+        self.assertEqual(columns["Name"], 1)
+        self.assertEqual(year_limits, [(3, 5)])
+        self.assertEqual(scenarios_index, {3})
+        self.assertEqual(metrics_index, {3})
+        self.assertEqual(periods_row, ["", "", "", "Q1", "Q2"])
+        self.assertEqual(next(self.rows)[1], "Company A")
+
+    def test_get_company_rows_should_pad_and_skip_unknown_companies(self):
+        get_file_layout(self.headers, self.rows)
+
+        batches = list(get_company_rows(self.rows, len(self.headers), {"1"}, 500))
+
+        self.assertEqual(len(batches), 1)
+        self.assertEqual(
+            batches[0],
+            [
+                (["", "Company A", "Software", "10", "20"], True),
+                (["1", "Company B", "Education", "30", ""], False),
+            ],
+        )
+
+    def test_get_company_rows_should_split_batches(self):
+        get_file_layout(self.headers, self.rows)
+
+        batches = list(get_company_rows(self.rows, len(self.headers), {"1", "2"}, 2))
+
+        self.assertEqual([len(batch) for batch in batches], [2, 1])
+        self.assertEqual(batches[1][0][0][0], "2")
+
+    def test_get_batch_should_split_new_and_existing_metrics(self):
+        layout = get_file_layout(self.headers, self.rows)
+        company_rows = next(get_company_rows(self.rows, len(self.headers), {"1"}, 500))
+        existing_metrics = {
+            ("1", "Actuals-2021", "Revenue", "Q1"): ExistingMetric("m1", "p1")
+        }
+
+        batch = get_batch(company_rows, layout, {"1"}, existing_metrics)
+
+        self.assertEqual(len(batch["company"]), 1)
+        self.assertEqual(batch["company_updates"][0][:2], ["1", "Company B"])
+        self.assertEqual(
+            batch["metric_updates"],
+            [["m1", "Revenue", 30.0, "standard", "currency", "p1", "1"]],
+        )
+        self.assertEqual([metric[2] for metric in batch["metric"]], [10.0, 20.0])
+        self.assertEqual(len(batch["time_period"]), 2)
+        self.assertEqual(len(batch["financial_scenario"]), 2)
+        self.assertEqual(len(batch["scenario_metric"]), 2)
+        self.assertEqual(len(batch["currency_metric"]), 2)
+
+    def test_save_batch_should_copy_new_rows_and_upsert_updates(self):
+        layout = get_file_layout(self.headers, self.rows)
+        company_rows = next(get_company_rows(self.rows, len(self.headers), {"1"}, 500))
+        batch = get_batch(company_rows, layout, {"1"}, dict())
+        batch["metric_updates"].append(
+            ["m1", "Revenue", 30.0, "standard", "currency", "p1", "1"]
+        )
+        cursor = Mock()
+
+        save_batch(cursor, batch)
+
+        copied_tables = [
+            call.args[0].split(" ")[1] for call in cursor.copy_expert.call_args_list
+        ]
+        queries = [call.args[0] for call in cursor.execute.call_args_list]
+        self.assertEqual(
+            copied_tables,
+            [
+                "company",
+                "time_period",
+                "financial_scenario",
+                "metric",
+                "currency_metric",
+                "scenario_metric",
+                "company_staging",
+                "metric_staging",
+            ],
+        )
+        self.assertEqual(
+            len([query for query in queries if "ON CONFLICT (id) DO UPDATE" in query]),
+            2,
+        )
+        cursor.execute.assert_called_with(
+            "UPDATE data_version SET version = version + 1 WHERE name = %s",
+            ("metric_records",),
+        )
+
+    def test_get_last_rows_by_id_should_keep_last_row(self):
+        rows = [["m1", "Revenue", 10.0], ["m2", "Ebitda", 5.0], ["m1", "Revenue", 30.0]]
+
+        self.assertEqual(
+            get_last_rows_by_id(rows),
+            [["m1", "Revenue", 30.0], ["m2", "Ebitda", 5.0]],
+        )
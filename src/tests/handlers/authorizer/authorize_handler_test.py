@@ -0,0 +1,119 @@
+import time
+import src.tests.config_imports  # noqa
+from unittest import TestCase, mock
+import src.handlers.authorizer.authorize_handler as authorizer
+from base_exception import AuthError
+
+
+class TestAuthorizeHandler(TestCase):
+    def setUp(self):
+        self.keys = [{"kid": "1"}, {"kid": "2"}]
+        authorizer.jwks_cache.update(
+            {"public_keys": dict(), "fetched_at": 0, "expires_at": 0}
+        )
+        authorizer.verified_tokens.clear()
+        authorizer.token_cache_stats.update({"hits": 0, "misses": 0})
+
+    @mock.patch.object(authorizer.jwk, "construct")
+    @mock.patch.object(authorizer, "get_keys")
+    def test_get_public_key_should_fetch_jwks_only_once(
+        self, mock_get_keys, mock_construct
+    ):
+        mock_get_keys.return_value = self.keys
+        mock_construct.side_effect = lambda key: f"public-key-{key['kid']}"
+
+        authorizer.get_public_key("region", "pool", {"kid": "1"})
+        public_key = authorizer.get_public_key("region", "pool", {"kid": "2"})
+
+        self.assertEqual(public_key, "public-key-2")
+        mock_get_keys.assert_called_once()
+        self.assertEqual(mock_construct.call_count, len(self.keys))
+
+    @mock.patch.object(authorizer.jwk, "construct")
+    @mock.patch.object(authorizer, "get_keys")
+    def test_get_public_key_with_unknown_kid_should_refetch_jwks(
+        self, mock_get_keys, mock_construct
+    ):
+        mock_get_keys.return_value = self.keys + [{"kid": "3"}]
+        mock_construct.side_effect = lambda key: f"public-key-{key['kid']}"
+        authorizer.jwks_cache.update(
+            {
+                "public_keys": {"1": "public-key-1"},
+                "fetched_at": time.time() - authorizer.JWKS_MIN_REFRESH_INTERVAL - 1,
+                "expires_at": time.time() + authorizer.JWKS_TTL,
+            }
+        )
+
+        public_key = authorizer.get_public_key("region", "pool", {"kid": "3"})
+
+        self.assertEqual(public_key, "public-key-3")
+        mock_get_keys.assert_called_once()
+
+    @mock.patch.object(authorizer, "get_keys")
+    def test_get_public_key_with_unknown_kid_after_refresh_should_fail(
+        self, mock_get_keys
+    ):
+        authorizer.jwks_cache.update(
+            {
+                "public_keys": {"1": "public-key-1"},
+                "fetched_at": time.time(),
+                "expires_at": time.time() + authorizer.JWKS_TTL,
+            }
+        )
+
+        with self.assertRaises(AuthError):
+            authorizer.get_public_key("region", "pool", {"kid": "3"})
+
+        mock_get_keys.assert_not_called()
+
+    @mock.patch.object(authorizer, "verify_token")
+    @mock.patch.object(authorizer, "get_public_key")
+    @mock.patch.object(authorizer.jwt, "get_unverified_claims")
+    @mock.patch.object(authorizer.jwt, "get_unverified_headers")
+    @mock.patch.dict("os.environ", {"APP_CLIENT_ID": "client"})
+    def test_handler_with_repeated_token_should_verify_it_once(
+        self,
+        mock_get_headers,
+        mock_get_claims,
+        mock_get_public_key,
+        mock_verify_token,
+    ):
+        mock_get_headers.return_value = {"kid": "1"}
+        mock_get_claims.return_value = {
+            "exp": time.time() + 60,
+            "aud": "client",
+            "cognito:username": "user",
+            "email": "user@email.com",
+            "cognito:groups": ["admin"],
+        }
+        event = {"authorizationToken": "token"}
+
+        authorizer.handler(event, {})
+        policy = authorizer.handler(event, {})
+
+        self.assertEqual(policy["principalId"], "user")
+        self.assertEqual(
+            policy["context"], {"email": "user@email.com", "groups": "admin"}
+        )
+        self.assertEqual(policy["policyDocument"]["Statement"][0]["Effect"], "Allow")
+        mock_verify_token.assert_called_once()
+        self.assertEqual(authorizer.token_cache_stats, {"hits": 1, "misses": 1})
+
+    def test_get_cached_principal_should_evict_expired_token(self):
+        authorizer.cache_principal("hash", "user", time.time() - 1)
+
+        user = authorizer.get_cached_principal("hash")
+
+        self.assertIsNone(user)
+        self.assertNotIn("hash", authorizer.verified_tokens)
+
+    @mock.patch.object(authorizer, "TOKEN_CACHE_SIZE", 2)
+    def test_cache_principal_should_evict_least_recently_used_token(self):
+        expiration = time.time() + 60
+        authorizer.cache_principal("first", "user", expiration)
+        authorizer.cache_principal("second", "user", expiration)
+        authorizer.get_cached_principal("first")
+
+        authorizer.cache_principal("third", "user", expiration)
+
+        self.assertEqual(list(authorizer.verified_tokens), ["first", "third"])
@@ -162,6 +162,19 @@ class TestBaseMetricsReport(TestCase):
 
         self.assertEqual(companies_ordered, expected_companies)
 
+    def test_get_peers_sorted_should_order_anonymized_companies_last(self):
+        companies = {
+            "1": {"id": "1", "name": "1-xxxx"},
+            "2": {"id": "2", "name": "Company B"},
+        }
+        self.mock_company_anonymization.is_company_anonymized.side_effect = (
+            lambda id: id == "1"
+        )
+
+        companies_ordered = self.report_instance.get_peers_sorted(companies)
+
+        self.assertEqual(companies_ordered, [companies["2"], companies["1"]])
+
     def test_anonymize_name_should_replace_name(self):
         company = {"id": "01234", "name": "Test A"}
         self.mock_company_anonymization.anonymize_company_name.return_value = (
@@ -485,7 +485,7 @@ class TestByMetricReport(TestCase):
         self,
     ):
         self.mock_repository.get_metric_records.return_value = self.records
-        self.mock_repository.get_functions_metric.return_value = {"actuals_revenue": {}}
+        self.mock_repository.get_metric_names.return_value = ["actuals_revenue"]
         expected_data = {
             "1": {"id": "1", "name": "Test", "metrics": {2019: 3, 2020: 4}},
             "2": {"id": "2", "name": "Company", "metrics": {2019: 6}},
@@ -499,7 +499,7 @@ class TestByMetricReport(TestCase):
 
     def test_get_records_with_debt_ebitda_should_return_companies_metrics_dict(self):
         self.mock_repository.get_metric_records.return_value = self.records
-        self.mock_repository.get_functions_metric.return_value = {"debt_ebitda": {}}
+        self.mock_repository.get_metric_names.return_value = ["debt_ebitda"]
         expected_data = {
             "1": {"id": "1", "name": "Test", "metrics": {2019: 3.0, 2020: 4.0}},
             "2": {"id": "2", "name": "Company", "metrics": {2019: 6.0}},
@@ -513,7 +513,7 @@ class TestByMetricReport(TestCase):
 
     def test_get_records_with_ratio_metric_should_return_companies_metrics_dict(self):
         self.mock_repository.get_metric_records.return_value = self.records
-        self.mock_repository.get_functions_metric.return_value = {"actuals_revenue": {}}
+        self.mock_repository.get_metric_names.return_value = ["actuals_revenue"]
         expected_data = {
             "1": {"id": "1", "name": "Test", "metrics": {2019: "3.0x", 2020: "4.0x"}},
             "2": {"id": "2", "name": "Company", "metrics": {2019: "6.0x"}},
@@ -529,7 +529,7 @@ class TestByMetricReport(TestCase):
         self,
     ):
         self.mock_repository.get_metric_records.return_value = self.records
-        self.mock_repository.get_functions_metric.return_value = {"actuals_revenue": {}}
+        self.mock_repository.get_metric_names.return_value = ["actuals_revenue"]
         expected_data = {
             "1": {
                 "id": "1",
@@ -2,6 +2,7 @@ from unittest import TestCase
 import logging
 from unittest.mock import Mock, patch
 from parameterized import parameterized
+import src.service.by_metric_report.metric_report_repository as functions
 from src.service.by_metric_report.metric_report_repository import MetricReportRepository
 
 logger = logging.getLogger()
@@ -282,12 +283,18 @@ class TestMetricReportRepository(TestCase):
         self, metric, scenario, expected_arguments
     ):
 
-        arguments = self.repository._MetricReportRepository__get_arguments(
-            {}, metric, scenario
-        )
+        arguments = functions.get_arguments({}, metric, scenario)
 
         self.assertEqual(arguments, expected_arguments)
 
+    def test_get_metric_names_should_return_registered_metrics(self):
+        metric_names = self.repository.get_metric_names()
+
+        self.assertEqual(metric_names[0], "ebitda_margin")
+        self.assertIn("actuals_revenue", metric_names)
+        self.assertIn("budget_gross_profit", metric_names)
+        self.assertEqual(metric_names[-1], "ebitda_vs_budget")
+
     @patch.object(
         MetricReportRepository,
         "_MetricReportRepository__add_period_name_where_condition",
@@ -205,7 +205,9 @@ class TestByYearReport(TestCase):
         self.mock_base_metrics_reports.get_allowed_companies.return_value = []
         mock_get_comparison_vs_data.return_value = []
         self.mock_profile_range.get_profile_ranges.return_value = [self.range]
-        self.mock_profile_range.get_range_from_value.return_value = label
+        self.mock_profile_range.get_ranges_from_values.side_effect = (
+            lambda values, **kwargs: [label] * len(values)
+        )
         self.mock_base_metrics_reports.filter_by_conditions.return_value = peer_data
         self.mock_base_metrics_reports.get_peers_sorted.side_effect = lambda x: list(
             x.values()
@@ -214,6 +214,12 @@ class TestEditModifyService(TestCase):
         scenario_added[scenario["company_id"]] = [response]
         return scenario_added
 
+    def mock_metric_types(self, metric_types: list) -> None:
+        self.mock_metric_service.get_metric_types.return_value = metric_types
+        self.mock_metric_service.is_metric_type.side_effect = (
+            lambda name: name in metric_types
+        )
+
     @mock.patch.object(EditModifyService, "_EditModifyService__add_scenarios")
     def test_add_scenarios_fail_should_raise_exception(self, mock_add_scenarios):
         mock_add_scenarios.side_effect = Exception("error")
@@ -375,7 +381,7 @@ class TestEditModifyService(TestCase):
                 },
             },
         }
-        self.mock_metric_service.get_metric_types.return_value = ["Revenue"]
+        self.mock_metric_types(["Revenue"])
         self.mock_repository.get_scenarios_by_type.return_value = self.scenarios_by_type
         self.mock_repository.get_companies_records.return_value = self.fetched_companies
         response = self.edit_service.get_data()
@@ -412,7 +418,7 @@ class TestEditModifyService(TestCase):
                 },
             },
         }
-        self.mock_metric_service.get_metric_types.return_value = []
+        self.mock_metric_types([])
         self.mock_repository.get_scenarios_by_type.return_value = []
         self.mock_repository.get_companies_records.return_value = self.fetched_companies
         response = self.edit_service.get_data()
@@ -457,7 +463,7 @@ class TestEditModifyService(TestCase):
                 }
             }
         )
-        self.mock_metric_service.get_metric_types.return_value = ["Revenue", "Ebitda"]
+        self.mock_metric_types(["Revenue", "Ebitda"])
 
         response = self.edit_service._EditModifyService__build_companies_rows(
             self.fetched_companies,
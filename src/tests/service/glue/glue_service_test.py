@@ -11,6 +11,7 @@ logger.setLevel(logging.INFO)
 test_file_name = "test.csv"
 bucket_files = "kpinetwork_test_files"
 env = "demo"
+etl_modules = "s3://kpinetwork-backend/pyspark/ingestion.py"
 
 
 class TestGlueService(TestCase):
@@ -20,7 +21,10 @@ class TestGlueService(TestCase):
         self.mock_boto_client = Mock()
         return
 
-    @mock.patch.dict(os.environ, {"ENV": env, "BUCKET_FILES": bucket_files})
+    @mock.patch.dict(
+        os.environ,
+        {"ENV": env, "BUCKET_FILES": bucket_files, "ETL_MODULES": etl_modules},
+    )
     def test_success_call_to_glue_job(self):
         self.mock_boto_client.start_job_run.return_value = {"JobRunId": "1234"}
         response = self.glue_service_instance.trigger(
@@ -34,10 +38,34 @@ class TestGlueService(TestCase):
                 "--ENV": env,
                 "--FILENAME": test_file_name,
                 "--BUCKET": bucket_files,
+                "--additional-python-modules": "psycopg2-binary",
+                "--extra-py-files": etl_modules,
             },
         )
 
     @mock.patch.dict(os.environ, {"ENV": env, "BUCKET_FILES": bucket_files})
+    def test_call_to_glue_job_without_etl_modules(self):
+        os.environ.pop("ETL_MODULES", None)
+        self.mock_boto_client.start_job_run.return_value = {"JobRunId": "1234"}
+
+        self.glue_service_instance.trigger(
+            self.mock_boto_client, self.mock_event, logger
+        )
+
+        self.mock_boto_client.start_job_run.assert_called_once_with(
+            JobName="kpinetwork_job",
+            Arguments={
+                "--ENV": env,
+                "--FILENAME": test_file_name,
+                "--BUCKET": bucket_files,
+                "--additional-python-modules": "psycopg2-binary",
+            },
+        )
+
+    @mock.patch.dict(
+        os.environ,
+        {"ENV": env, "BUCKET_FILES": bucket_files, "ETL_MODULES": etl_modules},
+    )
     def test_failed_call_to_glue_job(self):
         self.mock_boto_client.start_job_run.side_effect = Exception("error")
         with self.assertRaises(Exception):
@@ -1,6 +1,7 @@
 from unittest import TestCase
 import logging
 from unittest.mock import Mock
+import src.service.metric.metric_type_service as functions
 from src.service.metric.metric_type_service import MetricTypesService
 
 logger = logging.getLogger()
@@ -9,6 +10,7 @@ logger.setLevel(logging.INFO)
 
 class TestMetricTypesService(TestCase):
     def setUp(self):
+        functions.clear_metric_types()
         self.metrics = [{"name": "Revenue"}, {"name": "Ebitda"}]
         self.mock_session = Mock()
         self.mock_query_builder = Mock()
@@ -36,3 +38,31 @@ class TestMetricTypesService(TestCase):
 
         self.assertEqual(metric_names, [])
         self.service_instance.session.execute.assert_called_once()
+
+    def test_get_metric_types_should_query_catalog_once(self):
+        self.mock_response_list_query_sql(self.metrics)
+
+        metric_names = self.service_instance.get_metric_types()
+        is_metric_type = self.service_instance.is_metric_type("Ebitda")
+        is_not_metric_type = self.service_instance.is_metric_type("Ebitda margin")
+
+        self.assertEqual(metric_names, ["Revenue", "Ebitda"])
+        self.assertTrue(is_metric_type)
+        self.assertFalse(is_not_metric_type)
+        self.service_instance.session.execute.assert_called_once()
+
+    def test_get_metric_types_should_reload_catalog_when_expired(self):
+        self.mock_response_list_query_sql(self.metrics)
+        self.service_instance.get_metric_types()
+
+        functions.metric_types["expires_at"] = 0
+        self.service_instance.get_metric_types()
+
+        self.assertEqual(self.service_instance.session.execute.call_count, 2)
+
+    def test_is_metric_type_failed(self):
+        self.mock_session.execute.side_effect = Exception("error")
+
+        is_metric_type = self.service_instance.is_metric_type("Revenue")
+
+        self.assertFalse(is_metric_type)
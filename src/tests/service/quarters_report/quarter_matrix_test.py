@@ -0,0 +1,138 @@
+from unittest import TestCase
+import numpy
+from parameterized import parameterized
+
+from src.service.quarters_report.quarter_matrix import (
+    QuarterMatrix,
+    RollingQuarters,
+    get_averages,
+    get_comparison,
+)
+
+
+class TestQuarterMatrix(TestCase):
+    def setUp(self):
+        self.matrix = QuarterMatrix(["2021", "2022", "2023"])
+        self.matrix.add_quarters("1", "2021", {"Q1": 1, "Q2": 2, "Q3": 3, "Q4": 4})
+        self.matrix.add_quarters("1", "2022", {"Q1": 5, "Q2": 6, "Q3": 7, "Q4": 8})
+        self.matrix.add_quarters("2", "2022", {"Q1": 2, "Q2": None, "Q3": 2})
+        self.matrix.add_quarters("2", "2023", {"Q1": 1, "Q2": 1, "Q3": 1, "Q4": 1})
+
+    def assert_array_equal(self, values, expected_values):
+        numpy.testing.assert_array_equal(values, numpy.array(expected_values))
+
+    def test_add_quarters_should_build_matrix_by_company_and_year(self):
+        self.assertEqual(self.matrix.ids, ["1", "2"])
+        self.assertEqual(self.matrix.values.shape, (2, 3, 4))
+        self.assert_array_equal(
+            self.matrix.loaded, [[True, True, False], [False, True, True]]
+        )
+        self.assert_array_equal(
+            self.matrix.get_quarter("Q2"),
+            [[2, 6, numpy.nan], [numpy.nan, numpy.nan, 1]],
+        )
+
+    def test_add_value_should_ignore_unknown_years_and_periods(self):
+        matrix = QuarterMatrix([2022])
+        matrix.add_value("1", 2022, "Q1", 3)
+        matrix.add_value("1", 2021, "Q1", 3)
+        matrix.add_value("1", 2022, "Full-year", 3)
+
+        self.assert_array_equal(matrix.values, [[[3, numpy.nan, numpy.nan, numpy.nan]]])
+
+    def test_get_full_year_should_be_nan_when_a_quarter_is_missing(self):
+        full_year = self.matrix.get_full_year()
+
+        self.assert_array_equal(
+            full_year, [[10, 26, numpy.nan], [numpy.nan, numpy.nan, 4]]
+        )
+
+    @parameterized.expand(
+        [
+            ["Q1", numpy.nan, [[1, 5, 0], [0, 2, 1]]],
+            ["Q3", 0, [[6, 18, 0], [0, numpy.nan, 3]]],
+        ]
+    )
+    def test_get_year_to_date(self, period, missing, expected_values):
+        year_to_date = self.matrix.get_year_to_date(period, missing=missing)
+
+        self.assert_array_equal(
+            numpy.nan_to_num(year_to_date), numpy.nan_to_num(expected_values)
+        )
+
+    def test_get_last_twelve_months_should_use_previous_year_quarters(self):
+        last_twelve_months = self.matrix.get_last_twelve_months("Q2")
+
+        self.assert_array_equal(
+            last_twelve_months,
+            [[numpy.nan, 18, numpy.nan], [numpy.nan, numpy.nan, numpy.nan]],
+        )
+
+    @parameterized.expand(
+        [
+            ["Q4", [[10, 26, 44], [numpy.nan, numpy.nan, 4]]],
+            ["Q1", [[numpy.nan, 14, 30], [numpy.nan, numpy.nan, numpy.nan]]],
+            ["Q3", [[numpy.nan, 22, 39], [numpy.nan, numpy.nan, numpy.nan]]],
+        ]
+    )
+    def test_rolling_quarters_get_windows(self, period, expected_values):
+        matrix = QuarterMatrix(["2021", "2022", "2023"])
+        matrix.add_quarters("1", "2021", {"Q1": 1, "Q2": 2, "Q3": 3, "Q4": 4})
+        matrix.add_quarters("1", "2022", {"Q1": 5, "Q2": 6, "Q3": 7, "Q4": 8})
+        matrix.add_quarters("1", "2023", {"Q1": 9, "Q2": 10, "Q3": 12, "Q4": 13})
+        matrix.add_quarters("2", "2022", {"Q1": 2, "Q2": None, "Q3": 2})
+        matrix.add_quarters("2", "2023", {"Q1": 1, "Q2": 1, "Q3": 1, "Q4": 1})
+
+        windows = RollingQuarters(matrix.values, matrix.previous_years).get_windows(
+            period
+        )
+
+        self.assert_array_equal(windows, expected_values)
+
+    def test_get_last_twelve_months_should_reuse_rolling_quarters(self):
+        rolling_quarters = self.matrix.rolling_quarters
+        self.matrix.get_last_twelve_months("Q1")
+        self.matrix.get_last_twelve_months("Q3")
+
+        self.assertIs(self.matrix.rolling_quarters, rolling_quarters)
+
+        self.matrix.add_quarters("3", "2023", {"Q1": 1})
+
+        self.assertIsNot(self.matrix.rolling_quarters, rolling_quarters)
+
+    def test_get_previous_loaded_should_skip_missing_years(self):
+        matrix = QuarterMatrix(["2021", "2022", "2023"])
+        matrix.add_quarters("1", "2021", {"Q1": 1})
+        matrix.add_quarters("1", "2023", {"Q1": 2})
+        values = numpy.array([[1.0, 5.0, 2.0]])
+
+        previous = matrix.get_previous_loaded(values)
+
+        self.assert_array_equal(previous, [[numpy.nan, 1, 1]])
+
+    def test_get_year_before_should_skip_gapped_years(self):
+        matrix = QuarterMatrix(["2018", "2020", "2021"])
+        values = numpy.array([[1.0, 2.0, 3.0]])
+
+        previous = matrix.get_year_before(values)
+
+        self.assert_array_equal(previous, [[numpy.nan, numpy.nan, 2]])
+
+    def test_get_comparison_should_be_nan_without_valid_previous_value(self):
+        values = numpy.array([[10.0, 20.0, 5.0, numpy.nan], [0.0, 3.0, 6.0, 9.0]])
+
+        comparison = get_comparison(values)
+
+        self.assert_array_equal(
+            comparison,
+            [[numpy.nan, 2, 0.25, numpy.nan], [numpy.nan, numpy.nan, 2, 1.5]],
+        )
+
+    def test_get_averages_should_ignore_missing_values(self):
+        values = numpy.array(
+            [[1.0, numpy.nan], [4.0, numpy.nan], [numpy.nan, numpy.nan]]
+        )
+
+        averages = get_averages(values)
+
+        self.assert_array_equal(averages, [2.5, numpy.nan])
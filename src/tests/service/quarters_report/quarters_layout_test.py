@@ -0,0 +1,80 @@
+from unittest import TestCase
+from parameterized import parameterized
+
+import src.service.quarters_report.quarters_layout as functions
+from src.service.quarters_report.quarters_layout import (
+    QuartersLayout,
+    get_quarters_layout,
+)
+
+
+class TestQuartersLayout(TestCase):
+    def setUp(self):
+        functions.clear_layouts()
+
+    @parameterized.expand(
+        [
+            [
+                ["2022"],
+                "Q2",
+                {"2022": ["Q1", "Q2", "Full Year"]},
+            ],
+            [
+                ["2021", "2022", "2023", "2024"],
+                "Q3",
+                {
+                    "2021": ["Q4"],
+                    "2022": ["Q1", "Q2", "Q3", "Full Year", "Q4"],
+                    "2023": ["Q1", "Q2", "Q3", "Full Year", "vs", "Q4"],
+                    "2024": ["Q1", "Q2", "Q3", "Full Year", "vs"],
+                },
+            ],
+        ]
+    )
+    def test_get_quarters_layout_last_twelve_months(
+        self, years, period, expected_subheaders
+    ):
+        layout = get_quarters_layout(years, period, "last_twelve_months")
+
+        self.assertEqual(layout.get_subheaders_dict(), expected_subheaders)
+
+    def test_get_quarters_layout_should_sort_years_by_default(self):
+        layout = get_quarters_layout(["2023", "2022"])
+
+        headers, subheaders = layout.get_headers()
+
+        self.assertEqual(
+            headers, ["Company", "2022", "", "", "", "", "2023", "", "", "", "", ""]
+        )
+        self.assertEqual(
+            subheaders,
+            ["", "Q1", "Q2", "Q3", "Q4", "Full Year"]
+            + ["Q1", "Q2", "Q3", "Q4", "Full Year", "vs"],
+        )
+
+    def test_columns_should_map_year_and_key_to_subheader_position(self):
+        layout = QuartersLayout({"2022": ["Q4"], 2023: ["Q1", "Full Year", "vs"]})
+
+        self.assertEqual(
+            layout.columns,
+            {
+                ("2022", "Q4"): 1,
+                ("2023", "Q1"): 2,
+                ("2023", "Full Year"): 3,
+                ("2023", "vs"): 4,
+            },
+        )
+        self.assertTrue(layout.has_column(2023, "vs"))
+        self.assertFalse(layout.has_column("2022", "vs"))
+
+    def test_get_quarters_layout_should_build_layout_once(self):
+        layout = get_quarters_layout(["2022", "2023"], "Q1", "last_twelve_months")
+        layout.get_subheaders_dict()["2022"].append("Q1")
+
+        same_layout = get_quarters_layout(["2022", "2023"], "Q1", "last_twelve_months")
+        other_layout = get_quarters_layout(["2022", "2023"], "Q2", "last_twelve_months")
+
+        self.assertIs(layout, same_layout)
+        self.assertIsNot(layout, other_layout)
+        self.assertEqual(same_layout.subheaders["2022"], ("Q2", "Q3", "Q4"))
+        self.assertEqual(len(functions.layouts), 2)
@@ -1,6 +1,8 @@
+import src.tests.config_imports  # noqa
 from unittest import TestCase
 import logging
 from unittest.mock import Mock, patch
+import metric_records_cache
 from src.service.quarters_report.quarters_report_repository import (
     QuartersReportRepository,
 )
@@ -11,7 +13,9 @@ logger.setLevel(logging.INFO)
 
 class TestQuartersReportRepository(TestCase):
     def setUp(self):
+        metric_records_cache.clear_metric_records()
         self.mock_session = Mock()
+        self.mock_session.execute.return_value.scalar.return_value = 1
         self.mock_query_builder = Mock()
         self.mock_response_sql = Mock()
         self.repository = QuartersReportRepository(
@@ -82,6 +86,143 @@ class TestQuartersReportRepository(TestCase):
 
         self.assertEqual(str(context.exception), "Metric not found")
 
+    @patch.object(QuartersReportRepository, "get_base_metric_records")
+    def test_get_metric_by_quarters_should_build_only_requested_metric_arguments(
+        self, mock_get_base_metric_records
+    ):
+        mock_get_base_metric_records.return_value = self.records
+
+        metrics = self.repository.get_metric_records_by_quarters(
+            "year_to_date", "ebitda", "Budget", [2021, 2022], "Q2", dict()
+        )
+
+        self.assertEqual(metrics, self.records)
+        mock_get_base_metric_records.assert_called_once_with(
+            filters=dict(),
+            metric="Ebitda",
+            scenario_type="Budget",
+            years=[2021, 2022],
+            report_type="year_to_date",
+            period="Q2",
+        )
+
+    @patch.object(QuartersReportRepository, "get_base_metric_records")
+    def test_get_metric_by_quarters_should_query_year_to_date_separately(
+        self, mock_get_base_metric_records
+    ):
+        mock_get_base_metric_records.return_value = self.records
+
+        for report_type, period in [
+            ("year_to_year", None),
+            ("last_twelve_months", "Q3"),
+            ("year_to_date", "Q2"),
+            ("year_to_date", "Q2"),
+        ]:
+            self.repository.get_metric_records_by_quarters(
+                report_type, "revenue", "Actuals", [2020, 2021], period, dict()
+            )
+
+        self.assertEqual(mock_get_base_metric_records.call_count, 2)
+
+    def test_get_metric_names_should_return_base_scenarios_metrics(self):
+        metric_names = self.repository.get_metric_names()
+
+        self.assertIn("Actuals-revenue", metric_names)
+        self.assertIn("Budget-ebitda", metric_names)
+        self.assertIn("gross_profit", metric_names)
+        self.assertIn("revenue_vs_budget", metric_names)
+
+    def test_get_base_metrics_pivot_query_should_aggregate_metrics_by_period(self):
+        query = self.repository.get_base_metrics_pivot_query(
+            ["ebitda", "revenue"], "Actuals", ["2021"], dict()
+        )
+
+        self.assertIn(
+            "MAX(metric.value) FILTER (WHERE metric.name = 'Revenue') as revenue",
+            query,
+        )
+        self.assertIn("metric.name IN ('Ebitda', 'Revenue')", query)
+        self.assertIn(
+            "GROUP BY company.id, company.name, financial_scenario.name, "
+            "time_period.period_name",
+            query,
+        )
+
+    def test_get_base_metrics_records_should_split_pivot_by_metric(self):
+        self.mock_response_list_query_sql(
+            [
+                {
+                    "id": "1",
+                    "name": "Test",
+                    "scenario": "Actuals-2020",
+                    "year": 2020,
+                    "period_name": "Q1",
+                    "ebitda": None,
+                    "ebitda_count": 0,
+                    "revenue": 10,
+                    "revenue_count": 1,
+                },
+                {
+                    "id": "1",
+                    "name": "Test",
+                    "scenario": "Actuals-2021",
+                    "year": 2021,
+                    "period_name": "Q1",
+                    "ebitda": 5,
+                    "ebitda_count": 1,
+                    "revenue": 20,
+                    "revenue_count": 1,
+                },
+                {
+                    "id": "1",
+                    "name": "Test",
+                    "scenario": "Actuals-2021",
+                    "year": 2021,
+                    "period_name": "Q2",
+                    "ebitda": 6,
+                    "ebitda_count": 1,
+                    "revenue": 30,
+                    "revenue_count": 1,
+                },
+            ]
+        )
+
+        records = self.repository.get_base_metrics_records(
+            {"revenue": ["2020"], "ebitda_margin": ["2021"]}, "Actuals", dict()
+        )
+
+        self.assertEqual(self.mock_session.execute.call_count, 2)
+        self.assertEqual(
+            records["revenue"],
+            [
+                {
+                    "id": "1",
+                    "name": "Test",
+                    "scenario": "Actuals-2020",
+                    "metric": "Revenue",
+                    "year": 2020,
+                    "period_name": "Q1",
+                    "value": 10,
+                    "full_year": 10,
+                    "quarters_count": 1,
+                }
+            ],
+        )
+        self.assertEqual(
+            [record["value"] for record in records["ebitda_margin"]], [25.0, 20.0]
+        )
+        self.assertEqual(records["ebitda_margin"][0]["full_year"], 45.0)
+        self.assertEqual(records["ebitda_margin"][0]["quarters_count"], 2)
+
+    def test_get_base_metrics_records_should_return_empty_lists_when_fails(self):
+        self.mock_session.execute.side_effect = Exception("error")
+
+        records = self.repository.get_base_metrics_records(
+            {"revenue": ["2020"]}, "Actuals", dict()
+        )
+
+        self.assertEqual(records, {"revenue": []})
+
     def test_get_quarters_year_to_year_records_should_call_function(self):
         self.mock_response_list_query_sql(self.records)
 
@@ -91,6 +232,86 @@ class TestQuartersReportRepository(TestCase):
 
         self.assertEqual(metrics, self.records)
 
+    def test_get_quarters_year_to_year_records_should_derive_views_from_cache(self):
+        records = [
+            {**self.records[1], "period_name": period_name}
+            for period_name in ["Q1", "Q2", "Q3", "Q4"]
+        ]
+        self.mock_response_list_query_sql(records)
+        filters = {"sector": ["'Application Software'"]}
+
+        year_to_year = self.repository.get_quarters_year_to_year_records(
+            "year_to_year", "revenue", "actuals", [2021], None, filters
+        )
+        last_twelve_months = self.repository.get_quarters_year_to_year_records(
+            "last_twelve_months", "revenue", "actuals", [2021], "Q3", filters
+        )
+        year_to_date = self.repository.get_quarters_year_to_year_records(
+            "year_to_date", "revenue", "actuals", [2021], "Q2", dict(filters)
+        )
+
+        self.assertEqual(year_to_year, records)
+        self.assertEqual(last_twelve_months, records)
+        self.assertEqual(year_to_date, records[:2])
+        self.assertEqual(self.mock_session.execute.call_count, 2)
+
+    def test_get_quarters_year_to_year_records_should_reuse_cached_years(self):
+        self.mock_response_list_query_sql(self.records)
+
+        self.repository.get_quarters_year_to_year_records(
+            "last_twelve_months", "revenue", "actuals", [2020, 2021], "Q1", dict()
+        )
+        metrics = self.repository.get_quarters_year_to_year_records(
+            "year_to_year", "revenue", "actuals", [2021], None, dict()
+        )
+
+        self.assertEqual(metrics, [self.records[1]])
+        self.assertEqual(self.mock_session.execute.call_count, 2)
+
+    def test_get_quarters_year_to_year_records_should_reload_when_data_changes(self):
+        self.mock_response_list_query_sql(self.records)
+        self.repository.get_quarters_year_to_year_records(
+            "year_to_year", "revenue", "actuals", [2020, 2021], None, dict()
+        )
+
+        self.mock_session.execute.return_value.scalar.return_value = 2
+        repository = QuartersReportRepository(
+            self.mock_session, self.mock_query_builder, self.mock_response_sql, logger
+        )
+        repository.get_quarters_year_to_year_records(
+            "year_to_year", "revenue", "actuals", [2020, 2021], None, dict()
+        )
+
+        self.assertEqual(self.mock_session.execute.call_count, 4)
+
+    def test_get_quarters_year_to_year_records_should_reuse_records_for_same_version(
+        self,
+    ):
+        self.mock_response_list_query_sql(self.records)
+        self.repository.get_quarters_year_to_year_records(
+            "year_to_year", "revenue", "actuals", [2020, 2021], None, dict()
+        )
+
+        repository = QuartersReportRepository(
+            self.mock_session, self.mock_query_builder, self.mock_response_sql, logger
+        )
+        repository.get_quarters_year_to_year_records(
+            "year_to_year", "revenue", "actuals", [2020, 2021], None, dict()
+        )
+
+        self.assertEqual(self.mock_session.execute.call_count, 3)
+
+    def test_get_quarters_year_to_year_records_should_load_when_version_fails(self):
+        self.mock_response_list_query_sql(self.records)
+        self.mock_session.execute.return_value.scalar.side_effect = Exception("error")
+
+        metrics = self.repository.get_quarters_year_to_year_records(
+            "year_to_year", "revenue", "actuals", [2020, 2021], None, dict()
+        )
+
+        self.assertEqual(metrics, self.records)
+        self.assertEqual(metric_records_cache.metric_records_count["records"], 0)
+
     def test_get_quarters_year_to_year_records_should_fail_with_invalid_metric(self):
         with self.assertRaises(Exception) as context:
             self.repository.get_quarters_year_to_year_records(
@@ -1,9 +1,13 @@
 import logging
+import numpy
+from datetime import date
 from unittest.mock import Mock
 from unittest import TestCase, mock
 from parameterized import parameterized
 
 from src.service.quarters_report.quarters_report import QuartersReport
+from src.service.quarters_report.quarter_matrix import QuarterMatrix
+from src.service.quarters_report.quarters_layout import QuartersLayout
 from src.utils.company_anonymization import CompanyAnonymization
 from src.service.calculator.calculator_service import CalculatorService
 
@@ -191,6 +195,11 @@ class TestQuartersReport(TestCase):
             ],
         }
 
+    def mock_base_metrics_records(self, records: list) -> None:
+        self.mock_repository.get_base_metrics_records.side_effect = (
+            lambda metrics_years, *args: {metric: records for metric in metrics_years}
+        )
+
     @mock.patch(
         "src.utils.company_anonymization.CompanyAnonymization.set_company_permissions"
     )
@@ -214,7 +223,7 @@ class TestQuartersReport(TestCase):
             },
         )
         self.mock_repository.get_metric_records_by_quarters.return_value = records
-        self.mock_repository.get_functions_metric.return_value = {"actuals-revenue": {}}
+        self.mock_repository.get_metric_names.return_value = ["actuals-revenue"]
         expected_response = {
             "headers": self.response.get("headers"),
             "subheaders": self.response.get("subheaders"),
@@ -306,7 +315,7 @@ class TestQuartersReport(TestCase):
         self, mock_anonymize_companies_values, mock_set_company_permissions
     ):
         self.mock_repository.get_metric_records_by_quarters.return_value = self.records
-        self.mock_repository.get_functions_metric.return_value = {"actuals-revenue": {}}
+        self.mock_repository.get_metric_names.return_value = ["actuals-revenue"]
 
         self.report_instance.get_quarters_peers(
             "1",
@@ -350,7 +359,7 @@ class TestQuartersReport(TestCase):
 
         expected_value["averages"][2]["Q3"] = "NA"
         self.mock_repository.get_quarters_year_to_year_records.return_value = records
-        self.mock_repository.get_functions_metric.return_value = {"actuals-revenue": {}}
+        self.mock_repository.get_metric_names.return_value = ["actuals-revenue"]
 
         peers = self.report_instance.get_quarters_peers(
             "1",
@@ -374,7 +383,7 @@ class TestQuartersReport(TestCase):
         self, mock_set_company_permissions
     ):
         self.mock_repository.get_metric_records_by_quarters.return_value = self.records
-        self.mock_repository.get_functions_metric.return_value = {"actuals-revenue": {}}
+        self.mock_repository.get_metric_names.return_value = ["actuals-revenue"]
         records = self.records.copy()
         records.extend(
             [
@@ -532,7 +541,7 @@ class TestQuartersReport(TestCase):
         records = self.records.copy()
         records.extend(self.quarters_records)
         self.mock_repository.get_quarters_year_to_year_records.return_value = records
-        self.mock_repository.get_functions_metric.return_value = {"actuals-revenue": {}}
+        self.mock_repository.get_metric_names.return_value = ["actuals-revenue"]
         expected_response = {
             "headers": [
                 "Company",
@@ -636,6 +645,49 @@ class TestQuartersReport(TestCase):
         mock_set_company_permissions.assert_called()
         self.assertEqual(peers, expected_response)
 
+    @mock.patch("src.service.quarters_report.quarters_report.date")
+    @mock.patch(
+        "src.utils.company_anonymization.CompanyAnonymization.set_company_permissions"
+    )
+    def test_get_quarters_peers_actuals_plus_budget_LTM_with_gapped_years_should_return_NA(
+        self, mock_set_company_permissions, mock_date
+    ):
+        mock_date.today.return_value = date(2023, 12, 5)
+        self.mock_repository.get_quarters_year_to_year_records.return_value = [
+            {
+                "id": id,
+                "name": name,
+                "scenario": f"Actuals-{year}",
+                "period_name": period,
+                "value": value,
+            }
+            for id, name in [("1", "Test"), ("2", "Company")]
+            for year in ["2018", "2020"]
+            for period, value in zip(["Q1", "Q2", "Q3", "Q4"], [10, 20, 30, 40])
+        ]
+        self.mock_repository.get_metric_names.return_value = ["actuals-revenue"]
+
+        peers = self.report_instance.get_quarters_peers(
+            "1",
+            "user",
+            "last_twelve_months",
+            "revenue",
+            "actuals_budget",
+            ["2018", "2020"],
+            "Q4",
+            False,
+            True,
+        )
+
+        mock_set_company_permissions.assert_called()
+        self.assertEqual(
+            peers["company_comparison_data"]["quarters"][1]["Full Year"], "NA"
+        )
+        self.assertEqual(
+            peers["peers_comparison_data"][0]["quarters"][1]["Full Year"], "NA"
+        )
+        self.assertEqual(peers["averages"][-1], {"Full Year": "NA"})
+
     @mock.patch(
         "src.utils.company_anonymization.CompanyAnonymization.set_company_permissions"
     )
@@ -645,7 +697,7 @@ class TestQuartersReport(TestCase):
         records = self.records.copy()
         records.extend(self.quarters_records)
         self.mock_repository.get_quarters_year_to_year_records.return_value = records
-        self.mock_repository.get_functions_metric.return_value = {"actuals-revenue": {}}
+        self.mock_repository.get_metric_names.return_value = ["actuals-revenue"]
         expected_response = {
             "headers": self.response.get("headers"),
             "subheaders": self.response.get("subheaders"),
@@ -727,7 +779,7 @@ class TestQuartersReport(TestCase):
         records = self.records.copy()
         records.extend(self.quarters_records)
         self.mock_repository.get_quarters_year_to_year_records.return_value = records
-        self.mock_repository.get_functions_metric.return_value = {"actuals-revenue": {}}
+        self.mock_repository.get_metric_names.return_value = ["actuals-revenue"]
         expected_data = self.response
         expected_data["averages"][1]["Full Year"] = 22.0
         expected_response = {
@@ -1091,42 +1143,26 @@ class TestQuartersReport(TestCase):
         data = {
             "1": {
                 "quarters": [
-                    {
-                        "year": 2023,
-                    }
+                    {"year": 2022, "Q1": 1.0, "Full Year": "NA"},
+                    {"year": 2023, "Q1": 4.0, "Full Year": "NA", "vs": "NA"},
                 ]
             }
         }
-        full_year_dict = {"1": {"2023": [1, 2, 3, 4]}}
-        years = ["2023"]
-        subheaders_dict = {"2023": ["Q1"]}
-        full_year_average_dict = (
-            self.report_instance._QuartersReport__update_full_year_ltm(
-                data, full_year_dict, years, subheaders_dict
-            )
+        matrix = QuarterMatrix(["2022", "2023"])
+        matrix.add_value("1", 2022, "Q1", 1)
+        full_year = numpy.array([[numpy.nan, 10.0]])
+        layout = QuartersLayout(
+            {"2022": ["Q2", "Q3", "Q4"], "2023": ["Q1", "Full Year"]}
         )
 
-        self.assertEqual(full_year_average_dict, {"2023": [10]})
-
-    def test__get_ltm_full_year_base_scenarios(self):
-        subheaders_dict = {"2020": ["Q1"], "2021": {"Q2", "Q3", "Q4", "Full Year"}}
-        year = 2020
-        period = "Q1"
-        company_id = "1"
-        company = {"value": 12}
-        quarters_per_companies = {}
-        expected_quarters_per_companies = {"1": {"2021": [12.0]}}
-
-        self.report_instance._QuartersReport__get_ltm_full_year_base_scenarios(
-            subheaders_dict,
-            year,
-            period,
-            company_id,
-            company,
-            quarters_per_companies,
+        self.report_instance._QuartersReport__update_full_year_ltm(
+            data, full_year, matrix, layout
         )
 
-        self.assertEqual(quarters_per_companies, expected_quarters_per_companies)
+        self.assertEqual(
+            data["1"]["quarters"],
+            [{"year": "2022"}, {"Q1": 4.0, "Full Year": 10.0, "year": "2023"}],
+        )
 
     @mock.patch(
         "src.utils.company_anonymization.CompanyAnonymization.set_company_permissions"
@@ -1150,8 +1186,8 @@ class TestQuartersReport(TestCase):
                 "count_periods": 4,
             }
         )
-        self.mock_repository.get_metric_records_with_base_scenarios.return_value = data
-        self.mock_repository.get_functions_metric.return_value = {"actuals-revenue": {}}
+        self.mock_base_metrics_records(data)
+        self.mock_repository.get_metric_names.return_value = ["actuals-revenue"]
         expected_value = {
             "headers": ["Company", "2020", "", "", "", "", "2021", "", "", "", "", ""],
             "subheaders": [
@@ -1269,7 +1305,7 @@ class TestQuartersReport(TestCase):
             }
         )
         self.mock_repository.get_quarters_year_to_year_records.return_value = data
-        self.mock_repository.get_functions_metric.return_value = {"actuals-revenue": {}}
+        self.mock_repository.get_metric_names.return_value = ["actuals-revenue"]
         expected_value = {
             "headers": ["Company", "2020", "", "", "", "", "2021", "", "", "", "", ""],
             "subheaders": [
@@ -1386,8 +1422,8 @@ class TestQuartersReport(TestCase):
                 "count_periods": 4,
             }
         )
-        self.mock_repository.get_metric_records_with_base_scenarios.return_value = data
-        self.mock_repository.get_functions_metric.return_value = {"actuals-revenue": {}}
+        self.mock_base_metrics_records(data)
+        self.mock_repository.get_metric_names.return_value = ["actuals-revenue"]
         expected_value = {
             "headers": ["Company", "2020", "", "", "", "", "2021", "", "", "", "", ""],
             "subheaders": [
@@ -1505,7 +1541,7 @@ class TestQuartersReport(TestCase):
             }
         )
         self.mock_repository.get_quarters_year_to_year_records.return_value = data
-        self.mock_repository.get_functions_metric.return_value = {"actuals-revenue": {}}
+        self.mock_repository.get_metric_names.return_value = ["actuals-revenue"]
         expected_value = {
             "headers": ["Company", "2020", "", "", "", "", "2021", "", "", "", "", ""],
             "subheaders": [
@@ -1751,9 +1787,7 @@ class TestQuartersReport(TestCase):
         self.assertEqual(retention, expected_value)
 
     def test_get_net_retention_records_base_scenarios_success_should_return_data(self):
-        self.mock_repository.get_metric_records_with_base_scenarios.return_value = [
-            self.records[0]
-        ]
+        self.mock_base_metrics_records([self.records[0]])
         expected_value = {
             "1": {
                 "id": "1",
@@ -2076,9 +2110,7 @@ class TestQuartersReport(TestCase):
     def test_get_new_bookings_growth_records_base_scenarios_success_should_return_data(
         self,
     ):
-        self.mock_repository.get_metric_records_with_base_scenarios.return_value = [
-            self.records[0]
-        ]
+        self.mock_base_metrics_records([self.records[0]])
         expected_value = {
             "1": {
                 "id": "1",
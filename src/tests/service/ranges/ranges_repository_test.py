@@ -136,6 +136,18 @@ class TestRangesRepository(TestCase):
         self.assertTrue(updated)
         self.mock_session.execute.assert_called_once()
 
+    def test_modify_metric_ranges_should_stamp_updated_ranges(self):
+        updated = self.repository.modify_metric_ranges(
+            "new_bookings_metric",
+            "million",
+            [],
+            [],
+            [{"id": "1", "min_value": 30, "max_value": 40}],
+        )
+
+        self.assertTrue(updated)
+        self.assertIn("updated_at = now()", self.mock_session.execute.call_args.args[0])
+
     def test_modify_metric_ranges_with_limit_ranges_to_add_should_call_db_session_execute(
         self,
     ):
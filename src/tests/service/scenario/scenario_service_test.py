@@ -47,6 +47,9 @@ class TestScenarioService(TestCase):
 
     def get_metric_types_response(self, response: list):
         self.mock_metric_service.get_metric_types.return_value = ["Revenue", "Ebitda"]
+        self.mock_metric_service.is_metric_type.side_effect = (
+            lambda name: name in response
+        )
         return self
 
     @parameterized.expand(
@@ -1,5 +1,6 @@
 from unittest import TestCase
 from unittest.mock import Mock
+import src.utils.company_anonymization as functions
 from src.utils.company_anonymization import CompanyAnonymization
 
 
@@ -15,11 +16,11 @@ class TestCompanyAnonymization(TestCase):
             "name": "Test Company",
             "is_public": True,
         }
-        self.anonymized_name = "jg34-xxxx"
         self.mock_user_service = Mock()
         self.company_anonymization_instance = CompanyAnonymization(
             self.mock_user_service
         )
+        functions.company_permissions.clear()
 
     def mock_get_user_company_permissions(self, response):
         attrs = {"get_user_company_permissions.return_value": response}
@@ -27,7 +28,7 @@ class TestCompanyAnonymization(TestCase):
 
     def test_set_company_permissions_should_return_valid_list(self):
         self.mock_get_user_company_permissions(self.permissions)
-        expected_companies = ["1", "2"]
+        expected_companies = frozenset(["1", "2"])
 
         self.company_anonymization_instance.set_company_permissions(self.username)
 
@@ -35,6 +36,35 @@ class TestCompanyAnonymization(TestCase):
             self.company_anonymization_instance.companies, expected_companies
         )
 
+    def test_set_company_permissions_should_use_cached_permissions(self):
+        self.mock_get_user_company_permissions(self.permissions)
+        self.company_anonymization_instance.set_company_permissions(self.username)
+
+        companies = CompanyAnonymization(
+            self.mock_user_service
+        ).set_company_permissions(self.username)
+
+        self.assertEqual(companies, frozenset(["1", "2"]))
+        self.mock_user_service.get_user_company_permissions.assert_called_once()
+
+    def test_set_company_permissions_after_policy_change_should_reload_permissions(
+        self,
+    ):
+        self.mock_get_user_company_permissions(self.permissions)
+        self.mock_user_service.policy_manager.get_policy_version.return_value = (2, 2)
+        self.company_anonymization_instance.set_company_permissions(self.username)
+        self.mock_get_user_company_permissions(self.permissions[:1])
+
+        self.mock_user_service.policy_manager.get_policy_version.return_value = (1, 2)
+        companies = self.company_anonymization_instance.set_company_permissions(
+            self.username
+        )
+
+        self.assertEqual(companies, frozenset(["1"]))
+        self.assertEqual(
+            self.mock_user_service.get_user_company_permissions.call_count, 2
+        )
+
     def test_anonymize_company_name_should_return_anonimazed_data(self):
         expected_id = "1-xxxx"
 
@@ -100,6 +130,24 @@ class TestCompanyAnonymization(TestCase):
 
         self.assertEqual(companies_anonymized, [self.company])
 
+    def test_anonymize_companies_list_should_update_companies_in_place(self):
+        companies = [self.company.copy()]
+
+        companies_anonymized = (
+            self.company_anonymization_instance.anonymize_companies_list(
+                companies, "id"
+            )
+        )
+
+        self.assertIs(companies_anonymized, companies)
+        self.assertEqual(companies[0]["name"], "1-xxxx")
+
+    def test_is_company_anonymized_should_return_true_for_anonymized_companies(self):
+        self.company_anonymization_instance.anonymize_company_name("1")
+
+        self.assertTrue(self.company_anonymization_instance.is_company_anonymized("1"))
+        self.assertFalse(self.company_anonymization_instance.is_company_anonymized("2"))
+
     def test_hide_companies_should_return_only_allowed_companies(self):
         self.mock_get_user_company_permissions(self.permissions)
         companies = [
@@ -117,17 +165,3 @@ class TestCompanyAnonymization(TestCase):
         )
 
         self.assertEqual(hiden_companies, [self.company])
-
-    def test_is_anonymized_return_true(self):
-        is_anonymize = self.company_anonymization_instance.is_anonymized(
-            self.anonymized_name
-        )
-
-        self.assertTrue(is_anonymize)
-
-    def test_is_anonymized_return_false(self):
-        company_name = "koeu-xx"
-
-        is_anonymize = self.company_anonymization_instance.is_anonymized(company_name)
-
-        self.assertFalse(is_anonymize)
@@ -0,0 +1,86 @@
+from unittest import TestCase, mock
+from unittest.mock import Mock
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.pool import NullPool, QueuePool
+from db.utils.connection import (
+    RecyclingSession,
+    create_db_engine,
+    get_connect_args,
+    get_pool_metrics,
+    log_pool_metrics,
+)
+
+
+class TestConnection(TestCase):
+    @mock.patch.dict("os.environ", {"DB_POOL_SIZE": "3"})
+    def test_create_db_engine_should_use_pre_pinged_pool(self):
+        engine = create_db_engine()
+
+        self.assertIsInstance(engine.pool, QueuePool)
+        self.assertTrue(engine.pool._pre_ping)
+        self.assertEqual(engine.pool.size(), 3)
+
+    @mock.patch.dict("os.environ", {"DB_PROXY_MODE": "true"})
+    def test_create_db_engine_in_proxy_mode_should_not_pool_connections(self):
+        engine = create_db_engine()
+
+        self.assertIsInstance(engine.pool, NullPool)
+
+    @mock.patch.dict("os.environ", {"DB_STATEMENT_TIMEOUT": "1000"})
+    def test_get_connect_args_should_set_statement_timeout_and_keepalives(self):
+        connect_args = get_connect_args(False)
+
+        self.assertEqual(connect_args["options"], "-c statement_timeout=1000")
+        self.assertEqual(connect_args["keepalives"], 1)
+
+    def test_get_connect_args_without_statement_timeout_should_not_send_options(self):
+        connect_args = get_connect_args(False)
+
+        self.assertNotIn("options", connect_args)
+
+    @mock.patch.dict("os.environ", {"DB_STATEMENT_TIMEOUT": "1000"})
+    def test_get_connect_args_in_proxy_mode_should_not_send_options(self):
+        connect_args = get_connect_args(True)
+
+        self.assertNotIn("options", connect_args)
+
+    def test_get_pool_metrics_should_return_pool_status(self):
+        engine = create_db_engine()
+
+        metrics = get_pool_metrics(engine)
+
+        self.assertEqual(metrics["pool"], "QueuePool")
+        self.assertEqual(metrics["checkedout"], 0)
+
+    @mock.patch("db.utils.connection.logger")
+    def test_log_pool_metrics_should_log_pool_status(self, mock_logger):
+        engine = create_db_engine()
+
+        log_pool_metrics(engine, "checkout", Mock(), Mock(), Mock())
+
+        mock_logger.info.assert_called_once_with(
+            '{"db_pool_event": "checkout", "pool": "QueuePool", "size": 1, '
+            '"checkedin": 0, "checkedout": 0, "overflow": -1}'
+        )
+
+    @mock.patch("db.utils.connection.log_pool_metrics")
+    def test_create_db_engine_should_log_pool_metrics_on_checkout(
+        self, mock_log_pool_metrics
+    ):
+        engine = create_db_engine()
+
+        engine.pool.dispatch.checkout(Mock(), Mock(), Mock())
+
+        mock_log_pool_metrics.assert_called_once()
+
+    @mock.patch("sqlalchemy.orm.Session.execute")
+    @mock.patch("sqlalchemy.orm.Session.rollback")
+    def test_recycling_session_should_rollback_when_statement_fails(
+        self, mock_rollback, mock_execute
+    ):
+        mock_execute.side_effect = DBAPIError("SELECT 1", {}, Exception("closed"))
+
+        with self.assertRaises(DBAPIError):
+            RecyclingSession().execute("SELECT 1")
+
+        mock_rollback.assert_called_once()
@@ -0,0 +1,81 @@
+import src.tests.config_imports  # noqa
+from unittest import TestCase
+import src.utils.metric_records_cache as functions
+from src.utils.metric_records_cache import (
+    add_metric_records,
+    get_cached_metric_records,
+    get_filters_key,
+    get_update_version_query,
+)
+
+
+class TestMetricRecordsCache(TestCase):
+    def setUp(self):
+        functions.clear_metric_records()
+        self.records = [
+            {"id": "1", "scenario": "Actuals-2021", "period_name": "Q1", "value": 1},
+            {"id": "1", "scenario": "Actuals-2022", "period_name": "Q1", "value": 2},
+        ]
+
+    def test_get_filters_key_should_ignore_values_order(self):
+        key = get_filters_key({"sector": ["'b'", "'a'"], "vertical": []})
+        other_key = get_filters_key({"vertical": [], "sector": ["'a'", "'b'"]})
+
+        self.assertEqual(key, other_key)
+
+    def test_get_cached_metric_records_should_return_copies(self):
+        add_metric_records(("revenue",), ["2021", "2022"], self.records, 1)
+
+        records = get_cached_metric_records(("revenue",), [2022, 2021], 1)
+        records[0]["value"] = 10
+
+        self.assertEqual(
+            get_cached_metric_records(("revenue",), [2021, 2022], 1), self.records
+        )
+
+    def test_get_cached_metric_records_should_filter_cached_years(self):
+        add_metric_records(("revenue",), ["2021", "2022"], self.records, 1)
+
+        records = get_cached_metric_records(("revenue",), ["2022"], 1)
+        missing_records = get_cached_metric_records(("revenue",), ["2022", "2023"], 1)
+
+        self.assertEqual(records, self.records[1:])
+        self.assertIsNone(missing_records)
+
+    def test_get_cached_metric_records_should_expire_records(self):
+        add_metric_records(("revenue",), ["2021", "2022"], self.records, 1)
+        functions.metric_records[(("revenue",), ("2021", "2022"))]["expires_at"] = 0
+
+        records = get_cached_metric_records(("revenue",), ["2021", "2022"], 1)
+
+        self.assertIsNone(records)
+        self.assertEqual(functions.metric_records_count["records"], 0)
+
+    def test_get_cached_metric_records_should_reload_when_version_changes(self):
+        add_metric_records(("revenue",), ["2021", "2022"], self.records, 1)
+
+        records = get_cached_metric_records(("revenue",), ["2021", "2022"], 2)
+
+        self.assertIsNone(records)
+        self.assertEqual(functions.metric_records_count["records"], 0)
+
+    def test_get_update_version_query_should_bump_metric_records_version(self):
+        query = get_update_version_query()
+
+        self.assertIn("UPDATE data_version SET version = version + 1", query)
+        self.assertIn("WHERE name = 'metric_records'", query)
+
+    def test_add_metric_records_should_evict_least_recently_used(self):
+        size = functions.METRIC_RECORDS_SIZE
+        functions.METRIC_RECORDS_SIZE = 4
+        try:
+            add_metric_records(("revenue",), ["2021", "2022"], self.records, 1)
+            add_metric_records(("ebitda",), ["2021", "2022"], self.records, 1)
+            get_cached_metric_records(("revenue",), ["2021"], 1)
+            add_metric_records(("growth",), ["2021", "2022"], self.records, 1)
+        finally:
+            functions.METRIC_RECORDS_SIZE = size
+
+        self.assertIsNotNone(get_cached_metric_records(("revenue",), ["2021"], 1))
+        self.assertIsNone(get_cached_metric_records(("ebitda",), ["2021"], 1))
+        self.assertEqual(functions.metric_records_count["records"], 4)
@@ -0,0 +1,75 @@
+import src.tests.config_imports  # noqa
+from unittest import TestCase, mock
+from sqlalchemy import create_engine
+from sqlalchemy.pool import StaticPool
+import policy_manager as functions
+from policy_manager import PolicyManager
+
+
+class TestPolicyManager(TestCase):
+    def setUp(self):
+        self.engine = create_engine("sqlite://", poolclass=StaticPool)
+        functions.engine = None
+        functions.enforcer = None
+        functions.policy_version = None
+        functions.loaded_users.clear()
+        self.rules = [
+            ["user_1", "company_1", "read", "Company"],
+            ["user_2", "company_2", "read", "Company"],
+        ]
+
+    def get_policy_manager(self) -> PolicyManager:
+        with mock.patch.object(
+            functions, "MODEL_PATH", "./casbin_configuration/model.conf"
+        ), mock.patch.object(functions, "create_db_engine", return_value=self.engine):
+            return PolicyManager()
+
+    def test_policy_manager_should_share_enforcer(self):
+        first_manager = self.get_policy_manager()
+        second_manager = self.get_policy_manager()
+
+        self.assertIs(first_manager.e, second_manager.e)
+
+    def test_get_permissions_should_load_only_user_policies(self):
+        self.get_policy_manager().add_policies(self.rules)
+        functions.enforcer.clear_policy()
+        functions.loaded_users.clear()
+
+        permissions = self.get_policy_manager().get_permissions("user_1")
+
+        self.assertEqual(permissions, [self.rules[0]])
+        self.assertEqual(functions.enforcer.get_policy(), [self.rules[0]])
+
+    def test_verify_access_should_reload_policies_when_rules_change(self):
+        policy_manager = self.get_policy_manager()
+        policy_manager.add_policies(self.rules)
+        self.assertFalse(
+            policy_manager.verify_access("user_1", "company_3", "read", "Company")
+        )
+
+        with self.engine.begin() as connection:
+            connection.execute(
+                functions.casbin_sqlalchemy_adapter.CasbinRule.__table__.insert(),
+                {
+                    "ptype": "p",
+                    "v0": "user_1",
+                    "v1": "company_3",
+                    "v2": "read",
+                    "v3": "Company",
+                },
+            )
+
+        has_access = self.get_policy_manager().verify_access(
+            "user_1", "company_3", "read", "Company"
+        )
+
+        self.assertTrue(has_access)
+
+    def test_get_policy_version_should_change_when_rule_is_removed(self):
+        policy_manager = self.get_policy_manager()
+        policy_manager.add_policies(self.rules)
+        version = policy_manager.get_policy_version()
+
+        policy_manager.remove_policy("user_1", "company_1", "read", "Company")
+
+        self.assertNotEqual(policy_manager.get_policy_version(), version)
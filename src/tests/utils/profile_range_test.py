@@ -1,6 +1,7 @@
 from unittest import TestCase
 import logging
 from unittest.mock import Mock
+import src.utils.profile_range as functions
 from src.utils.profile_range import ProfileRange, ProfileType
 from parameterized import parameterized
 
@@ -22,7 +23,11 @@ class TestProfileRange(TestCase):
                 "min_value": 100,
             },
         ]
+        functions.profile_ranges.update(
+            {"version": None, "expires_at": 0, "ranges": dict()}
+        )
         self.mock_session = Mock()
+        self.mock_session.execute.return_value.first.return_value = (2, "2022-12-23")
         self.mock_query_builder = Mock()
         self.mock_response_sql = Mock()
         self.profile_range_instance = ProfileRange(
@@ -33,13 +38,57 @@ class TestProfileRange(TestCase):
         attrs = {"process_query_list_results.return_value": response}
         self.mock_response_sql.configure_mock(**attrs)
 
+    def get_value_range_records(self, type: str) -> list:
+        return [{**value_range, "type": type} for value_range in self.ranges]
+
     def test_get_ranges_success(self):
-        self.mock_response_list_query_sql(self.ranges)
+        self.mock_response_list_query_sql(
+            self.get_value_range_records(ProfileType.SIZE)
+        )
 
         ranges = self.profile_range_instance.get_profile_ranges(ProfileType.SIZE)
 
         self.assertEqual(ranges, self.ranges)
 
+    def test_get_ranges_should_load_all_profiles_once(self):
+        self.mock_response_list_query_sql(
+            self.get_value_range_records("revenue")
+            + self.get_value_range_records("growth")
+        )
+
+        revenue_ranges = self.profile_range_instance.get_profile_ranges("revenue")
+        growth_ranges = self.profile_range_instance.get_profile_ranges("growth")
+        unknown_ranges = self.profile_range_instance.get_profile_ranges("gross_margin")
+
+        self.assertEqual(revenue_ranges, self.ranges)
+        self.assertEqual(growth_ranges, self.ranges)
+        self.assertEqual(unknown_ranges, [])
+        self.assertEqual(self.mock_session.execute.call_count, 2)
+
+    def test_get_ranges_should_reuse_ranges_while_version_is_unchanged(self):
+        self.mock_response_list_query_sql(self.get_value_range_records("revenue"))
+        self.profile_range_instance.get_profile_ranges("revenue")
+
+        ranges = ProfileRange(
+            self.mock_session, self.mock_query_builder, logger, self.mock_response_sql
+        ).get_profile_ranges("revenue")
+
+        self.assertEqual(ranges, self.ranges)
+        self.assertEqual(self.mock_session.execute.call_count, 3)
+
+    def test_get_ranges_should_reload_when_ranges_version_changes(self):
+        self.mock_response_list_query_sql(self.get_value_range_records("revenue"))
+        self.profile_range_instance.get_profile_ranges("revenue")
+        self.mock_response_list_query_sql(self.get_value_range_records("growth"))
+
+        self.mock_session.execute.return_value.first.return_value = (3, "2022-12-24")
+        ranges = ProfileRange(
+            self.mock_session, self.mock_query_builder, logger, self.mock_response_sql
+        ).get_profile_ranges("revenue")
+
+        self.assertEqual(ranges, [])
+        self.assertEqual(self.mock_session.execute.call_count, 4)
+
     def test_get_ranges_failed(self):
         self.profile_range_instance.session.execute.side_effect = Exception("error")
 
@@ -69,12 +118,54 @@ class TestProfileRange(TestCase):
         self.assertEqual(response, "NA")
 
     def test_get_range_from_value_without_ranges(self):
-        self.mock_response_list_query_sql(self.ranges)
+        self.mock_response_list_query_sql(
+            self.get_value_range_records(ProfileType.SIZE)
+        )
 
         response = self.profile_range_instance.get_range_from_value(40)
 
         self.assertEqual(response, "$30-<50 million")
 
+    @parameterized.expand(
+        [
+            [29, "NA"],
+            [30, "$30-<50 million"],
+            [50, "NA"],
+            [100, "100+"],
+            [float("nan"), "NA"],
+        ]
+    )
+    def test_get_range_from_value_with_ranges(self, value, expected_label):
+        response = self.profile_range_instance.get_range_from_value(
+            value, ranges=self.ranges
+        )
+
+        self.assertEqual(response, expected_label)
+
+    def test_get_range_from_value_with_overlapping_ranges_should_return_na(self):
+        ranges = self.ranges + [{"label": "0+", "min_value": 0, "max_value": None}]
+
+        response = self.profile_range_instance.get_range_from_value(40, ranges=ranges)
+
+        self.assertEqual(response, "NA")
+
+    def test_get_ranges_from_values_should_return_label_by_value(self):
+        values = [40, None, 10, 120, "NA", 50]
+
+        labels = self.profile_range_instance.get_ranges_from_values(
+            values, ranges=self.ranges
+        )
+
+        self.assertEqual(labels, ["$30-<50 million", "NA", "NA", "100+", "NA", "NA"])
+
+    def test_get_range_index_should_compile_ranges_once(self):
+        functions.clear_range_indexes()
+
+        self.profile_range_instance.get_range_from_value(40, ranges=self.ranges)
+        self.profile_range_instance.get_ranges_from_values([40], ranges=self.ranges)
+
+        self.assertEqual(len(functions.range_indexes), 1)
+
     @parameterized.expand(
         [
             [
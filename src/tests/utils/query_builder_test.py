@@ -1,4 +1,5 @@
 from unittest import TestCase
+from sqlalchemy.dialects import postgresql
 from src.utils.query_builder import QuerySQLBuilder
 from src.utils.commons_functions import remove_white_spaces
 
@@ -497,3 +498,50 @@ class TestQueryBuilder(TestCase):
 
         self.assertTrue(where_query != "")
         self.assertTrue(company_name in where_query)
+
+    def test_add_sql_where_equal_parameters_should_add_bind_conditions(self):
+        conditions = {"company.id": "123", "company.name": ["Test", None], "tag": None}
+
+        query_builder = self.query_sql_instance.add_sql_where_equal_parameters(
+            conditions
+        )
+
+        self.assertEqual(
+            query_builder.where_conditions_conj, ["company.id = :company_id"]
+        )
+        self.assertEqual(
+            query_builder.where_conditions_disj, ["company.name IN :company_name"]
+        )
+        self.assertEqual(
+            query_builder.params, {"company_id": "123", "company_name": ["Test"]}
+        )
+
+    def test_add_sql_where_equal_parameters_with_repeated_column(self):
+        query_builder = self.query_sql_instance.add_sql_where_equal_parameters(
+            {"company.id": "123"}
+        ).add_sql_where_equal_parameters({"company.id": "456"})
+
+        self.assertEqual(
+            query_builder.params, {"company_id": "123", "company_id_1": "456"}
+        )
+
+    def test_get_statement_should_bind_params_and_reuse_template(self):
+        statements = [
+            self.query_sql_instance.add_table_name(self.table_name)
+            .add_sql_where_equal_parameters({"id": value, "name": ["a", "b"]})
+            .build()
+            .get_statement()
+            for value in ["1", "2"]
+        ]
+
+        compiled = [
+            statement.compile(
+                dialect=postgresql.dialect(),
+                compile_kwargs={"render_postcompile": True},
+            )
+            for statement in statements
+        ]
+        self.assertEqual(str(compiled[0]), str(compiled[1]))
+        self.assertEqual(compiled[0].params.get("id"), "1")
+        self.assertEqual(compiled[1].params.get("id"), "2")
+        self.assertEqual(self.query_sql_instance.params, dict())
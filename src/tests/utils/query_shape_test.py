@@ -0,0 +1,57 @@
+from unittest import TestCase
+from src.utils.query_builder import QuerySQLBuilder
+from src.utils.query_shape import QueryShape
+from src.utils.commons_functions import remove_white_spaces
+
+
+class TestQueryShape(TestCase):
+    def setUp(self):
+        self.shape = QueryShape("test").join(
+            "other", "other.test_id", "test.id", QuerySQLBuilder.JoinType.LEFT
+        )
+
+    def test_shape_should_be_immutable(self):
+        with self.assertRaises(AttributeError):
+            self.shape.table_name = "other"
+
+    def test_compose_shape_should_not_modify_base_shape(self):
+        self.shape.select(["test.id"]).group(["test.id"]).join(
+            "third", "third.id", "other.id"
+        )
+
+        self.assertEqual(self.shape.select_conditions, ())
+        self.assertEqual(self.shape.group_by, ())
+        self.assertEqual(len(self.shape.join_clauses), 1)
+
+    def test_build_should_return_same_query_as_query_builder(self):
+        where_conditions = {"test.name": "'name'", "other.id": ["'1'", "'2'"]}
+        expected_query = (
+            QuerySQLBuilder()
+            .add_table_name("test")
+            .add_select_conditions(["test.id", "count(other.id)"])
+            .add_join_clause(
+                {"other": {"from": "other.test_id", "to": "test.id"}},
+                QuerySQLBuilder.JoinType.LEFT,
+            )
+            .add_sql_where_equal_condition(where_conditions)
+            .add_sql_group_by_condition(["test.id"])
+            .add_sql_order_by_condition(["test.id"], QuerySQLBuilder.Order.ASC)
+            .build()
+            .get_query()
+        )
+
+        query = (
+            self.shape.select(["test.id", "count(other.id)"])
+            .group(["test.id"])
+            .order(["test.id"], QuerySQLBuilder.Order.ASC)
+            .build(where_conditions)
+        )
+
+        self.assertEqual(
+            remove_white_spaces(query), remove_white_spaces(expected_query)
+        )
+
+    def test_build_without_select_conditions_should_select_all(self):
+        query = QueryShape("test").build()
+
+        self.assertEqual(remove_white_spaces(query), "SELECT * FROM test")
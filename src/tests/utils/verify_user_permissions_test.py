@@ -13,6 +13,7 @@ class TestVerifyUserPermissionsFunctions(TestCase):
         self.username = "user_id"
         self.user = {"UserAttributes": [{"Name": "email", "Value": self.username}]}
         self.mock_client = Mock()
+        functions.identities.clear()
 
     def config_mock_admin_list_groups_for_user(self, response):
         attrs = {"admin_list_groups_for_user.return_value": response}
@@ -90,3 +91,50 @@ class TestVerifyUserPermissionsFunctions(TestCase):
             functions.verify_user_access(None)
 
         self.assertEqual(str(context.exception), error_message)
+
+    @mock.patch("src.utils.verify_user_permissions.get_cognito_client")
+    def test_get_user_id_from_event_with_forwarded_claims_should_skip_cognito(
+        self, mock_get_cognito_client
+    ):
+        event = read("sample_event_user.json")
+        event["requestContext"]["authorizer"].update(
+            {"email": self.username, "groups": "demo_admin_group,Google"}
+        )
+
+        user_id = functions.get_user_id_from_event(event)
+        identity = functions.get_user_identity(user_id)
+
+        self.assertEqual(
+            identity,
+            {"username": "user_id", "email": self.username, "roles": ["admin"]},
+        )
+        mock_get_cognito_client.assert_not_called()
+
+    @mock.patch("src.utils.verify_user_permissions.get_email_from_cognito")
+    @mock.patch("src.utils.verify_user_permissions.get_roles_from_cognito")
+    def test_get_user_identity_should_call_cognito_once_per_principal(
+        self, mock_get_roles_from_cognito, mock_get_email_from_cognito
+    ):
+        mock_get_roles_from_cognito.return_value = ["admin"]
+        mock_get_email_from_cognito.return_value = self.username
+
+        functions.verify_user_access("id")
+        functions.get_username_from_user_id("id")
+        identity = functions.get_user_identity("id")
+
+        self.assertEqual(identity["roles"], ["admin"])
+        self.assertEqual(identity["email"], self.username)
+        mock_get_roles_from_cognito.assert_called_once()
+        mock_get_email_from_cognito.assert_called_once()
+
+    @mock.patch("src.utils.verify_user_permissions.get_roles_from_cognito")
+    def test_get_user_identity_should_reload_expired_identity(
+        self, mock_get_roles_from_cognito
+    ):
+        mock_get_roles_from_cognito.return_value = ["customer"]
+        functions.identities["id"] = {"expires_at": 0, "roles": ["admin"]}
+
+        has_access = functions.verify_user_access("id")
+
+        self.assertFalse(has_access)
+        mock_get_roles_from_cognito.assert_called_once()
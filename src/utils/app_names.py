@@ -15,6 +15,7 @@ class TableNames(StrEnum):
     METRIC_SORT = "metric_sort"
     TAG = "tag"
     COMPANY_TAG = "company_tag"
+    DATA_VERSION = "data_version"
 
 
 class ScenarioNames(StrEnum):
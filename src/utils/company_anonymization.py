@@ -1,45 +1,58 @@
-import re
+import os
+import time
+
+PERMISSIONS_CACHE_TTL = int(os.environ.get("PERMISSIONS_CACHE_TTL", 60))
+company_permissions = dict()
 
 
 class CompanyAnonymization:
     def __init__(self, user_details_service) -> None:
         self.user_details_service = user_details_service
-        self.companies = []
+        self.companies = frozenset()
+        self.anonymized_companies = set()
+
+    def set_company_permissions(self, username) -> frozenset:
+        self.anonymized_companies = set()
+        version = self.user_details_service.policy_manager.get_policy_version()
+        cached_permissions = company_permissions.get(username)
+        if (
+            cached_permissions
+            and cached_permissions["version"] == version
+            and time.time() < cached_permissions["expires_at"]
+        ):
+            self.companies = cached_permissions["companies"]
+            return self.companies
 
-    def set_company_permissions(self, username) -> list:
         permissions = self.user_details_service.get_user_company_permissions(username)
-        self.companies = [
+        self.companies = frozenset(
             permission.get("id") for permission in permissions if permission.get("id")
-        ]
+        )
+        company_permissions[username] = {
+            "companies": self.companies,
+            "version": version,
+            "expires_at": time.time() + PERMISSIONS_CACHE_TTL,
+        }
+        return self.companies
 
     def anonymize_company_name(self, company_id: str) -> str:
+        self.anonymized_companies.add(company_id)
         prefix_name = company_id[0:4]
         return prefix_name + "-xxxx"
 
-    def anonymize_companies_list(self, results: list, key: str) -> list:
-        def check_permission(company):
-            if company.get(key) in self.companies:
-                return company
-            return {
-                **company,
-                "name": self.anonymize_company_name(company.get(key)),
-            }
+    def is_company_anonymized(self, company_id: str) -> bool:
+        return company_id in self.anonymized_companies
 
-        anonymized_companies_list = list(map(lambda x: check_permission(x), results))
-        return anonymized_companies_list
+    def anonymize_companies_list(self, results: list, key: str) -> list:
+        for company in results:
+            self.anonymize_company_description(company, key)
+        return results
 
     def anonymize_company_description(self, result: dict, key: str) -> dict:
-        if result.get(key) in self.companies:
-            return result
-        return {
-            **result,
-            "name": self.anonymize_company_name(result.get(key)),
-        }
+        company_id = result.get(key)
+        if company_id not in self.companies:
+            result["name"] = self.anonymize_company_name(company_id)
+        return result
 
     def hide_companies(self, results: list, key: str) -> list:
         hiden_companies = list(filter(lambda x: x.get(key) in self.companies, results))
         return hiden_companies
-
-    def is_anonymized(self, companie_name: str):
-        matched = re.match(r"[\w][\w][\w][\w]-[x][x][x][x]", companie_name)
-        return bool(matched)
@@ -0,0 +1,85 @@
+import os
+import time
+from collections import OrderedDict
+from typing import Union
+from app_names import TableNames
+
+METRIC_RECORDS_TTL = int(os.environ.get("METRIC_RECORDS_TTL", 60))
+METRIC_RECORDS_SIZE = int(os.environ.get("METRIC_RECORDS_SIZE", 200000))
+METRIC_RECORDS_VERSION = "metric_records"
+metric_records = OrderedDict()
+metric_records_count = {"records": 0}
+
+
+def clear_metric_records() -> None:
+    metric_records.clear()
+    metric_records_count["records"] = 0
+
+
+def get_update_version_query() -> str:
+    return f"""
+        UPDATE {TableNames.DATA_VERSION} SET version = version + 1
+        WHERE name = '{METRIC_RECORDS_VERSION}'
+    """
+
+
+def get_filters_key(filters: dict) -> tuple:
+    return tuple(
+        sorted((key, tuple(sorted(values))) for key, values in filters.items())
+    )
+
+
+def get_years_key(years: list) -> tuple:
+    return tuple(sorted({str(year) for year in years}))
+
+
+def get_record_year(record: dict) -> str:
+    return str(record.get("scenario"))[-4:]
+
+
+def remove_metric_records(entry_key: tuple) -> None:
+    entry = metric_records.pop(entry_key)
+    metric_records_count["records"] -= len(entry["records"])
+
+
+def is_valid_metric_records(entry: dict, version) -> bool:
+    return entry["version"] == version and time.time() < entry["expires_at"]
+
+
+def get_cached_metric_records(key: tuple, years: list, version) -> Union[list, None]:
+    years = get_years_key(years)
+    for entry_key in reversed(metric_records):
+        cached_key, cached_years = entry_key
+        if cached_key != key or not set(years).issubset(cached_years):
+            continue
+        entry = metric_records[entry_key]
+        if not is_valid_metric_records(entry, version):
+            remove_metric_records(entry_key)
+            return None
+        metric_records.move_to_end(entry_key)
+        if cached_years == years:
+            return [dict(record) for record in entry["records"]]
+        return [
+            dict(record)
+            for record in entry["records"]
+            if get_record_year(record) in years
+        ]
+    return None
+
+
+def add_metric_records(key: tuple, years: list, records: list, version) -> None:
+    if len(records) > METRIC_RECORDS_SIZE:
+        return
+    entry_key = (key, get_years_key(years))
+    if entry_key in metric_records:
+        remove_metric_records(entry_key)
+    while metric_records and (
+        metric_records_count["records"] + len(records) > METRIC_RECORDS_SIZE
+    ):
+        remove_metric_records(next(iter(metric_records)))
+    metric_records[entry_key] = {
+        "version": version,
+        "expires_at": time.time() + METRIC_RECORDS_TTL,
+        "records": [dict(record) for record in records],
+    }
+    metric_records_count["records"] += len(records)
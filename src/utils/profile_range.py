@@ -1,7 +1,20 @@
+import os
+import time
+from bisect import bisect_right
+from collections import defaultdict
 from strenum import StrEnum
 from decimal import Decimal
 import numpy
 
+RANGE_INDEXES_SIZE = 256
+range_indexes = dict()
+PROFILE_RANGES_TTL = int(os.environ.get("PROFILE_RANGES_TTL", 300))
+profile_ranges = {"version": None, "expires_at": 0, "ranges": dict()}
+
+
+def clear_range_indexes() -> None:
+    range_indexes.clear()
+
 
 class ProfileType(StrEnum):
     SIZE = "size profile"
@@ -15,21 +28,58 @@ class ProfileRange:
         self.response_sql = response_sql
         self.logger = logger
         self.table = "value_range"
+        self.ranges_version = None
 
     def is_valid_number(self, number) -> bool:
         return number is not None and isinstance(number, (int, float, Decimal))
 
+    def get_ranges_version(self) -> tuple:
+        query = (
+            self.query_builder.add_table_name(self.table)
+            .add_select_conditions(["count(id)", "max(updated_at)"])
+            .build()
+            .get_query()
+        )
+        return tuple(self.session.execute(query).first())
+
+    def __are_profile_ranges_loaded(self) -> bool:
+        if self.ranges_version is None:
+            self.ranges_version = self.get_ranges_version()
+        return (
+            profile_ranges["version"] == self.ranges_version
+            and time.time() < profile_ranges["expires_at"]
+        )
+
+    def __load_profile_ranges(self) -> None:
+        query = (
+            self.query_builder.add_table_name(self.table)
+            .add_select_conditions(["type, label, min_value, max_value"])
+            .build()
+            .get_query()
+        )
+        result = self.session.execute(query).fetchall()
+        ranges = defaultdict(list)
+        for value_range in self.response_sql.process_query_list_results(result):
+            ranges[value_range.get("type")].append(
+                {
+                    "label": value_range.get("label"),
+                    "min_value": value_range.get("min_value"),
+                    "max_value": value_range.get("max_value"),
+                }
+            )
+        profile_ranges.update(
+            {
+                "version": self.ranges_version,
+                "expires_at": time.time() + PROFILE_RANGES_TTL,
+                "ranges": dict(ranges),
+            }
+        )
+
     def get_profile_ranges(self, type: str) -> list:
         try:
-            query = (
-                self.query_builder.add_table_name(self.table)
-                .add_select_conditions(["label, min_value, max_value"])
-                .add_sql_where_equal_condition({f"{self.table}.type": f"'{type}'"})
-                .build()
-                .get_query()
-            )
-            result = self.session.execute(query).fetchall()
-            return self.response_sql.process_query_list_results(result)
+            if not self.__are_profile_ranges_loaded():
+                self.__load_profile_ranges()
+            return list(profile_ranges["ranges"].get(f"{type}", []))
         except Exception as error:
             self.logger.info(error)
             return []
@@ -44,6 +94,63 @@ class ProfileRange:
             coincidences.append(revenue >= min_value)
         return coincidences and all(coincidences)
 
+    def __covers_interval(self, value_range: dict, lower, upper) -> bool:
+        min_value = value_range.get("min_value")
+        max_value = value_range.get("max_value")
+        covers_lower = min_value is None or (lower is not None and min_value <= lower)
+        covers_upper = max_value is None or (upper is not None and max_value >= upper)
+        return covers_lower and covers_upper
+
+    def __build_range_index(self, ranges: list) -> tuple:
+        valid_ranges = [
+            value_range
+            for value_range in ranges
+            if value_range.get("min_value") is not None
+            or value_range.get("max_value") is not None
+        ]
+        boundaries = sorted(
+            {
+                value
+                for value_range in valid_ranges
+                for value in (
+                    value_range.get("min_value"),
+                    value_range.get("max_value"),
+                )
+                if value is not None
+            }
+        )
+        labels = []
+        for position in range(len(boundaries) + 1):
+            lower = boundaries[position - 1] if position > 0 else None
+            upper = boundaries[position] if position < len(boundaries) else None
+            matches = [
+                value_range
+                for value_range in valid_ranges
+                if self.__covers_interval(value_range, lower, upper)
+            ]
+            labels.append(matches[0].get("label") if len(matches) == 1 else "NA")
+        return boundaries, labels
+
+    def get_range_index(self, ranges: list) -> tuple:
+        key = tuple(
+            (
+                value_range.get("label"),
+                value_range.get("min_value"),
+                value_range.get("max_value"),
+            )
+            for value_range in ranges
+        )
+        range_index = range_indexes.get(key)
+        if range_index is None:
+            if len(range_indexes) >= RANGE_INDEXES_SIZE:
+                clear_range_indexes()
+            range_index = self.__build_range_index(ranges)
+            range_indexes[key] = range_index
+        return range_index
+
+    def is_comparable_number(self, value) -> bool:
+        return self.is_valid_number(value) and value == value
+
     def get_range_from_value(
         self,
         value: float,
@@ -52,22 +159,31 @@ class ProfileRange:
     ) -> None:
         if ranges is None:
             ranges = self.get_profile_ranges(profile)
-        if not self.is_valid_number(value):
+        if not self.is_comparable_number(value):
             return "NA"
-        else:
-            metric_ranges = list(
-                filter(
-                    lambda range: self.verify_range(range, value),
-                    ranges,
-                )
-            )
-            profile_range = (
-                metric_ranges[-1]
-                if (len(metric_ranges) == 1 and metric_ranges[0])
-                else {"label": "NA"}
-            )
+        boundaries, labels = self.get_range_index(ranges)
+        return labels[bisect_right(boundaries, value)]
 
-            return profile_range.get("label")
+    def get_ranges_from_values(
+        self,
+        values: list,
+        profile: str = "size profile",
+        ranges: list = None,
+    ) -> list:
+        if ranges is None:
+            ranges = self.get_profile_ranges(profile)
+        boundaries, labels = self.get_range_index(ranges)
+        valid_values = [self.is_comparable_number(value) for value in values]
+        positions = numpy.searchsorted(
+            numpy.array(boundaries, dtype=float),
+            numpy.array(
+                [float(value) for value, valid in zip(values, valid_values) if valid],
+                dtype=float,
+            ),
+            side="right",
+        )
+        positions = iter(positions.tolist())
+        return [labels[next(positions)] if valid else "NA" for valid in valid_values]
 
     def get_intervals(self, values: list) -> list:
         values = [float(value) for value in values if self.is_valid_number(value)]
@@ -1,7 +1,21 @@
+import re
 from enum import Enum
+from functools import lru_cache
+from sqlalchemy import text, bindparam
+from sqlalchemy.sql.elements import TextClause
 from base_exception import QueryError
 
 
+@lru_cache(maxsize=512)
+def get_statement_template(query: str, expanding_params: tuple) -> TextClause:
+    statement = text(query)
+    if expanding_params:
+        statement = statement.bindparams(
+            *[bindparam(param, expanding=True) for param in expanding_params]
+        )
+    return statement
+
+
 class QuerySQLBuilder:
     query: str
 
@@ -15,6 +29,7 @@ class QuerySQLBuilder:
         self.join_clauses = []
         self.where_conditions_conj = []
         self.where_conditions_disj = []
+        self.params = dict()
         self.limit = None
         self.offset = None
         self.group_by = []
@@ -123,6 +138,27 @@ class QuerySQLBuilder:
                         self.where_conditions_conj.append(condition)
         return self
 
+    def __get_param_name(self, column: str) -> str:
+        name = re.sub(r"\W", "_", column)
+        if name in self.params:
+            name = f"{name}_{len(self.params)}"
+        return name
+
+    def add_sql_where_equal_parameters(self, conditions: dict = None):
+        if conditions:
+            for k, v in conditions.items():
+                if isinstance(v, list):
+                    values = [element for element in v if element is not None]
+                    if values:
+                        name = self.__get_param_name(k)
+                        self.params[name] = values
+                        self.where_conditions_disj.append(f"{k} IN :{name}")
+                elif v is not None:
+                    name = self.__get_param_name(k)
+                    self.params[name] = v
+                    self.where_conditions_conj.append(f"{k} = :{name}")
+        return self
+
     def add_sql_group_by_condition(self, columns: list):
         if columns:
             self.group_by = columns
@@ -263,6 +299,7 @@ class QuerySQLBuilder:
         self.values = []
         self.where_conditions_conj = []
         self.where_conditions_disj = []
+        self.params = dict()
         self.order_by = None
         self.group_by = []
         self.limit = None
@@ -273,3 +310,11 @@ class QuerySQLBuilder:
         query = self.query
         self.__clear()
         return query
+
+    def get_statement(self) -> TextClause:
+        params = self.params
+        expanding_params = tuple(
+            name for name, value in params.items() if isinstance(value, list)
+        )
+        statement = get_statement_template(self.get_query(), expanding_params)
+        return statement.bindparams(**params) if params else statement
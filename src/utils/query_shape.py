@@ -0,0 +1,89 @@
+from query_builder import QuerySQLBuilder
+
+
+class QueryShape:
+    """
+    Immutable SELECT skeleton: table, joins, selected columns, group and order by.
+    Every method returns a new shape, so shapes built once can be shared and
+    extended safely, and only the where conditions are bound per request.
+    """
+
+    __slots__ = (
+        "table_name",
+        "select_conditions",
+        "join_clauses",
+        "group_by",
+        "order_by",
+    )
+
+    def __init__(
+        self,
+        table_name: str,
+        select_conditions: tuple = (),
+        join_clauses: tuple = (),
+        group_by: tuple = (),
+        order_by: str = "",
+    ) -> None:
+        object.__setattr__(self, "table_name", table_name)
+        object.__setattr__(self, "select_conditions", tuple(select_conditions))
+        object.__setattr__(self, "join_clauses", tuple(join_clauses))
+        object.__setattr__(self, "group_by", tuple(group_by))
+        object.__setattr__(self, "order_by", order_by)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("QueryShape is immutable")
+
+    def __replace(self, **changes) -> "QueryShape":
+        values = {
+            "table_name": self.table_name,
+            "select_conditions": self.select_conditions,
+            "join_clauses": self.join_clauses,
+            "group_by": self.group_by,
+            "order_by": self.order_by,
+        }
+        values.update(changes)
+        return QueryShape(**values)
+
+    def select(self, columns: list) -> "QueryShape":
+        return self.__replace(select_conditions=columns)
+
+    def join(
+        self,
+        table_name: str,
+        from_value: str,
+        to_value: str,
+        join_type: QuerySQLBuilder.JoinType = QuerySQLBuilder.JoinType.JOIN,
+    ) -> "QueryShape":
+        join_clause = (
+            f"{join_type.value} JOIN {table_name} ON {from_value} = {to_value}"
+        )
+        return self.__replace(join_clauses=self.join_clauses + (join_clause,))
+
+    def group(self, columns: list) -> "QueryShape":
+        return self.__replace(group_by=columns)
+
+    def order(self, attributes: list, order: QuerySQLBuilder.Order) -> "QueryShape":
+        return self.__replace(order_by=f"ORDER BY {','.join(attributes)} {order.name}")
+
+    def build(self, where_conditions: dict = None) -> str:
+        where_query = (
+            QuerySQLBuilder()
+            .add_sql_where_equal_condition(where_conditions)
+            .get_where_query()
+        )
+        group_by = f"GROUP BY {', '.join(self.group_by)}" if self.group_by else ""
+
+        return """
+            SELECT {select_conditions} FROM {table_name}
+            {join_clauses}
+            {where_conditions}
+            {group_by_condition}
+            {order_by_condition}
+        """.format(
+            select_conditions=",".join(self.select_conditions or ("*",)),
+            table_name=self.table_name,
+            join_clauses=" ".join(self.join_clauses),
+            where_conditions=where_query,
+            group_by_condition=group_by,
+            order_by_condition=self.order_by,
+        )
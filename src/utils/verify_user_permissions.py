@@ -1,9 +1,31 @@
 import os
+import time
 import boto3
 from response_user import ResponseUser
 from base_exception import AuthError
 
 cognito = None
+IDENTITY_CACHE_TTL = int(os.environ.get("IDENTITY_CACHE_TTL", 60))
+identities = dict()
+
+
+def get_cached_identity(user_id: str) -> dict:
+    identity = identities.get(user_id)
+    if not identity or time.time() > identity["expires_at"]:
+        identity = {"expires_at": time.time() + IDENTITY_CACHE_TTL}
+        identities[user_id] = identity
+    return identity
+
+
+def add_identity_from_authorizer(user_id: str, authorizer: dict) -> None:
+    email = authorizer.get("email")
+    groups = authorizer.get("groups")
+    if user_id and email and groups is not None:
+        identities[user_id] = {
+            "expires_at": time.time() + IDENTITY_CACHE_TTL,
+            "email": email,
+            "roles": get_roles_from_groups(groups.split(",") if groups else []),
+        }
 
 
 def get_user_id_from_event(event: dict):
@@ -11,7 +33,9 @@ def get_user_id_from_event(event: dict):
 
     if context and context.get("authorizer"):
         authorizer = context.get("authorizer")
-        return authorizer.get("principalId")
+        user_id = authorizer.get("principalId")
+        add_identity_from_authorizer(user_id, authorizer)
+        return user_id
 
     raise AuthError("No user found")
 
@@ -24,7 +48,7 @@ def get_email_from_user(user: dict) -> dict:
     )
 
 
-def get_username_from_user_id(user_id) -> str:
+def get_email_from_cognito(user_id: str) -> str:
     cognito = get_cognito_client()
     user_pool_id = os.environ.get("USER_POOL_ID")
     user = cognito.admin_get_user(UserPoolId=user_pool_id, Username=user_id)
@@ -32,6 +56,34 @@ def get_username_from_user_id(user_id) -> str:
     return email.get("Value")
 
 
+def get_roles_from_cognito(user_id: str) -> list:
+    cognito = get_cognito_client()
+    user_pool_id = os.environ.get("USER_POOL_ID")
+    return get_roles(user_id, user_pool_id, cognito)
+
+
+def load_identity(user_id: str, attributes: list) -> dict:
+    loaders = {"email": get_email_from_cognito, "roles": get_roles_from_cognito}
+    identity = get_cached_identity(user_id)
+    for attribute in attributes:
+        if attribute not in identity:
+            identity[attribute] = loaders[attribute](user_id)
+    return identity
+
+
+def get_user_identity(user_id: str) -> dict:
+    identity = load_identity(user_id, ["email", "roles"])
+    return {
+        "username": user_id,
+        "email": identity["email"],
+        "roles": identity["roles"],
+    }
+
+
+def get_username_from_user_id(user_id) -> str:
+    return load_identity(user_id, ["email"])["email"]
+
+
 def get_cognito_client():
     global cognito
     if not cognito:
@@ -44,6 +96,13 @@ def get_cognito_client():
     return cognito
 
 
+def get_roles_from_groups(groups: list) -> list:
+    response_user = ResponseUser()
+    return response_user.process_user_roles(
+        {"Groups": [{"GroupName": group} for group in groups]}
+    )
+
+
 def get_roles(user_id: str, user_pool_id: str, client) -> list:
     response_user = ResponseUser()
     groups = client.admin_list_groups_for_user(
@@ -54,10 +113,7 @@ def get_roles(user_id: str, user_pool_id: str, client) -> list:
 
 def verify_user_access(user_id: str) -> bool:
     if user_id:
-        cognito = get_cognito_client()
-        user_pool_id = os.environ.get("USER_POOL_ID")
-
-        roles = get_roles(user_id, user_pool_id, cognito)
+        roles = load_identity(user_id, ["roles"])["roles"]
 
         if isinstance(roles, list):
             return "admin" in roles